@@ -1,4 +1,4 @@
-from patterns import CircuitBreaker, Retry, Throttle, Debounce, Timeout
+from patterns import CircuitBreaker, CircuitBreakerRegistry, Retry, Throttle, Debounce, Timeout
 from utils.http_client import make_request
 
 # Example usage of all patterns
@@ -20,6 +20,23 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"Failed: {e}")
 
+    # Circuit Breaker per upstream host
+    print("\n=== Circuit Breaker Registry ===")
+    registry = CircuitBreakerRegistry(
+        func=make_request,
+        exceptions=(Exception,),
+        threshold=3,
+        delay=5
+    )
+
+    for path in ("/random", "/success", "/failure"):
+        try:
+            result = registry.make_remote_call(f"{base_url}{path}")
+            print(f"{path}: {result}")
+        except Exception as e:
+            print(f"{path} failed: {e}")
+    print(f"Breakers: {registry.states()}")
+
     # Retry example
     print("\n=== Retry ===")
     retry = Retry(
@@ -1,27 +1,77 @@
-from .circuit_breaker import CircuitBreaker, RemoteCallFailedException
-from .retry import Retry, RetryExhausted
-from .throttle import Throttle, ThrottledException
-from .timeout import Timeout, TimeoutException
+from .circuit_breaker import CircuitBreaker, AsyncCircuitBreaker, RemoteCallFailedException
+from .circuit_breaker_registry import CircuitBreakerRegistry
+from .retry import Retry, AsyncRetry, RetryBudget, RetryExhausted
+from .throttle import Throttle, AsyncThrottle, ThrottledException
+from .rate_limiters import (
+    SlidingLogLimiter,
+    TokenBucketLimiter,
+    GCRALimiter,
+    SlidingWindowCounterLimiter,
+    SharedGCRALimiter,
+)
+from .keyed_throttle import KeyedThrottle
+from .timeout import Timeout, AsyncTimeout, TimeoutException, timeout_decorator
 from .debounce import Debounce
+from .single_flight import SingleFlight
+from .bulkhead import Bulkhead, AsyncBulkhead, BulkheadFullException
+from .adaptive_limiter import AdaptiveLimiter, AsyncAdaptiveLimiter, AIMDLimit, GradientLimit, LimitExceededException
+from .load_shedder import LoadShedder, LoadShedException
+from .hedge import Hedge, AsyncHedge, LatencyTracker
 
 # Concurrency patterns
-from .concurrency_templates.fan_in import FanIn
+from .concurrency_templates.fan_in import FanIn, AsyncFanIn, QuorumNotReached
 from .concurrency_templates.fan_out import FanOut
+from .concurrency_templates.chunking import CountChunker, ByteSizeChunker, AdaptiveChunker
 from .concurrency_templates.future import FutureResult
 from .concurrency_templates.sharding import Sharding
+from .concurrency_templates.worker_pool import WorkerPool, PoolFullException
 
 __all__ = [
     'CircuitBreaker',
+    'AsyncCircuitBreaker',
     'RemoteCallFailedException',
+    'CircuitBreakerRegistry',
     'Retry',
+    'AsyncRetry',
+    'RetryBudget',
     'RetryExhausted',
     'Throttle',
+    'AsyncThrottle',
     'ThrottledException',
+    'SlidingLogLimiter',
+    'TokenBucketLimiter',
+    'GCRALimiter',
+    'SlidingWindowCounterLimiter',
+    'SharedGCRALimiter',
+    'KeyedThrottle',
     'Timeout',
+    'AsyncTimeout',
     'TimeoutException',
+    'timeout_decorator',
     'Debounce',
+    'SingleFlight',
+    'Bulkhead',
+    'AsyncBulkhead',
+    'BulkheadFullException',
+    'AdaptiveLimiter',
+    'AsyncAdaptiveLimiter',
+    'AIMDLimit',
+    'GradientLimit',
+    'LimitExceededException',
+    'LoadShedder',
+    'LoadShedException',
+    'Hedge',
+    'AsyncHedge',
+    'LatencyTracker',
     'FanIn',
+    'AsyncFanIn',
+    'QuorumNotReached',
     'FanOut',
+    'CountChunker',
+    'ByteSizeChunker',
+    'AdaptiveChunker',
     'FutureResult',
     'Sharding',
+    'WorkerPool',
+    'PoolFullException',
 ]
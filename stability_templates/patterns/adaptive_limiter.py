@@ -0,0 +1,183 @@
+import logging
+import math
+import time
+from threading import Lock
+
+logger = logging.getLogger(__name__)
+
+
+class LimitExceededException(Exception):
+    """Виключення, коли кількість одночасних викликів досягла поточного адаптивного ліміту"""
+    def __init__(self, message="", limit=None):
+        super().__init__(message)
+        self.limit = limit
+
+
+class AIMDLimit:
+    """
+    AIMD (як у TCP) - ліміт росте на 1, поки виклики успішні і швидші за latency_threshold,
+    і множиться на backoff_ratio після помилки або повільної відповіді
+    """
+    def __init__(self, initial_limit=10, min_limit=1, max_limit=200, backoff_ratio=0.9, latency_threshold=None):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_threshold = latency_threshold #None - only errors reduce the limit
+
+    def update(self, rtt, in_flight, dropped):
+        """Оновлює ліміт за результатом одного виклику і повертає його"""
+        if dropped or (self.latency_threshold is not None and rtt > self.latency_threshold):
+            self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+        elif in_flight * 2 >= self.limit:
+            # ліміт росте лише тоді, коли його справді використовують
+            self.limit = min(self.max_limit, self.limit + 1)
+        return self.limit
+
+
+class GradientLimit:
+    """
+    Gradient - порівнює затримку виклику з мінімальною (без навантаження):
+    якщо затримка росте (upstream почав ставити запити в чергу), ліміт зменшується
+    пропорційно до min_rtt / rtt; інакше росте на sqrt(limit).
+    Мінімум скидається кожні min_rtt_window вимірів, щоб помітити зміну базової затримки
+    """
+    def __init__(self, initial_limit=10, min_limit=1, max_limit=200, tolerance=1.5,
+                 smoothing=0.2, min_rtt_window=1000):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance #how much the latency may grow before the limit is reduced
+        self.smoothing = smoothing
+        self.min_rtt_window = min_rtt_window
+        self.min_rtt = None
+        self._samples = 0
+
+    def update(self, rtt, in_flight, dropped):
+        """Оновлює ліміт за результатом одного виклику і повертає його"""
+        rtt = max(rtt, 1e-9)
+        self._samples += 1
+        if self.min_rtt is None or rtt < self.min_rtt or self._samples >= self.min_rtt_window:
+            self.min_rtt = rtt
+            self._samples = 0
+
+        if not dropped and in_flight * 2 < self.limit:
+            return self.limit
+
+        if dropped:
+            gradient = 0.5
+        else:
+            gradient = max(0.5, min(1.0, self.tolerance * self.min_rtt / rtt))
+        new_limit = self.limit * gradient + math.sqrt(self.limit)
+        new_limit = self.limit * (1 - self.smoothing) + new_limit * self.smoothing
+        self.limit = max(self.min_limit, min(self.max_limit, new_limit))
+        return self.limit
+
+
+LIMIT_ALGORITHMS = {
+    'aimd': AIMDLimit,
+    'gradient': GradientLimit,
+}
+
+
+def create_limit(algorithm, **kwargs):
+    """Створює алгоритм адаптивного ліміту за назвою"""
+    try:
+        limit_cls = LIMIT_ALGORITHMS[algorithm]
+    except KeyError:
+        raise ValueError(
+            f"Unknown limit algorithm: {algorithm!r}. Available: {', '.join(LIMIT_ALGORITHMS)}"
+        ) from None
+    return limit_cls(**kwargs)
+
+
+class AdaptiveLimiter:
+    """
+    Adaptive concurrency limiter - обмежує кількість одночасних викликів лімітом,
+    який підлаштовується під виміряну затримку (round-trip time) і помилки upstream.
+    algorithm: 'gradient', 'aimd' або готовий об'єкт з методом update(rtt, in_flight, dropped)
+    exceptions: помилки, що вважаються ознакою перевантаження
+    """
+    def __init__(self, func, algorithm='gradient', exceptions=(Exception,), **limit_kwargs):
+        self.func = func
+        self.exceptions = exceptions
+        if isinstance(algorithm, str):
+            self.algorithm = create_limit(algorithm, **limit_kwargs)
+        else:
+            self.algorithm = algorithm
+        self._lock = Lock()
+        self._in_flight = 0
+        self.accepted_count = 0
+        self.rejected_count = 0
+        self.dropped_count = 0
+
+    @property
+    def limit(self):
+        """Поточна дозволена кількість одночасних викликів"""
+        return max(1, int(self.algorithm.limit))
+
+    def acquire(self):
+        """Займає слот і повертає кількість викликів у польоті, або кидає LimitExceededException"""
+        with self._lock:
+            limit = self.limit
+            if self._in_flight >= limit:
+                self.rejected_count += 1
+                raise LimitExceededException(
+                    f"Concurrency limit reached: {self._in_flight}/{limit} calls in flight", limit=limit
+                )
+            self._in_flight += 1
+            self.accepted_count += 1
+            return self._in_flight
+
+    def release(self, started, in_flight, dropped):
+        """Звільняє слот і передає алгоритму виміряну затримку"""
+        rtt = time.monotonic() - started
+        with self._lock:
+            self._in_flight -= 1
+            if dropped:
+                self.dropped_count += 1
+            previous = self.limit
+            self.algorithm.update(rtt, in_flight, dropped)
+        if self.limit != previous:
+            logger.debug(f"Concurrency limit {previous} -> {self.limit} (rtt {rtt * 1000:.1f} ms)")
+
+    def call(self, *args, **kwargs):
+        """Виконує функцію, якщо поточний ліміт дозволяє ще один одночасний виклик"""
+        in_flight = self.acquire()
+        started = time.monotonic()
+        dropped = False
+        try:
+            return self.func(*args, **kwargs)
+        except self.exceptions:
+            dropped = True
+            raise
+        finally:
+            self.release(started, in_flight, dropped)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "limit": self.limit,
+                "in_flight": self._in_flight,
+                "accepted": self.accepted_count,
+                "rejected": self.rejected_count,
+                "dropped": self.dropped_count,
+            }
+
+
+class AsyncAdaptiveLimiter(AdaptiveLimiter):
+    """
+    Асинхронний AdaptiveLimiter - той самий ліміт для корутин
+    """
+    async def call(self, *args, **kwargs):
+        """Виконує корутину, якщо поточний ліміт дозволяє ще один одночасний виклик"""
+        in_flight = self.acquire()
+        started = time.monotonic()
+        dropped = False
+        try:
+            return await self.func(*args, **kwargs)
+        except self.exceptions:
+            dropped = True
+            raise
+        finally:
+            self.release(started, in_flight, dropped)
@@ -0,0 +1,151 @@
+import asyncio
+import logging
+from threading import Lock, Condition
+
+logger = logging.getLogger(__name__)
+
+
+class BulkheadFullException(Exception):
+    """Виключення, коли всі слоти bulkhead зайняті і черга заповнена (або вийшов queue_timeout)"""
+    pass
+
+
+class Bulkhead:
+    """
+    Bulkhead pattern - обмежує кількість одночасних викликів однієї залежності:
+    max_concurrent викликів виконуються, ще max_queued чекають не довше queue_timeout,
+    решта відхиляються одразу, тож повільна залежність не забирає всі потоки.
+    Використовується через call() або як контекстний менеджер
+    """
+    def __init__(self, func=None, max_concurrent=10, max_queued=0, queue_timeout=None, name="bulkhead"):
+        self.func = func
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout #None - wait in the queue without a limit
+        self.name = name
+        self._cond = Condition(Lock())
+        self._active = 0
+        self._waiting = 0
+        self.accepted_count = 0
+        self.rejected_count = 0 #rejected at once: all slots and the queue are busy
+        self.timed_out_count = 0 #rejected after queue_timeout
+
+    def _reject(self):
+        # must be called with self._cond held
+        self.rejected_count += 1
+        logger.warning(f"{self.name}: rejected, {self._active} active and {self._waiting} queued calls")
+        raise BulkheadFullException(
+            f"{self.name} is full: {self.max_concurrent} concurrent, {self.max_queued} queued calls"
+        )
+
+    def acquire(self):
+        """Займає слот, чекає в черзі або кидає BulkheadFullException"""
+        with self._cond:
+            # новий виклик не обганяє тих, хто вже чекає в черзі
+            if self._active < self.max_concurrent and not self._waiting:
+                self._active += 1
+                self.accepted_count += 1
+                return
+            if self._waiting >= self.max_queued:
+                self._reject()
+
+            self._waiting += 1
+            try:
+                acquired = self._cond.wait_for(
+                    lambda: self._active < self.max_concurrent, timeout=self.queue_timeout
+                )
+            finally:
+                self._waiting -= 1
+            if not acquired:
+                self.timed_out_count += 1
+                raise BulkheadFullException(f"{self.name}: no free slot within {self.queue_timeout}s")
+            self._active += 1
+            self.accepted_count += 1
+
+    def release(self):
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+    def call(self, *args, **kwargs):
+        """Виконує функцію в межах ліміту одночасних викликів"""
+        self.acquire()
+        try:
+            return self.func(*args, **kwargs)
+        finally:
+            self.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    def stats(self):
+        with self._cond:
+            return {
+                "active": self._active,
+                "queued": self._waiting,
+                "accepted": self.accepted_count,
+                "rejected": self.rejected_count,
+                "timed_out": self.timed_out_count,
+            }
+
+
+class AsyncBulkhead(Bulkhead):
+    """
+    Асинхронний Bulkhead - обмежує кількість одночасних корутин через asyncio.Semaphore
+    """
+    def __init__(self, func=None, max_concurrent=10, max_queued=0, queue_timeout=None, name="bulkhead"):
+        super().__init__(func, max_concurrent, max_queued, queue_timeout, name)
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def acquire(self):
+        """Займає слот, чекає в черзі або кидає BulkheadFullException"""
+        with self._cond:
+            free = not self._semaphore.locked() and not self._waiting
+            if not free:
+                if self._waiting >= self.max_queued:
+                    self._reject()
+                self._waiting += 1
+
+        if free:
+            await self._semaphore.acquire()
+        else:
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+            except asyncio.TimeoutError:
+                with self._cond:
+                    self.timed_out_count += 1
+                raise BulkheadFullException(f"{self.name}: no free slot within {self.queue_timeout}s") from None
+            finally:
+                with self._cond:
+                    self._waiting -= 1
+
+        with self._cond:
+            self._active += 1
+            self.accepted_count += 1
+
+    def release(self):
+        with self._cond:
+            self._active -= 1
+        self._semaphore.release()
+
+    async def call(self, *args, **kwargs):
+        """Виконує корутину в межах ліміту одночасних викликів"""
+        await self.acquire()
+        try:
+            return await self.func(*args, **kwargs)
+        finally:
+            self.release()
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with AsyncBulkhead")
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.release()
@@ -1,6 +1,10 @@
+import inspect
 import logging
 import time
-from datetime import datetime, timezone
+from collections import OrderedDict
+from threading import Lock
+
+from .single_flight import default_key
 
 #standart logging settings
 logging.basicConfig(
@@ -19,90 +23,253 @@ class StateChoices:
 class RemoteCallFailedException(Exception):
     pass
 
+_MISSING = object()
+
 
 class CircuitBreaker:
-    def __init__(self, func, exceptions, threshold, delay):
+    def __init__(self, func, exceptions, threshold, delay,
+                 window_size=None, failure_rate_threshold=1.0, half_open_max_calls=1,
+                 fallback=None, cache_size=0, cache_key=default_key):
         self.func = func
         self.exceptions_to_catch = exceptions
-        self.threshold = threshold #number of failed attempts before opening the circuit
+        self.threshold = threshold #minimal number of calls in the window before the circuit may open
         self.delay = delay
+        # outcomes of the last `window_size` calls are kept in a ring buffer (1 - failure, 0 - success);
+        # by default window_size == threshold and failure_rate_threshold == 1.0,
+        # which means "open after `threshold` consecutive failures"
+        self.window_size = window_size or threshold
+        self.failure_rate_threshold = failure_rate_threshold
+        self.half_open_max_calls = half_open_max_calls #number of trial calls allowed in HALF_OPEN state
         self.state = StateChoices.CLOSED
         self.last_attempt_timestamp = None
-        self._failed_attempt_count = 0
+        self._failed_attempt_count = 0 #number of failures inside the window
+        self._window = bytearray(self.window_size)
+        self._window_pos = 0
+        self._window_calls = 0
+        self._half_open_calls = 0
+        # guards state transitions and the window; it is held only for O(1) bookkeeping,
+        # never while the remote call is running
+        self._lock = Lock()
+        # rejected calls (OPEN / busy HALF_OPEN) are answered with the last good result
+        # for the same arguments, or with fallback(*args, **kwargs) if there is none
+        self.fallback = fallback
+        self.cache_size = cache_size #number of last good results kept, 0 - disabled
+        self.cache_key = cache_key
+        self._last_good = OrderedDict()
+        self._cache_lock = Lock()
+        self.stale_served_count = 0
+        self.fallback_count = 0
 
     #additional helper methods
     def update_last_attempt_timestamp(self):
-        self.last_attempt_timestamp = datetime.now(timezone.utc).timestamp()
+        self.last_attempt_timestamp = time.time()
 
     def set_state(self, state):
         prev_state = self.state
         self.state = state
         logging.info(f"Changed state from {prev_state} to {self.state}")
 
-    #main methods
-    #default state handling
-    def handle_closed_state(self, *args, **kwargs):
-        allowed_exceptions = self.exceptions_to_catch
-        try: #if function call is successful
-            ret_val = self.func(*args, **kwargs)
-            logging.info("Success: Remote call")
-            self.update_last_attempt_timestamp()
-            self._failed_attempt_count = 0 # reset the failed attempt count
-            return ret_val
-        except allowed_exceptions as e:
-            # remote call has failed
-            logging.info("Failure: Remote call")
-            # increment the failed attempt count
-            self._failed_attempt_count += 1
-
-            # update last_attempt_timestamp
-            self.update_last_attempt_timestamp()
+    def get_failure_rate(self):
+        """Failure rate over the current window (0.0 if there were no calls)"""
+        if not self._window_calls:
+            return 0.0
+        return self._failed_attempt_count / self._window_calls
 
-            # if the failed attempt count is more than the threshold
-            # then change the state to OPEN
-            if self._failed_attempt_count >= self.threshold:
-                self.set_state(StateChoices.OPEN)
-            # re-raise the exception
-            raise RemoteCallFailedException from e
+    def _reset_window(self):
+        # must be called with self._lock held
+        self._window = bytearray(self.window_size)
+        self._window_pos = 0
+        self._window_calls = 0
+        self._failed_attempt_count = 0
+
+    def _record_outcome(self, failed):
+        # must be called with self._lock held
+        pos = self._window_pos
+        self._failed_attempt_count += failed - self._window[pos]
+        self._window[pos] = failed
+        self._window_pos = (pos + 1) % self.window_size
+        if self._window_calls < self.window_size:
+            self._window_calls += 1
 
-    def handle_open_state(self, *args, **kwargs):
-        current_timestamp = datetime.now(timezone.utc).timestamp()
+    def _should_open(self):
+        # must be called with self._lock held
+        if self._window_calls < min(self.threshold, self.window_size):
+            return False
+        return self._failed_attempt_count >= self.failure_rate_threshold * self._window_calls
+
+    def _take_trial_permit(self):
+        # must be called with self._lock held
+        if self._half_open_calls >= self.half_open_max_calls:
+            raise RemoteCallFailedException("Circuit is half open: trial call is already in progress")
+        self._half_open_calls += 1
+        return True
+
+    #main methods
+    def handle_open_state(self):
+        current_timestamp = time.time()
         # if `delay` seconds have not elapsed since the last attempt, raise an exception
         if self.last_attempt_timestamp + self.delay >= current_timestamp:
             raise RemoteCallFailedException(f"Retry after {self.last_attempt_timestamp+self.delay-current_timestamp} secs")
 
-        # after `delay` seconds have elapsed since the last attempt, try making the remote call
-        # update the state to half open state
-        self.set_state(StateChoices.HALF_OPEN)
-        allowed_exceptions = self.exceptions_to_catch
-        try:
-            ret_val = self.func(*args, **kwargs)
-            # the remote call was successful
-            # now reset the state to Closed
-            self.set_state(StateChoices.CLOSED)
-            # reset the failed attempt counter
-            self._failed_attempt_count = 0
-            # update the last_attempt_timestamp
-            self.update_last_attempt_timestamp()
-            # return the remote call's response
-            return ret_val
-        except allowed_exceptions as e:
-            # the remote call failed again
-            # increment the failed attempt count
-            self._failed_attempt_count += 1
-
-            # update last_attempt_timestamp
+        # after `delay` seconds have elapsed only one thread moves the circuit to HALF_OPEN
+        with self._lock:
+            if self.state == StateChoices.CLOSED:
+                return False
+            if self.state == StateChoices.OPEN:
+                self.set_state(StateChoices.HALF_OPEN)
+                self._half_open_calls = 0
+            return self._take_trial_permit()
+
+    def handle_half_open_state(self):
+        with self._lock:
+            if self.state == StateChoices.CLOSED:
+                return False
+            if self.state == StateChoices.OPEN:
+                raise RemoteCallFailedException("Circuit is open")
+            return self._take_trial_permit()
+
+    def _acquire_permission(self):
+        """Returns True for a HALF_OPEN trial call, False for a regular call, raises if the call is rejected"""
+        state = self.state
+        # default state: calls are allowed without taking the lock
+        if state == StateChoices.CLOSED:
+            return False
+        if state == StateChoices.OPEN:
+            return self.handle_open_state()
+        return self.handle_half_open_state()
+
+    def _on_success(self, trial):
+        if trial:
+            with self._lock:
+                self._half_open_calls -= 1
+                self.update_last_attempt_timestamp()
+                if self.state == StateChoices.HALF_OPEN:
+                    # the trial call was successful, reset the window and close the circuit
+                    self._reset_window()
+                    self.set_state(StateChoices.CLOSED)
+            return
+
+        # fast path: a success in a window full of successes changes nothing
+        if self._failed_attempt_count == 0 and self._window_calls == self.window_size:
+            return
+
+        with self._lock:
+            if self.state == StateChoices.CLOSED:
+                self._record_outcome(0)
+
+    def _on_failure(self, trial):
+        with self._lock:
+            if trial:
+                self._half_open_calls -= 1
+                self.update_last_attempt_timestamp()
+                if self.state == StateChoices.HALF_OPEN:
+                    # the trial call failed again
+                    self.set_state(StateChoices.OPEN)
+                return
+
+            # late results of calls started before the circuit opened are ignored
+            # and do not extend the OPEN delay
+            if self.state != StateChoices.CLOSED:
+                return
             self.update_last_attempt_timestamp()
+            self._record_outcome(1)
+            if self._should_open():
+                self.set_state(StateChoices.OPEN)
 
-            # set the state to "OPEN"
-            self.set_state(StateChoices.OPEN)
+    def _release_trial(self, trial):
+        if trial:
+            with self._lock:
+                self._half_open_calls -= 1
 
-            # raise the error
-            raise RemoteCallFailedException from e
+    def _result_key(self, args, kwargs):
+        key = self.cache_key(*args, **kwargs)
+        try:
+            hash(key)
+        except TypeError:
+            return None #unhashable arguments are not cached
+        return key
+
+    def _remember(self, args, kwargs, value):
+        if not self.cache_size:
+            return
+        key = self._result_key(args, kwargs)
+        if key is None:
+            return
+        with self._cache_lock:
+            self._last_good[key] = value
+            self._last_good.move_to_end(key)
+            if len(self._last_good) > self.cache_size:
+                self._last_good.popitem(last=False)
+
+    def _degraded_result(self, args, kwargs):
+        """Last good result or fallback for a rejected call, _MISSING if there is neither"""
+        if self.cache_size:
+            key = self._result_key(args, kwargs)
+            with self._cache_lock:
+                value = self._last_good.get(key, _MISSING) if key is not None else _MISSING
+                if value is not _MISSING:
+                    self.stale_served_count += 1
+            if value is not _MISSING:
+                logging.debug("Rejected: serving last good result")
+                return value
+
+        if self.fallback is not None:
+            self.fallback_count += 1
+            logging.debug("Rejected: serving fallback")
+            return self.fallback(*args, **kwargs)
+        return _MISSING
 
     #dispatcher method
     def make_remote_call(self, *args, **kwargs):
-        if self.state == StateChoices.CLOSED:
-            return self.handle_closed_state(*args, **kwargs)
-        if self.state == StateChoices.OPEN:
-            return self.handle_open_state(*args, **kwargs)
\ No newline at end of file
+        try:
+            trial = self._acquire_permission()
+        except RemoteCallFailedException:
+            value = self._degraded_result(args, kwargs)
+            if value is _MISSING:
+                raise
+            return value
+        try:
+            ret_val = self.func(*args, **kwargs)
+        except self.exceptions_to_catch as e:
+            logging.debug("Failure: Remote call")
+            self._on_failure(trial)
+            raise RemoteCallFailedException from e
+        except BaseException:
+            # exception is not tracked by the breaker, just give the trial permit back
+            self._release_trial(trial)
+            raise
+        logging.debug("Success: Remote call")
+        self._on_success(trial)
+        self._remember(args, kwargs, ret_val)
+        return ret_val
+
+
+class AsyncCircuitBreaker(CircuitBreaker):
+    """Circuit breaker for coroutine functions: same states, window and exceptions as CircuitBreaker"""
+
+    #dispatcher method
+    async def make_remote_call(self, *args, **kwargs):
+        try:
+            trial = self._acquire_permission()
+        except RemoteCallFailedException:
+            value = self._degraded_result(args, kwargs)
+            if value is _MISSING:
+                raise
+            # fallback may be a coroutine function
+            if inspect.isawaitable(value):
+                value = await value
+            return value
+        try:
+            ret_val = await self.func(*args, **kwargs)
+        except self.exceptions_to_catch as e:
+            logging.debug("Failure: Remote call")
+            self._on_failure(trial)
+            raise RemoteCallFailedException from e
+        except BaseException:
+            # includes asyncio.CancelledError
+            self._release_trial(trial)
+            raise
+        logging.debug("Success: Remote call")
+        self._on_success(trial)
+        self._remember(args, kwargs, ret_val)
+        return ret_val
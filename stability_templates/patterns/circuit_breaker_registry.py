@@ -0,0 +1,92 @@
+import logging
+import time
+from threading import Lock
+from urllib.parse import urlsplit
+
+from .circuit_breaker import CircuitBreaker, StateChoices
+
+logger = logging.getLogger(__name__)
+
+
+def host_key(url, *args, **kwargs):
+    """Ключ breaker-а за замовчуванням: scheme://host[:port] першого аргументу (URL)"""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class CircuitBreakerRegistry:
+    """
+    Реєстр circuit breaker-ів: окремий breaker на кожен ключ (host, endpoint, ...),
+    що створюється при першому виклику. Пошук breaker-а не бере lock,
+    простоюючі breaker-и у стані CLOSED видаляються
+    """
+    def __init__(self, func, exceptions, threshold, delay, key_func=host_key,
+                 idle_timeout=300.0, max_breakers=10_000, breaker_cls=CircuitBreaker, **breaker_kwargs):
+        self.func = func
+        self.exceptions = exceptions
+        self.threshold = threshold
+        self.delay = delay
+        self.key_func = key_func
+        self.idle_timeout = idle_timeout
+        self.max_breakers = max_breakers
+        self.breaker_cls = breaker_cls
+        self.breaker_kwargs = breaker_kwargs
+        self._breakers = {}
+        self._last_used = {}
+        self._last_sweep = time.monotonic()
+        # береже лише створення і видалення breaker-ів
+        self._lock = Lock()
+
+    def get(self, key):
+        """Повертає breaker для ключа, створюючи його при потребі"""
+        now = time.monotonic()
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(key)
+                if breaker is None:
+                    breaker = self.breaker_cls(
+                        func=self.func,
+                        exceptions=self.exceptions,
+                        threshold=self.threshold,
+                        delay=self.delay,
+                        **self.breaker_kwargs
+                    )
+                    self._breakers[key] = breaker
+                    logger.info(f"Created circuit breaker for {key}")
+                    if len(self._breakers) > self.max_breakers or now - self._last_sweep >= self.idle_timeout:
+                        self._evict_idle(now)
+        self._last_used[key] = now
+        return breaker
+
+    def make_remote_call(self, *args, **kwargs):
+        """Викликає функцію через breaker ключа key_func(*args, **kwargs)"""
+        return self.get(self.key_func(*args, **kwargs)).make_remote_call(*args, **kwargs)
+
+    def _evict_idle(self, now):
+        # must be called with self._lock held
+        self._last_sweep = now
+        for key in [key for key in list(self._last_used) if key not in self._breakers]:
+            self._last_used.pop(key, None)
+
+        idle = sorted(
+            (last_used, key) for key, last_used in list(self._last_used.items())
+            if self._breakers.get(key) is not None
+            and self._breakers[key].state == StateChoices.CLOSED
+        )
+        overflow = len(self._breakers) - self.max_breakers
+        for last_used, key in idle:
+            # breaker-и, що не у стані CLOSED, лишаються - вони захищають від збійного upstream
+            if now - last_used < self.idle_timeout and overflow <= 0:
+                break
+            del self._breakers[key]
+            self._last_used.pop(key, None)
+            overflow -= 1
+            logger.info(f"Evicted idle circuit breaker for {key}")
+
+    def states(self):
+        """Поточний стан breaker-а для кожного ключа"""
+        return {key: breaker.state for key, breaker in list(self._breakers.items())}
+
+    def __len__(self):
+        return len(self._breakers)
@@ -1,6 +1,8 @@
-from .fan_in import FanIn
+from .fan_in import FanIn, AsyncFanIn, QuorumNotReached
 from .fan_out import FanOut
+from .chunking import CountChunker, ByteSizeChunker, AdaptiveChunker, create_chunker
 from .future import FutureResult
 from .sharding import Sharding
+from .worker_pool import WorkerPool, PoolFullException, get_shared_pool, get_fan_pool
 
-__all__ = ['FanIn', 'FanOut', 'FutureResult', 'Sharding']
\ No newline at end of file
+__all__ = ['FanIn', 'AsyncFanIn', 'QuorumNotReached', 'FanOut', 'CountChunker', 'ByteSizeChunker', 'AdaptiveChunker', 'create_chunker', 'FutureResult', 'Sharding', 'WorkerPool', 'PoolFullException', 'get_shared_pool', 'get_fan_pool']
\ No newline at end of file
@@ -0,0 +1,123 @@
+import math
+from threading import Lock
+
+
+class CountChunker:
+    """
+    Розбиття за кількістю: chunk_size елементів у частині або рівно chunks частин
+    """
+    def __init__(self, chunk_size=None, chunks=None):
+        if (chunk_size is None) == (chunks is None):
+            raise ValueError("Pass exactly one of chunk_size or chunks")
+        self.chunk_size = chunk_size
+        self.chunks = chunks
+
+    def ranges(self, data):
+        """Генератор (start, end) частин data"""
+        total = len(data)
+        size = self.chunk_size or max(1, math.ceil(total / self.chunks))
+        for start in range(0, total, size):
+            yield start, min(start + size, total)
+
+    def record(self, items, seconds):
+        """Статичне розбиття не враховує швидкість обробки"""
+        pass
+
+
+class ByteSizeChunker:
+    """
+    Розбиття за розміром: не більше max_bytes у частині. Для bytes / масивів рахуються байти
+    буфера, для послідовностей - size_func кожного елемента (за замовчуванням len)
+    """
+    def __init__(self, max_bytes, size_func=len):
+        self.max_bytes = max_bytes
+        self.size_func = size_func
+
+    def ranges(self, data):
+        """Генератор (start, end) частин data"""
+        total = len(data)
+        if not total:
+            return
+        try:
+            item_bytes = max(1, memoryview(data).nbytes // total)
+        except TypeError:
+            item_bytes = None
+
+        if item_bytes is not None:
+            step = max(1, self.max_bytes // item_bytes)
+            for start in range(0, total, step):
+                yield start, min(start + step, total)
+            return
+
+        start = 0
+        accumulated = 0
+        for idx, item in enumerate(data):
+            size = self.size_func(item)
+            if accumulated and accumulated + size > self.max_bytes:
+                yield start, idx
+                start = idx
+                accumulated = 0
+            accumulated += size
+        yield start, total
+
+    def record(self, items, seconds):
+        """Статичне розбиття не враховує швидкість обробки"""
+        pass
+
+
+class AdaptiveChunker:
+    """
+    Адаптивне розбиття: розмір частини підбирається так, щоб її обробка займала
+    близько target_seconds, за EWMA виміряного часу на один елемент
+    """
+    def __init__(self, target_seconds=0.05, initial_size=100, min_size=1, max_size=100_000, alpha=0.3):
+        self.target_seconds = target_seconds
+        self.chunk_size = initial_size
+        self.min_size = min_size
+        self.max_size = max_size
+        self.alpha = alpha
+        self.seconds_per_item = None
+        self._lock = Lock()
+
+    def ranges(self, data):
+        """Генератор (start, end); розмір кожної наступної частини - поточний chunk_size"""
+        total = len(data)
+        start = 0
+        while start < total:
+            end = min(total, start + self.chunk_size)
+            yield start, end
+            start = end
+
+    def record(self, items, seconds):
+        """Оновлює оцінку часу на елемент після обробки частини з items елементів"""
+        if not items:
+            return
+        per_item = seconds / items
+        with self._lock:
+            if self.seconds_per_item is None:
+                self.seconds_per_item = per_item
+            else:
+                self.seconds_per_item += (per_item - self.seconds_per_item) * self.alpha
+            if self.seconds_per_item > 0:
+                size = round(self.target_seconds / self.seconds_per_item)
+            else:
+                size = self.max_size
+            self.chunk_size = max(self.min_size, min(self.max_size, size))
+
+
+CHUNKERS = {
+    'count': CountChunker,
+    'bytes': ByteSizeChunker,
+    'adaptive': AdaptiveChunker,
+}
+
+
+def create_chunker(strategy, **kwargs):
+    """Створює стратегію розбиття за назвою"""
+    try:
+        chunker_cls = CHUNKERS[strategy]
+    except KeyError:
+        raise ValueError(
+            f"Unknown chunking strategy: {strategy!r}. Available: {', '.join(CHUNKERS)}"
+        ) from None
+    return chunker_cls(**kwargs)
@@ -1,43 +1,214 @@
+import asyncio
 import logging
-from threading import Thread
-from queue import Queue
+import time
+from queue import Queue, Empty
+
+from .worker_pool import get_fan_pool
 
 logger = logging.getLogger(__name__)
 
 
+class QuorumNotReached(Exception):
+    """Виключення, коли потрібна кількість джерел не відповіла успішно (або не погодилась)"""
+    def __init__(self, message="", results=None):
+        super().__init__(message)
+        self.results = results or [] #(source_id, result, error) received before giving up
+
+
 class FanIn:
     """
     Fan-In pattern - об'єднує результати з декількох джерел в одне
     Мультиплексор: багато входів → один вихід
+    Джерела виконуються в executor (WorkerPool або concurrent.futures.Executor),
+    за замовчуванням - у пулі get_fan_pool(), окремому від пулу Timeout / Hedge
     """
-    def __init__(self, sources):
+    def __init__(self, sources, executor=None):
         self.sources = sources
-        self.result_queue = Queue()
+        self.executor = executor or get_fan_pool()
 
-    def collect(self, *args, **kwargs):
-        """Збирає результати з усіх джерел"""
-        threads = []
+    def stream(self, *args, deadline=None, **kwargs):
+        """
+        Генератор (source_id, result, error) у порядку завершення джерел.
+        deadline - загальний час (с); джерела, що не встигли, повертаються з TimeoutException
+        """
+        # imported here: the timeout module itself imports the worker pool from this package
+        from ..timeout import TimeoutException
+
+        # окремий канал на кожен виклик - паралельні виклики не змішують результати
+        result_queue = Queue()
+        deadline_at = None if deadline is None else time.monotonic() + deadline
 
         def worker(source, source_id):
             try:
                 result = source(*args, **kwargs)
-                self.result_queue.put((source_id, result, None))
+                result_queue.put((source_id, result, None))
                 logger.info(f"Source {source_id} completed successfully")
             except Exception as e:
-                self.result_queue.put((source_id, None, e))
+                result_queue.put((source_id, None, e))
                 logger.error(f"Source {source_id} failed: {e}")
 
+        futures = []
         for idx, source in enumerate(self.sources):
-            thread = Thread(target=worker, args=(source, idx))
-            thread.start()
-            threads.append(thread)
+            try:
+                futures.append(self.executor.submit(worker, source, idx))
+            except Exception as e:
+                # черга пулу заповнена (PoolFullException) - джерело повертається з помилкою
+                logger.error(f"Source {idx} was not submitted: {e}")
+                result_queue.put((idx, None, e))
 
-        for thread in threads:
-            thread.join()
+        pending = set(range(len(self.sources)))
+        try:
+            while pending:
+                timeout = None if deadline_at is None else max(0.0, deadline_at - time.monotonic())
+                try:
+                    item = result_queue.get(timeout=timeout)
+                except Empty:
+                    break
+                pending.discard(item[0])
+                yield item
 
-        results = []
-        while not self.result_queue.empty():
-            results.append(self.result_queue.get())
+            for source_id in sorted(pending):
+                logger.warning(f"Source {source_id} timed out after {deadline}s")
+                yield source_id, None, TimeoutException(f"Source {source_id} timed out after {deadline}s")
+        finally:
+            # джерела, що ще чекають у черзі пулу, вже не потрібні
+            for future in futures:
+                future.cancel()
 
+    def collect(self, *args, **kwargs):
+        """Збирає результати з усіх джерел"""
+        results = list(self.stream(*args, **kwargs))
         logger.info(f"Fan-In collected {len(results)} results from {len(self.sources)} sources")
-        return results
\ No newline at end of file
+        return results
+
+    def first_k(self, k, *args, deadline=None, **kwargs):
+        """
+        Повертає перші k успішних (source_id, result, None), не чекаючи решту джерел;
+        QuorumNotReached - якщо k успішних відповідей вже неможливо отримати
+        """
+        if not 0 < k <= len(self.sources):
+            raise ValueError(f"k must be between 1 and {len(self.sources)}, got {k}")
+
+        successes, failures = [], []
+        stream = self.stream(*args, deadline=deadline, **kwargs)
+        try:
+            for item in stream:
+                if item[2] is None:
+                    successes.append(item)
+                    if len(successes) == k:
+                        return successes
+                else:
+                    failures.append(item)
+                    # решти джерел вже не вистачить
+                    if len(self.sources) - len(failures) < k:
+                        break
+        finally:
+            # джерела, що ще працюють, завершаться у пулі, їх результат ігнорується
+            stream.close()
+
+        raise QuorumNotReached(
+            f"Only {len(successes)} of {k} required sources succeeded", results=successes + failures
+        )
+
+    def first_success(self, *args, deadline=None, **kwargs):
+        """Результат першого успішного джерела (наприклад, найшвидшої репліки)"""
+        return self.first_k(1, *args, deadline=deadline, **kwargs)[0][1]
+
+    def majority(self, *args, deadline=None, key=None, **kwargs):
+        """
+        Значення, яке повернула більшість джерел (> N/2); key - функція порівняння результатів
+        (наприклад, версія запису). Повертає, щойно більшість погодилась
+        """
+        needed = len(self.sources) // 2 + 1
+        votes = [] #[vote key, first result with this key, count]
+        received = []
+        stream = self.stream(*args, deadline=deadline, **kwargs)
+        try:
+            for item in stream:
+                received.append(item)
+                if item[2] is None:
+                    vote = item[1] if key is None else key(item[1])
+                    for entry in votes:
+                        if entry[0] == vote:
+                            entry[2] += 1
+                            break
+                    else:
+                        entry = [vote, item[1], 1]
+                        votes.append(entry)
+                    if entry[2] >= needed:
+                        return entry[1]
+
+                best = max((entry[2] for entry in votes), default=0)
+                if best + len(self.sources) - len(received) < needed:
+                    break
+        finally:
+            stream.close()
+
+        raise QuorumNotReached(f"No value was returned by {needed} of {len(self.sources)} sources", results=received)
+
+
+class AsyncFanIn:
+    """
+    Асинхронний Fan-In - збирає результати корутин-джерел в одному event loop
+    max_concurrency обмежує кількість одночасних викликів (None - без обмеження)
+    """
+    def __init__(self, sources, max_concurrency=None):
+        self.sources = sources
+        self.max_concurrency = max_concurrency
+
+    async def _call_source(self, source, source_id, semaphore, args, kwargs):
+        try:
+            if semaphore is None:
+                result = await source(*args, **kwargs)
+            else:
+                async with semaphore:
+                    result = await source(*args, **kwargs)
+            logger.info(f"Source {source_id} completed successfully")
+            return source_id, result, None
+        except Exception as e:
+            logger.error(f"Source {source_id} failed: {e}")
+            return source_id, None, e
+
+    def _semaphore(self):
+        return asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+
+    async def stream(self, *args, deadline=None, **kwargs):
+        """
+        Асинхронний генератор (source_id, result, error) у порядку завершення джерел.
+        deadline - загальний час (с); джерела, що не встигли, скасовуються і повертаються з TimeoutException
+        """
+        from ..timeout import TimeoutException
+
+        semaphore = self._semaphore()
+        loop = asyncio.get_running_loop()
+        deadline_at = None if deadline is None else loop.time() + deadline
+        tasks = {
+            asyncio.ensure_future(self._call_source(source, idx, semaphore, args, kwargs)): idx
+            for idx, source in enumerate(self.sources)
+        }
+        pending = set(tasks)
+        try:
+            while pending:
+                timeout = None if deadline_at is None else max(0.0, deadline_at - loop.time())
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    break
+                for task in done:
+                    yield task.result()
+
+            for source_id in sorted(tasks[task] for task in pending):
+                logger.warning(f"Source {source_id} timed out after {deadline}s")
+                yield source_id, None, TimeoutException(f"Source {source_id} timed out after {deadline}s")
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def collect(self, *args, **kwargs):
+        """Збирає результати з усіх джерел"""
+        semaphore = self._semaphore()
+        results = await asyncio.gather(
+            *(self._call_source(source, idx, semaphore, args, kwargs) for idx, source in enumerate(self.sources))
+        )
+
+        logger.info(f"Async Fan-In collected {len(results)} results from {len(self.sources)} sources")
+        return list(results)
@@ -1,43 +1,237 @@
 import logging
-from threading import Thread
-from queue import Queue
+import pickle
+import time
+from concurrent.futures import as_completed, wait, FIRST_COMPLETED, ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from .chunking import CountChunker
+from .worker_pool import get_fan_pool
 
 logger = logging.getLogger(__name__)
 
 
+def _buffer_layout(view):
+    """(format, shape) буфера, якщо типізований view можна відновити з байтів через cast, інакше None"""
+    layout = (view.format, tuple(view.shape))
+    try:
+        view.cast("B").cast(*layout).release()
+    except (TypeError, ValueError):
+        # формат, який memoryview.cast не підтримує (наприклад, структурний dtype)
+        return None
+    return layout
+
+
+def share_payload(data):
+    """
+    Кладе data у shared memory один раз: об'єкти з buffer protocol (bytes, bytearray,
+    memoryview, array.array, numpy-масиви) копіюються як є, решта - pickle один раз.
+    Повертає (SharedMemory, розмір, pickled, layout); layout - (format, shape) для
+    відновлення типізованого view у процесі пулу
+    """
+    layout = None
+    try:
+        view = memoryview(data)
+        if view.c_contiguous:
+            layout = _buffer_layout(view)
+    except TypeError:
+        pass
+
+    pickled = layout is None
+    if pickled:
+        view = memoryview(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+    view = view.cast("B")
+
+    shm = shared_memory.SharedMemory(create=True, size=max(1, view.nbytes))
+    shm.buf[:view.nbytes] = view
+    return shm, view.nbytes, pickled, layout
+
+
+def run_on_shared_payload(handler, shm_name, end, pickled, start=0, layout=None):
+    """
+    Виконується у процесі пулу: під'єднується до shared memory і передає обробнику
+    memoryview на байти [start:end] без копіювання, з format і shape з layout
+    (або розпакований об'єкт, якщо payload був pickled)
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    view = shm.buf[start:end]
+    data = None
+    try:
+        if pickled:
+            data = pickle.loads(view)
+        elif layout is not None:
+            data = view.cast(*layout)
+        else:
+            data = view
+        return handler(data)
+    finally:
+        try:
+            if isinstance(data, memoryview) and data is not view:
+                data.release()
+            view.release()
+            shm.close()
+        except BufferError:
+            # обробник зберіг посилання на буфер (наприклад, numpy.frombuffer) - його звільнить GC
+            pass
+
+
+def timed_call(func, *args):
+    """Повертає (тривалість виклику, результат) - для адаптивного розбиття"""
+    started = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - started, result
+
+
+def _buffer_item_bytes(data):
+    """Байтів на елемент для неперервних буферів (bytes, масиви), None для решти даних"""
+    try:
+        view = memoryview(data)
+    except TypeError:
+        return None
+    if not view.c_contiguous or not len(data):
+        return None
+    return view.nbytes // len(data)
+
+
 class FanOut:
     """
     Fan-Out pattern - розподіляє одну задачу на декілька обробників
     Демультиплексор: один вхід → багато виходів
+    Обробники виконуються в executor (WorkerPool або concurrent.futures.Executor),
+    за замовчуванням - у пулі get_fan_pool(), окремому від пулу Timeout / Hedge.
+    З ProcessPoolExecutor data кладеться в shared memory один раз, а обробники
+    (функції рівня модуля) отримують memoryview на неї без копіювання - з тими самими
+    format і shape, що й data (array('d') лишається масивом double)
     """
-    def __init__(self, handlers):
+    def __init__(self, handlers, executor=None):
         self.handlers = handlers
-        self.result_queue = Queue()
+        self.executor = executor or get_fan_pool()
 
     def distribute(self, data):
         """Розподіляє дані між обробниками"""
-        threads = []
+        shm = None
+        if isinstance(self.executor, ProcessPoolExecutor):
+            shm, size, pickled, layout = share_payload(data)
 
-        def worker(handler, handler_id, data):
-            try:
-                result = handler(data)
-                self.result_queue.put((handler_id, result, None))
-                logger.info(f"Handler {handler_id} processed data successfully")
-            except Exception as e:
-                self.result_queue.put((handler_id, None, e))
-                logger.error(f"Handler {handler_id} failed: {e}")
+        try:
+            futures = {}
+            results = []
+            for idx, handler in enumerate(self.handlers):
+                try:
+                    if shm is None:
+                        future = self.executor.submit(handler, data)
+                    else:
+                        future = self.executor.submit(
+                            run_on_shared_payload, handler, shm.name, size, pickled, layout=layout
+                        )
+                    futures[future] = idx
+                except Exception as e:
+                    # черга пулу заповнена (PoolFullException) - обробник повертається з помилкою
+                    results.append((idx, None, e))
+                    logger.error(f"Handler {idx} was not submitted: {e}")
 
-        for idx, handler in enumerate(self.handlers):
-            thread = Thread(target=worker, args=(handler, idx, data))
-            thread.start()
-            threads.append(thread)
+            for future in as_completed(futures):
+                handler_id = futures[future]
+                error = future.exception()
+                if error is None:
+                    results.append((handler_id, future.result(), None))
+                    logger.info(f"Handler {handler_id} processed data successfully")
+                else:
+                    results.append((handler_id, None, error))
+                    logger.error(f"Handler {handler_id} failed: {error}")
+        finally:
+            if shm is not None:
+                # результати вже отримані - обробники більше не тримають payload
+                shm.close()
+                shm.unlink()
 
-        for thread in threads:
-            thread.join()
+        logger.info(f"Fan-Out distributed to {len(self.handlers)} handlers")
+        return results
 
-        results = []
-        while not self.result_queue.empty():
-            results.append(self.result_queue.get())
+    def scatter(self, data, chunker=None, max_in_flight=None):
+        """
+        Scatter/gather: розбиває послідовність або масив data на частини (chunker),
+        обробляє їх паралельно (частина i - обробником handlers[i % len(handlers)])
+        і віддає (chunk_id, result, error) строго по порядку частин, щойно готовий наступний.
+        max_in_flight обмежує кількість частин, що одночасно в роботі.
+        Частини буферів (bytes, bytearray, array.array) обробник отримує як memoryview без
+        копіювання - і в потоках, і в процесах; для методів bytes (decode, split) - bytes(chunk).
+        Буфери, які не передати через shared memory (array('u')), у процеси йдуть як data[start:end]
+        """
+        chunker = chunker or CountChunker(chunks=len(self.handlers))
+        max_in_flight = max_in_flight or 2 * len(self.handlers)
 
-        logger.info(f"Fan-Out distributed to {len(self.handlers)} handlers")
-        return results
\ No newline at end of file
+        shm = None
+        processes = isinstance(self.executor, ProcessPoolExecutor)
+        item_bytes = _buffer_item_bytes(data)
+        layout = None if item_bytes is None else _buffer_layout(memoryview(data))
+        if processes and layout is not None:
+            # один payload у shared memory, кожен процес отримує типізований view на свою частину
+            shm, _, _, layout = share_payload(data)
+
+        ranges = chunker.ranges(data)
+        in_flight = {} #future -> (chunk_id, number of items)
+        ready = {}
+        next_chunk = 0
+        next_to_yield = 0
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(in_flight) < max_in_flight:
+                    chunk_range = next(ranges, None)
+                    if chunk_range is None:
+                        exhausted = True
+                        break
+                    start, end = chunk_range
+                    handler = self.handlers[next_chunk % len(self.handlers)]
+                    try:
+                        if shm is not None:
+                            fmt, shape = layout
+                            future = self.executor.submit(
+                                timed_call, run_on_shared_payload, handler, shm.name,
+                                end * item_bytes, False, start * item_bytes, (fmt, (end - start,) + shape[1:])
+                            )
+                        elif not processes and item_bytes is not None and not hasattr(data, "shape"):
+                            # memoryview не серіалізується pickle - лише для потоків
+                            future = self.executor.submit(timed_call, handler, memoryview(data)[start:end])
+                        else:
+                            future = self.executor.submit(timed_call, handler, data[start:end])
+                        in_flight[future] = (next_chunk, end - start)
+                    except Exception as e:
+                        ready[next_chunk] = (next_chunk, None, e)
+                        logger.error(f"Chunk {next_chunk} was not submitted: {e}")
+                    next_chunk += 1
+
+                # потоковий merge: віддаємо готовий префікс частин по порядку
+                while next_to_yield in ready:
+                    yield ready.pop(next_to_yield)
+                    next_to_yield += 1
+
+                if not in_flight:
+                    if exhausted:
+                        break
+                    continue
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk_id, items = in_flight.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        seconds, result = future.result()
+                        chunker.record(items, seconds)
+                        ready[chunk_id] = (chunk_id, result, None)
+                    else:
+                        ready[chunk_id] = (chunk_id, None, error)
+                        logger.error(f"Chunk {chunk_id} failed: {error}")
+        finally:
+            for future in in_flight:
+                future.cancel()
+            if shm is not None:
+                # процеси, що ще обробляють частини, тримають власне відображення пам'яті
+                shm.close()
+                shm.unlink()
+
+        logger.info(f"Fan-Out scattered {next_chunk} chunks to {len(self.handlers)} handlers")
+
+    def gather(self, data, chunker=None, max_in_flight=None):
+        """Scatter/gather: список (chunk_id, result, error) по порядку частин"""
+        return list(self.scatter(data, chunker=chunker, max_in_flight=max_in_flight))
@@ -0,0 +1,189 @@
+import logging
+from concurrent.futures import Future
+from threading import Thread, Lock, local
+from queue import Queue, Full
+
+logger = logging.getLogger(__name__)
+
+
+class PoolFullException(Exception):
+    """Виключення, коли черга пулу заповнена"""
+    pass
+
+
+class WorkerPool:
+    """
+    Worker Pool - обмежений пул daemon-потоків, що перевикористовуються між викликами.
+    Потоки створюються ліниво до max_workers; задачі, результат яких більше не потрібен
+    (timeout), позначаються як abandoned і рахуються до свого завершення.
+    max_queue обмежує чергу (0 - без обмеження); submit_timeout - скільки submit чекає
+    на місце в повній черзі (0 - одразу PoolFullException, None - без обмеження).
+    Задача, яку подає потік цього ж пулу, коли вільних потоків немає і новий створити
+    не можна, виконується одразу в потоці, що її подав: інакше вкладені виклики
+    (FanIn у джерелі FanIn) чекали б у черзі за потоками, які чекають на них
+    """
+    def __init__(self, max_workers=32, max_queue=0, max_abandoned=None, name="worker-pool", submit_timeout=0):
+        self.max_workers = max_workers
+        self.max_abandoned = max(1, max_workers // 2) if max_abandoned is None else max_abandoned
+        self.name = name
+        self.submit_timeout = submit_timeout
+        self._queue = Queue(maxsize=max_queue)
+        self._threads = []
+        self._idle_workers = 0
+        self._pending = 0 #submitted tasks not yet taken by a worker
+        self._lock = Lock()
+        self._shutdown = False
+        self.submitted_count = 0
+        self.caller_runs_count = 0
+        self.completed_count = 0
+        self.abandoned_count = 0
+        self.abandoned_in_flight = 0
+        self.leaked_completed_count = 0
+
+    def submit(self, func, *args, **kwargs):
+        """Ставить задачу в чергу і повертає concurrent.futures.Future"""
+        if self._shutdown:
+            raise RuntimeError(f"{self.name} is shut down")
+
+        future = Future()
+        if getattr(_current_worker, "pool", None) is self and self._saturated():
+            with self._lock:
+                self.caller_runs_count += 1
+            future.set_running_or_notify_cancel()
+            self._run(future, func, args, kwargs)
+            return future
+
+        with self._lock:
+            self._pending += 1
+        try:
+            if self.submit_timeout == 0:
+                self._queue.put_nowait((future, func, args, kwargs))
+            else:
+                # backpressure: the caller waits until a worker takes a task from the queue
+                self._queue.put((future, func, args, kwargs), timeout=self.submit_timeout)
+        except Full:
+            with self._lock:
+                self._pending -= 1
+            raise PoolFullException(f"{self.name} queue is full ({self._queue.maxsize} tasks)")
+
+        with self._lock:
+            self.submitted_count += 1
+            # new worker only if the pending tasks outnumber the idle workers; both counters
+            # drop together when a worker takes a task, unlike qsize() which drops earlier
+            if self._pending > self._idle_workers and len(self._threads) < self.max_workers:
+                thread = Thread(target=self._worker, name=f"{self.name}-{len(self._threads)}", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+        return future
+
+    def _saturated(self):
+        """Чи чекатиме нова задача в черзі: немає вільних потоків і досягнуто max_workers"""
+        with self._lock:
+            return self._pending >= self._idle_workers and len(self._threads) >= self.max_workers
+
+    @staticmethod
+    def _run(future, func, args, kwargs):
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    def _worker(self):
+        _current_worker.pool = self
+        while True:
+            with self._lock:
+                self._idle_workers += 1
+            item = self._queue.get()
+            with self._lock:
+                self._idle_workers -= 1
+                if item is not None:
+                    self._pending -= 1
+
+            if item is None:
+                return
+
+            future, func, args, kwargs = item
+            # задача могла бути скасована, поки чекала в черзі
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            self._run(future, func, args, kwargs)
+
+            with self._lock:
+                self.completed_count += 1
+
+    def abandon(self, future):
+        """Позначає задачу, результат якої більше нікому не потрібен"""
+        # задача ще в черзі - просто не виконуємо її
+        if future.cancel():
+            return
+
+        with self._lock:
+            self.abandoned_count += 1
+            self.abandoned_in_flight += 1
+        future.add_done_callback(self._on_abandoned_done)
+
+    def _on_abandoned_done(self, future):
+        with self._lock:
+            self.abandoned_in_flight -= 1
+            self.leaked_completed_count += 1
+        logger.info(f"{self.name}: abandoned task finished")
+
+    def stats(self):
+        """Метрики пулу"""
+        with self._lock:
+            return {
+                "workers": len(self._threads),
+                "idle_workers": self._idle_workers,
+                "queued": self._queue.qsize(),
+                "submitted": self.submitted_count,
+                "caller_runs": self.caller_runs_count,
+                "completed": self.completed_count,
+                "abandoned": self.abandoned_count,
+                "abandoned_in_flight": self.abandoned_in_flight,
+                "leaked_completed": self.leaked_completed_count,
+            }
+
+    def shutdown(self, wait=True):
+        """Зупиняє потоки після виконання задач, що вже в черзі"""
+        self._shutdown = True
+        with self._lock:
+            threads = list(self._threads)
+        for _ in threads:
+            self._queue.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+
+#the pool whose worker is running in the current thread
+_current_worker = local()
+
+_shared_pool = None
+_fan_pool = None
+_shared_pool_lock = Lock()
+
+
+def get_shared_pool():
+    """Спільний для всього процесу пул (створюється при першому зверненні)"""
+    global _shared_pool
+    if _shared_pool is None:
+        with _shared_pool_lock:
+            if _shared_pool is None:
+                _shared_pool = WorkerPool(max_workers=64, name="shared-pool")
+    return _shared_pool
+
+
+def get_fan_pool():
+    """
+    Пул FanIn / FanOut за замовчуванням. Окремий від get_shared_pool: джерела FanIn
+    часто самі чекають на задачі Timeout / Hedge у спільному пулі і зайняли б усі його потоки
+    """
+    global _fan_pool
+    if _fan_pool is None:
+        with _shared_pool_lock:
+            if _fan_pool is None:
+                _fan_pool = WorkerPool(max_workers=64, name="fan-pool")
+    return _fan_pool
@@ -0,0 +1,205 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from concurrent.futures import wait, FIRST_COMPLETED
+from threading import Lock
+
+from .retry import RetryBudget
+from .concurrency_templates.worker_pool import get_shared_pool
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyTracker:
+    """
+    Затримки останніх window_size успішних викликів для оцінки перцентиля (наприклад, p95).
+    Перцентиль перераховується не частіше ніж раз на recompute_every нових вимірів
+    """
+    def __init__(self, window_size=1000, min_samples=20, recompute_every=50):
+        self.min_samples = min_samples
+        self.recompute_every = recompute_every
+        self._samples = deque(maxlen=window_size)
+        self._cache = {}
+        self._since_recompute = 0
+        self._lock = Lock()
+
+    def record(self, latency):
+        with self._lock:
+            self._samples.append(latency)
+            self._since_recompute += 1
+            if self._since_recompute >= self.recompute_every:
+                self._cache.clear()
+
+    def percentile(self, p):
+        """Значення перцентиля p (0..1) або None, поки вимірів менше min_samples"""
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            value = self._cache.get(p)
+            if value is None:
+                ordered = sorted(self._samples)
+                value = ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+                self._cache[p] = value
+                self._since_recompute = 0
+            return value
+
+    def __len__(self):
+        return len(self._samples)
+
+
+class Hedge:
+    """
+    Hedged requests - якщо відповідь не прийшла за hedge_after секунд (або за поточний
+    перцентиль затримки, якщо hedge_after=None), надсилає резервний запит і повертає
+    першу успішну відповідь. Частку резервних запитів обмежує budget
+    (за замовчуванням - не більше max_hedge_ratio від кількості викликів)
+    """
+    def __init__(self, func, hedge_after=None, percentile=0.95, max_hedges=1,
+                 max_hedge_ratio=0.1, budget=None, tracker=None, pool=None):
+        self.func = func
+        self.hedge_after = hedge_after
+        self.percentile = percentile
+        self.max_hedges = max_hedges
+        # кожен виклик поповнює бюджет на max_hedge_ratio токена, кожен резервний запит забирає токен
+        self.budget = budget or RetryBudget(ratio=max_hedge_ratio, min_retries_per_second=0, max_tokens=10)
+        self.tracker = tracker if tracker is not None else LatencyTracker()
+        self.pool = pool or get_shared_pool()
+        self._lock = Lock()
+        self.calls_count = 0
+        self.hedged_count = 0 #backup requests sent
+        self.hedge_wins = 0 #calls answered by a backup request
+        self.hedges_refused = 0 #backup requests not sent because of the budget
+
+    def hedge_delay(self):
+        """Поріг, після якого надсилається резервний запит; None - не хеджувати"""
+        if self.hedge_after is not None:
+            return self.hedge_after
+        return self.tracker.percentile(self.percentile)
+
+    def _start(self):
+        self.budget.record_call()
+        with self._lock:
+            self.calls_count += 1
+        return self.hedge_delay()
+
+    def _try_hedge(self, attempts):
+        """Вирішує, чи можна надіслати ще один резервний запит"""
+        if attempts > self.max_hedges:
+            return False
+        if not self.budget.try_withdraw():
+            with self._lock:
+                self.hedges_refused += 1
+            return False
+        with self._lock:
+            self.hedged_count += 1
+        logger.info(f"Sending backup request #{attempts}")
+        return True
+
+    def _on_win(self, attempt):
+        if attempt > 0:
+            with self._lock:
+                self.hedge_wins += 1
+
+    def _attempt(self, *args, **kwargs):
+        started = time.monotonic()
+        result = self.func(*args, **kwargs)
+        self.tracker.record(time.monotonic() - started)
+        return result
+
+    def call(self, *args, **kwargs):
+        """Виконує функцію з резервними запитами; повертає першу успішну відповідь"""
+        delay = self._start()
+        futures = {self.pool.submit(self._attempt, *args, **kwargs): 0}
+        pending = set(futures)
+        attempts = 1
+        hedging = delay is not None
+        last_error = None
+
+        while pending:
+            timeout = delay if hedging else None
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    # решта запитів більше не потрібні: ще не запущені скасовуються,
+                    # запущені завершаться у пулі, їх результат ігнорується
+                    for other in pending:
+                        other.cancel()
+                    self._on_win(futures[future])
+                    return future.result()
+                logger.warning(f"Attempt {futures[future]} failed: {error}")
+                last_error = error
+
+            if not done:
+                hedging = self._try_hedge(attempts)
+                if hedging:
+                    future = self.pool.submit(self._attempt, *args, **kwargs)
+                    futures[future] = attempts
+                    pending.add(future)
+                    attempts += 1
+
+        raise last_error
+
+    def stats(self):
+        with self._lock:
+            return {
+                "calls": self.calls_count,
+                "hedged": self.hedged_count,
+                "hedge_wins": self.hedge_wins,
+                "hedges_refused": self.hedges_refused,
+                "hedge_rate": self.hedged_count / self.calls_count if self.calls_count else 0.0,
+                "hedge_delay": self.hedge_delay(),
+            }
+
+
+class AsyncHedge(Hedge):
+    """
+    Асинхронний Hedge - запити є задачами asyncio, запити, що програли, скасовуються
+    """
+    def __init__(self, func, hedge_after=None, percentile=0.95, max_hedges=1,
+                 max_hedge_ratio=0.1, budget=None, tracker=None):
+        super().__init__(func, hedge_after, percentile, max_hedges, max_hedge_ratio, budget, tracker)
+
+    async def _attempt(self, *args, **kwargs):
+        started = time.monotonic()
+        result = await self.func(*args, **kwargs)
+        self.tracker.record(time.monotonic() - started)
+        return result
+
+    async def call(self, *args, **kwargs):
+        """Виконує корутину з резервними запитами; повертає першу успішну відповідь"""
+        delay = self._start()
+        tasks = {asyncio.ensure_future(self._attempt(*args, **kwargs)): 0}
+        pending = set(tasks)
+        attempts = 1
+        hedging = delay is not None
+        last_error = None
+
+        try:
+            while pending:
+                timeout = delay if hedging else None
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        self._on_win(tasks[task])
+                        return task.result()
+                    logger.warning(f"Attempt {tasks[task]} failed: {error}")
+                    last_error = error
+
+                if not done:
+                    hedging = self._try_hedge(attempts)
+                    if hedging:
+                        task = asyncio.ensure_future(self._attempt(*args, **kwargs))
+                        tasks[task] = attempts
+                        pending.add(task)
+                        attempts += 1
+        finally:
+            # запити, що програли (або весь виклик скасовано), скасовуються
+            for task in tasks:
+                task.cancel()
+
+        raise last_error
@@ -0,0 +1,103 @@
+import time
+import logging
+from collections import OrderedDict
+from threading import Lock
+
+from .rate_limiters import gcra_acquire, gcra_remaining
+from .throttle import ThrottledException
+
+logger = logging.getLogger(__name__)
+
+
+class KeyedThrottle:
+    """
+    Keyed Throttle - окремий ліміт calls_per_period / period для кожного ключа
+    (tenant, endpoint, ...). Стан ключа - одне число (GCRA TAT) у LRU-словнику,
+    ключі розбиті на shards з власними lock, щоб гарячі ключі не конкурували між собою
+    """
+    # скільки прострочених ключів максимум прибирається за один виклик
+    EXPIRED_SWEEP = 2
+
+    def __init__(self, func, calls_per_period, period=1.0, key_func=None,
+                 max_keys=100_000, shards=16):
+        self.func = func
+        self.calls_per_period = calls_per_period
+        self.period = period
+        self.interval = period / calls_per_period
+        self.key_func = key_func or (lambda *args, **kwargs: args[0])
+        self.num_shards = shards
+        self.max_keys_per_shard = max(1, max_keys // shards)
+        self._shards = [OrderedDict() for _ in range(shards)]
+        self._locks = [Lock() for _ in range(shards)]
+        self._evicted = [0] * shards
+
+    def call(self, *args, **kwargs):
+        """Виконує функцію з обмеженням частоти для ключа key_func(*args, **kwargs)"""
+        self.acquire(self.key_func(*args, **kwargs))
+        return self.func(*args, **kwargs)
+
+    def acquire(self, key):
+        """Займає слот для ключа або кидає ThrottledException"""
+        shard_id = hash(key) % self.num_shards
+        shard = self._shards[shard_id]
+        now = time.monotonic()
+
+        with self._locks[shard_id]:
+            tat, wait_time = gcra_acquire(shard.get(key), now, self.interval, self.period)
+            if not wait_time:
+                shard[key] = tat
+                shard.move_to_end(key)
+                self._evict(shard_id, now)
+
+        if wait_time:
+            logger.warning(f"Throttled key {key!r}. Wait {wait_time:.2f}s")
+            raise ThrottledException(
+                f"Rate limit exceeded for {key!r}: {self.calls_per_period} calls per {self.period}s. "
+                f"Retry after {wait_time:.2f}s",
+                retry_after=wait_time
+            )
+
+    def _evict(self, shard_id, now):
+        # ключ, чий TAT уже минув, нічим не відрізняється від нового - його можна видалити;
+        # при перевищенні ліміту пам'яті видаляємо найдавніше використаний ключ
+        shard = self._shards[shard_id]
+        swept = 0
+        while shard:
+            oldest_key = next(iter(shard))
+            over_capacity = len(shard) > self.max_keys_per_shard
+            expired = swept < self.EXPIRED_SWEEP and shard[oldest_key] <= now
+            if not (over_capacity or expired):
+                break
+            if not over_capacity:
+                swept += 1
+            del shard[oldest_key]
+            self._evicted[shard_id] += 1
+
+    @property
+    def evicted_count(self):
+        """Скільки ключів було видалено (прострочені або понад max_keys)"""
+        return sum(self._evicted)
+
+    def get_remaining_calls(self, key):
+        """Повертає кількість доступних викликів для ключа"""
+        shard_id = hash(key) % self.num_shards
+        with self._locks[shard_id]:
+            tat = self._shards[shard_id].get(key)
+        return gcra_remaining(tat, time.monotonic(), self.interval, self.period)
+
+    def reset(self, key=None):
+        """Скидає стан ключа або всіх ключів"""
+        if key is None:
+            for shard_id, shard in enumerate(self._shards):
+                with self._locks[shard_id]:
+                    shard.clear()
+            logger.info("Keyed throttle reset")
+            return
+
+        shard_id = hash(key) % self.num_shards
+        with self._locks[shard_id]:
+            self._shards[shard_id].pop(key, None)
+
+    def __len__(self):
+        """Кількість ключів, для яких зараз зберігається стан"""
+        return sum(len(shard) for shard in self._shards)
@@ -0,0 +1,176 @@
+import logging
+import time
+from collections import deque
+from threading import Lock, Event
+
+logger = logging.getLogger(__name__)
+
+#reasons why a call was shed
+OVERLOAD = "overload" # the queue is full and there is no lower-priority work to drop
+EVICTED = "evicted" # dropped from the queue to make room for higher-priority work
+DEADLINE = "deadline" # cannot finish before its deadline according to the service time estimate
+EXPIRED = "expired" # the deadline passed while the call was waiting in the queue
+
+
+class LoadShedException(Exception):
+    """Виключення, коли виклик відкинуто під перевантаженням"""
+    def __init__(self, message="", priority=None, reason=None):
+        super().__init__(message)
+        self.priority = priority
+        self.reason = reason
+
+
+class _Waiter:
+    __slots__ = ("priority", "deadline_at", "event", "admitted", "reason")
+
+    def __init__(self, priority, deadline_at):
+        self.priority = priority
+        self.deadline_at = deadline_at
+        self.event = Event()
+        self.admitted = False
+        self.reason = None
+
+
+class LoadShedder:
+    """
+    Load shedding - пріоритетна черга перед функцією: max_concurrent викликів виконуються,
+    ще max_queued чекають у черзі за пріоритетом (critical > default > batch).
+    Під перевантаженням першими відкидаються виклики з нижчим пріоритетом і ті, що вже
+    не встигнуть до свого deadline (за EWMA часу виконання)
+    """
+    PRIORITIES = ('critical', 'default', 'batch')
+
+    def __init__(self, func, max_concurrent=10, max_queued=100, priorities=PRIORITIES, alpha=0.2):
+        self.func = func
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.priorities = tuple(priorities) #from the highest to the lowest priority
+        self.alpha = alpha #EWMA smoothing factor for the service time
+        self._rank = {priority: rank for rank, priority in enumerate(self.priorities)}
+        self._queues = {priority: deque() for priority in self.priorities}
+        self._lock = Lock()
+        self._active = 0
+        self._queued = 0
+        self.service_time = None #EWMA of the call duration, seconds
+        self.admitted_counts = dict.fromkeys(self.priorities, 0)
+        self.shed_counts = dict.fromkeys(self.priorities, 0)
+
+    def _shed(self, priority, reason):
+        # must be called with self._lock held
+        self.shed_counts[priority] += 1
+        logger.warning(f"Shed {priority} call: {reason}")
+        return LoadShedException(f"Load shed ({reason}): {priority} call", priority=priority, reason=reason)
+
+    def _admit(self, priority):
+        # must be called with self._lock held
+        self.admitted_counts[priority] += 1
+
+    def _can_finish_in_time(self, rank, now, deadline_at):
+        # must be called with self._lock held
+        if deadline_at is None or self.service_time is None:
+            return True
+        # виклики з таким самим і вищим пріоритетом виконуються раніше
+        ahead = sum(len(self._queues[priority]) for priority in self.priorities[:rank + 1])
+        expected_wait = self.service_time * (ahead + 1) / self.max_concurrent
+        return now + expected_wait + self.service_time <= deadline_at
+
+    def _evict_lower_priority(self, rank):
+        """Звільняє місце в черзі, відкидаючи найновіший виклик з найнижчим пріоритетом"""
+        # must be called with self._lock held
+        for priority in reversed(self.priorities[rank + 1:]):
+            queue = self._queues[priority]
+            if queue:
+                waiter = queue.pop()
+                self._queued -= 1
+                self._shed(priority, EVICTED)
+                waiter.reason = EVICTED
+                waiter.event.set()
+                return True
+        return False
+
+    def acquire(self, priority='default', deadline=None):
+        """Займає слот, чекає в черзі за пріоритетом або кидає LoadShedException"""
+        rank = self._rank.get(priority)
+        if rank is None:
+            raise ValueError(f"Unknown priority: {priority!r}. Available: {', '.join(self.priorities)}")
+
+        now = time.monotonic()
+        deadline_at = None if deadline is None else now + deadline
+
+        with self._lock:
+            if deadline_at is not None and deadline_at <= now:
+                raise self._shed(priority, EXPIRED)
+            if self._active < self.max_concurrent and not self._queued:
+                self._active += 1
+                self._admit(priority)
+                return
+            if not self._can_finish_in_time(rank, now, deadline_at):
+                raise self._shed(priority, DEADLINE)
+            if self._queued >= self.max_queued and not self._evict_lower_priority(rank):
+                raise self._shed(priority, OVERLOAD)
+
+            waiter = _Waiter(priority, deadline_at)
+            self._queues[priority].append(waiter)
+            self._queued += 1
+
+        waiter.event.wait(None if deadline_at is None else deadline_at - now)
+
+        with self._lock:
+            if waiter.admitted:
+                return
+            if waiter.reason is None:
+                # deadline минув у черзі - виклик ще там, прибираємо його
+                self._queues[priority].remove(waiter)
+                self._queued -= 1
+                waiter.reason = EXPIRED
+                raise self._shed(priority, EXPIRED)
+        raise LoadShedException(f"Load shed ({waiter.reason}): {priority} call", priority=priority, reason=waiter.reason)
+
+    def release(self, service_time=None):
+        """Звільняє слот і передає його виклику з найвищим пріоритетом у черзі"""
+        now = time.monotonic()
+        with self._lock:
+            if service_time is not None:
+                if self.service_time is None:
+                    self.service_time = service_time
+                else:
+                    self.service_time += (service_time - self.service_time) * self.alpha
+
+            for priority in self.priorities:
+                queue = self._queues[priority]
+                while queue:
+                    waiter = queue.popleft()
+                    self._queued -= 1
+                    if waiter.deadline_at is not None and waiter.deadline_at <= now:
+                        self._shed(priority, EXPIRED)
+                        waiter.reason = EXPIRED
+                        waiter.event.set()
+                        continue
+                    # слот передається очікувачу без звільнення
+                    waiter.admitted = True
+                    self._admit(priority)
+                    waiter.event.set()
+                    return
+            self._active -= 1
+
+    def call(self, *args, priority='default', deadline=None, **kwargs):
+        """
+        Виконує функцію з пріоритетом priority; deadline - скільки секунд виклик
+        може чекати і виконуватись (None - без обмеження)
+        """
+        self.acquire(priority, deadline)
+        started = time.monotonic()
+        try:
+            return self.func(*args, **kwargs)
+        finally:
+            self.release(time.monotonic() - started)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "active": self._active,
+                "queued": self._queued,
+                "service_time": self.service_time,
+                "admitted": dict(self.admitted_counts),
+                "shed": dict(self.shed_counts),
+            }
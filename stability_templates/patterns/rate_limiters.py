@@ -0,0 +1,312 @@
+import math
+import mmap
+import os
+import struct
+import tempfile
+from collections import deque
+from threading import Lock
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# допуск на похибку float при порівнянні часу
+_EPSILON = 1e-9
+
+
+class SlidingLogLimiter:
+    """
+    Ковзний журнал - точний ліміт, зберігає час кожного виклику у вікні.
+    Час амортизовано O(1), пам'ять O(calls_per_period)
+    """
+    def __init__(self, calls_per_period, period):
+        self.calls_per_period = calls_per_period
+        self.period = period
+        self.call_times = deque()
+
+    def _evict(self, now):
+        call_times = self.call_times
+        while call_times and now - call_times[0] >= self.period:
+            call_times.popleft()
+
+    def try_acquire(self, now):
+        """Займає слот і повертає 0.0, або повертає час очікування до вільного слота"""
+        self._evict(now)
+        if len(self.call_times) >= self.calls_per_period:
+            return self.period - (now - self.call_times[0])
+        self.call_times.append(now)
+        return 0.0
+
+    def remaining(self, now):
+        """Кількість доступних викликів"""
+        self._evict(now)
+        return self.calls_per_period - len(self.call_times)
+
+    def reset(self):
+        self.call_times.clear()
+
+
+class TokenBucketLimiter:
+    """
+    Token bucket - відро на calls_per_period токенів, що поповнюється
+    зі швидкістю calls_per_period / period. Дозволяє сплески до розміру відра.
+    Час і пам'ять O(1)
+    """
+    def __init__(self, calls_per_period, period):
+        self.capacity = calls_per_period
+        self.rate = calls_per_period / period
+        self.tokens = float(calls_per_period)
+        self.updated_at = None
+
+    def _refill(self, now):
+        if self.updated_at is None:
+            self.updated_at = now
+        elif now > self.updated_at:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+    def try_acquire(self, now):
+        """Займає токен і повертає 0.0, або повертає час до появи токена"""
+        self._refill(now)
+        if self.tokens >= 1 - _EPSILON:
+            self.tokens = max(0.0, self.tokens - 1)
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def remaining(self, now):
+        """Кількість доступних викликів"""
+        self._refill(now)
+        return int(self.tokens + _EPSILON)
+
+    def reset(self):
+        self.tokens = float(self.capacity)
+        self.updated_at = None
+
+
+def gcra_acquire(tat, now, interval, period):
+    """
+    Один крок GCRA: повертає (новий TAT, 0.0) якщо виклик дозволено,
+    або (старий TAT, час очікування) якщо ні. tat=None означає новий стан
+    """
+    current = tat if tat is not None and tat > now else now
+    new_tat = current + interval
+    allow_at = new_tat - period
+    if allow_at - now > _EPSILON:
+        return tat, allow_at - now
+    return new_tat, 0.0
+
+
+def gcra_remaining(tat, now, interval, period):
+    """Кількість доступних викликів для стану GCRA"""
+    current = tat if tat is not None and tat > now else now
+    return int((period - (current - now)) / interval + _EPSILON)
+
+
+class GCRALimiter:
+    """
+    GCRA (generic cell rate algorithm) - зберігає лише теоретичний час
+    наступного виклику (TAT). Еквівалент token bucket з одним числом стану.
+    Час і пам'ять O(1)
+    """
+    def __init__(self, calls_per_period, period):
+        self.calls_per_period = calls_per_period
+        self.period = period
+        self.interval = period / calls_per_period
+        self.tat = None
+
+    def try_acquire(self, now):
+        """Займає слот і повертає 0.0, або повертає час очікування до вільного слота"""
+        tat, wait_time = gcra_acquire(self.tat, now, self.interval, self.period)
+        if not wait_time:
+            self.tat = tat
+        return wait_time
+
+    def remaining(self, now):
+        """Кількість доступних викликів"""
+        return gcra_remaining(self.tat, now, self.interval, self.period)
+
+    def reset(self):
+        self.tat = None
+
+
+class SlidingWindowCounterLimiter:
+    """
+    Ковзне вікно на лічильниках - зважує лічильник попереднього фіксованого вікна
+    за часткою, що ще перекривається з ковзним. Час і пам'ять O(1)
+    """
+    def __init__(self, calls_per_period, period):
+        self.calls_per_period = calls_per_period
+        self.period = period
+        self.window_start = None
+        self.prev_count = 0
+        self.curr_count = 0
+
+    def _advance(self, now):
+        if self.window_start is None:
+            self.window_start = now
+            return
+        elapsed = now - self.window_start
+        if elapsed >= self.period:
+            windows = math.floor(elapsed / self.period)
+            self.prev_count = self.curr_count if windows == 1 else 0
+            self.curr_count = 0
+            self.window_start += windows * self.period
+
+    def _estimate(self, now):
+        weight = 1 - (now - self.window_start) / self.period
+        return self.prev_count * weight + self.curr_count
+
+    def _wait_time(self, now):
+        elapsed = now - self.window_start
+        limit = self.calls_per_period
+        if self.curr_count + 1 <= limit:
+            # чекаємо, поки вага попереднього вікна впаде достатньо
+            return max(0.0, self.period * (1 - (limit - self.curr_count - 1) / self.prev_count) - elapsed)
+        # поточне вікно заповнене - чекаємо наступного, де воно стане попереднім
+        return (self.period - elapsed) + max(0.0, self.period * (1 - (limit - 1) / self.curr_count))
+
+    def try_acquire(self, now):
+        """Займає слот і повертає 0.0, або повертає час очікування до вільного слота"""
+        self._advance(now)
+        if self._estimate(now) + 1 <= self.calls_per_period + _EPSILON:
+            self.curr_count += 1
+            return 0.0
+        return self._wait_time(now)
+
+    def remaining(self, now):
+        """Кількість доступних викликів"""
+        self._advance(now)
+        return max(0, int(self.calls_per_period - self._estimate(now) + _EPSILON))
+
+    def reset(self):
+        self.window_start = None
+        self.prev_count = 0
+        self.curr_count = 0
+
+
+class SharedGCRALimiter(GCRALimiter):
+    """
+    GCRA, стан якого (одне число TAT) лежить у mmap-файлі: усі процеси хоста,
+    що відкрили лімітер з тим самим name, ділять один ліміт.
+    Атомарність оновлення забезпечує fcntl.flock, тому потрібна POSIX-система.
+    flock діє на відкритий файл, а не на процес, тому кожен процес (зокрема після fork)
+    відкриває файл заново, а потоки одного процесу додатково серіалізуються Lock
+    """
+    _TAT = struct.Struct("d")
+
+    def __init__(self, name, calls_per_period, period, directory=None):
+        if fcntl is None:
+            raise RuntimeError("SharedGCRALimiter requires fcntl (POSIX)")
+
+        self.calls_per_period = calls_per_period
+        self.period = period
+        self.interval = period / calls_per_period
+        if directory is None:
+            # /dev/shm - файли в пам'яті, без звернень до диска
+            directory = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+        self.path = os.path.join(directory, f"{name}.throttle")
+
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._pid = os.getpid()
+        self._thread_lock = Lock()
+        self._reopen_lock = Lock()
+        with self._locked():
+            if os.fstat(self._fd).st_size < self._TAT.size:
+                os.ftruncate(self._fd, self._TAT.size)
+        self._buf = mmap.mmap(self._fd, self._TAT.size)
+
+    @property
+    def tat(self):
+        return self._TAT.unpack_from(self._buf, 0)[0]
+
+    @tat.setter
+    def tat(self, value):
+        self._TAT.pack_into(self._buf, 0, value or 0.0)
+
+    def _locked(self):
+        if self._pid != os.getpid():
+            with self._reopen_lock:
+                if self._pid != os.getpid():
+                    # дочірній процес після fork ділить з батьком відкритий файл, а отже і flock
+                    inherited_fd = self._fd
+                    self._fd = os.open(self.path, os.O_RDWR)
+                    self._thread_lock = Lock()
+                    self._pid = os.getpid()
+                    os.close(inherited_fd)
+        return _FileLock(self._fd, self._thread_lock)
+
+    def _clamp_tat(self, now):
+        # must be called with the file lock held
+        # TAT - значення time.monotonic(), а файл може пережити годинник (перезавантаження,
+        # directory= на диску): справжній TAT не буває пізніше за now + period
+        if self.tat > now + self.period:
+            self.tat = now + self.period
+
+    def try_acquire(self, now):
+        """Займає слот у спільному ліміті або повертає час очікування"""
+        with self._locked():
+            self._clamp_tat(now)
+            return super().try_acquire(now)
+
+    def remaining(self, now):
+        """Кількість доступних викликів у спільному ліміті"""
+        with self._locked():
+            self._clamp_tat(now)
+            return super().remaining(now)
+
+    def reset(self):
+        with self._locked():
+            super().reset()
+
+    def close(self):
+        """Закриває mmap і файл (файл лишається для інших процесів)"""
+        self._buf.close()
+        os.close(self._fd)
+
+    def unlink(self):
+        """Видаляє файл стану"""
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class _FileLock:
+    """Ексклюзивне блокування файлу між процесами (flock) і між потоками процесу (Lock)"""
+    def __init__(self, fd, thread_lock):
+        self.fd = fd
+        self.thread_lock = thread_lock
+
+    def __enter__(self):
+        self.thread_lock.acquire()
+        try:
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+        except BaseException:
+            self.thread_lock.release()
+            raise
+
+    def __exit__(self, *exc_info):
+        try:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+        finally:
+            self.thread_lock.release()
+
+
+LIMITERS = {
+    'sliding_log': SlidingLogLimiter,
+    'token_bucket': TokenBucketLimiter,
+    'gcra': GCRALimiter,
+    'sliding_window': SlidingWindowCounterLimiter,
+}
+
+
+def create_limiter(algorithm, calls_per_period, period):
+    """Створює лімітер за назвою алгоритму"""
+    try:
+        limiter_cls = LIMITERS[algorithm]
+    except KeyError:
+        raise ValueError(
+            f"Unknown throttle algorithm: {algorithm!r}. Available: {', '.join(LIMITERS)}"
+        ) from None
+    return limiter_cls(calls_per_period, period)
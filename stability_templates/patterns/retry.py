@@ -1,53 +1,202 @@
+import asyncio
+import inspect
+import random
 import time
 import logging
+from threading import Lock
 
 logger = logging.getLogger(__name__)
 
 
+class RetryBudget:
+    """
+    Retry budget - спільний для кількох Retry ліміт повторів (token bucket):
+    кожен перший виклик додає ratio токена, кожен повтор забирає один токен.
+    min_retries_per_second гарантує мінімум повторів при малому трафіку
+    """
+    def __init__(self, ratio=0.1, min_retries_per_second=1.0, max_tokens=100):
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.max_tokens = max_tokens
+        self.tokens = float(max_tokens)
+        self.updated_at = time.monotonic()
+        self.retries_allowed = 0
+        self.retries_refused = 0
+        self._lock = Lock()
+
+    def _deposit(self, amount):
+        # must be called with self._lock held
+        self.tokens = min(self.max_tokens, self.tokens + amount)
+
+    def record_call(self):
+        """Перший виклик (не повтор) поповнює бюджет"""
+        with self._lock:
+            self._deposit(self.ratio)
+
+    def try_withdraw(self):
+        """Забирає токен на повтор; False - бюджет вичерпано"""
+        with self._lock:
+            now = time.monotonic()
+            self._deposit((now - self.updated_at) * self.min_retries_per_second)
+            self.updated_at = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                self.retries_allowed += 1
+                return True
+            self.retries_refused += 1
+            return False
+
+
 class Retry:
     """
     Retry pattern - автоматично повторює виклик функції при помилках
+    jitter: None (детермінований backoff), 'full', 'equal', 'decorrelated'
+    budget: спільний RetryBudget, який обмежує частку повторів
+    deadline: загальний час (с) на всі спроби і паузи; timeout_kwarg - ім'я аргументу,
+    через який функція отримує залишок часу (наприклад, 'timeout' для make_request).
+    Таймаут однієї спроби - переданий у виклик, інакше attempt_timeout, інакше значення
+    за замовчуванням цього аргументу у функції; він лише обрізається залишком часу
     """
-    def __init__(self, func, max_attempts=3, delay=1, backoff=2, exceptions=(Exception,)):
+    JITTER_STRATEGIES = (None, 'full', 'equal', 'decorrelated')
+
+    def __init__(self, func, max_attempts=3, delay=1, backoff=2, exceptions=(Exception,),
+                 jitter=None, max_delay=None, budget=None, deadline=None, timeout_kwarg=None,
+                 attempt_timeout=None):
+        if jitter not in self.JITTER_STRATEGIES:
+            raise ValueError(f"Unknown jitter strategy: {jitter!r}")
         self.func = func
         self.max_attempts = max_attempts
         self.delay = delay
         self.backoff = backoff
         self.exceptions = exceptions
+        self.jitter = jitter
+        self.max_delay = max_delay
+        self.budget = budget
+        self.deadline = deadline
+        self.timeout_kwarg = timeout_kwarg
+        if attempt_timeout is None and timeout_kwarg is not None:
+            attempt_timeout = self._default_argument(func, timeout_kwarg)
+        self.attempt_timeout = attempt_timeout
         self.attempt_count = 0
 
+    @staticmethod
+    def _default_argument(func, name):
+        """Значення аргументу name за замовчуванням у сигнатурі func або None"""
+        try:
+            parameter = inspect.signature(func).parameters.get(name)
+        except (TypeError, ValueError):
+            return None
+        if parameter is None or parameter.default is inspect.Parameter.empty:
+            return None
+        return parameter.default
+
+    def next_delay(self, current_delay):
+        """Повертає (пауза перед повтором, база для наступної паузи)"""
+        if self.jitter == 'decorrelated':
+            # пауза залежить від попередньої: uniform(delay, prev * 3)
+            sleep_time = random.uniform(self.delay, current_delay * 3)
+            next_delay = sleep_time
+        else:
+            if self.jitter == 'full':
+                sleep_time = random.uniform(0, current_delay)
+            elif self.jitter == 'equal':
+                sleep_time = current_delay / 2 + random.uniform(0, current_delay / 2)
+            else:
+                sleep_time = current_delay
+            next_delay = current_delay * self.backoff
+
+        if self.max_delay is not None:
+            sleep_time = min(sleep_time, self.max_delay)
+            next_delay = min(next_delay, self.max_delay)
+        return sleep_time, next_delay
+
+    def _start(self):
+        """Починає новий виклик; повертає момент дедлайну (time.monotonic) або None"""
+        self.attempt_count = 0
+        if self.budget is not None:
+            self.budget.record_call()
+        if self.deadline is None:
+            return None
+        return time.monotonic() + self.deadline
+
+    def _attempt_kwargs(self, kwargs, deadline_at):
+        """Передає функції таймаут спроби, обрізаний залишком часу до дедлайну, через timeout_kwarg"""
+        if deadline_at is None or self.timeout_kwarg is None:
+            return kwargs
+        remaining = deadline_at - time.monotonic()
+        timeout = kwargs.get(self.timeout_kwarg)
+        if timeout is None:
+            timeout = self.attempt_timeout
+        return {**kwargs, self.timeout_kwarg: remaining if timeout is None else min(timeout, remaining)}
+
+    def _before_retry(self, error, current_delay, deadline_at=None):
+        """Вирішує, чи робити повтор; кидає RetryExhausted або повертає паузи"""
+        if self.attempt_count >= self.max_attempts:
+            logger.error(f"Failed after {self.attempt_count} attempts")
+            raise RetryExhausted(
+                f"Max retry attempts ({self.max_attempts}) exceeded"
+            ) from error
+
+        sleep_time, next_delay = self.next_delay(current_delay)
+        # пауза, після якої дедлайн вже мине, не має сенсу - здаємося одразу
+        if deadline_at is not None and time.monotonic() + sleep_time >= deadline_at:
+            logger.error(f"Deadline of {self.deadline}s would be exceeded after {self.attempt_count} attempts")
+            raise RetryExhausted(f"Retry deadline ({self.deadline}s) exceeded") from error
+
+        if self.budget is not None and not self.budget.try_withdraw():
+            logger.error(f"Retry budget exhausted after {self.attempt_count} attempts")
+            raise RetryExhausted("Retry budget exhausted") from error
+
+        logger.warning(
+            f"Attempt {self.attempt_count}/{self.max_attempts} failed: {error}. "
+            f"Retrying in {sleep_time:.2f}s..."
+        )
+        return sleep_time, next_delay
+
     def call(self, *args, **kwargs):
         """Виконує функцію з автоматичним повтором при помилках"""
-        self.attempt_count = 0
+        deadline_at = self._start()
         current_delay = self.delay
 
-        while self.attempt_count < self.max_attempts:
+        while True:
             self.attempt_count += 1
 
             try:
-                result = self.func(*args, **kwargs)
+                result = self.func(*args, **self._attempt_kwargs(kwargs, deadline_at))
                 logger.info(f"Success on attempt {self.attempt_count}/{self.max_attempts}")
                 return result
 
             except self.exceptions as e:
-                if self.attempt_count >= self.max_attempts:
-                    logger.error(f"Failed after {self.attempt_count} attempts")
-                    raise RetryExhausted(
-                        f"Max retry attempts ({self.max_attempts}) exceeded"
-                    ) from e
-
-                logger.warning(
-                    f"Attempt {self.attempt_count}/{self.max_attempts} failed: {e}. "
-                    f"Retrying in {current_delay}s..."
-                )
-                time.sleep(current_delay)
-                current_delay *= self.backoff
+                sleep_time, current_delay = self._before_retry(e, current_delay, deadline_at)
+                time.sleep(sleep_time)
 
     def reset(self):
         """Скидає лічильник спроб"""
         self.attempt_count = 0
 
 
+class AsyncRetry(Retry):
+    """
+    Асинхронний Retry - чекає між спробами через asyncio.sleep, не блокуючи потік
+    """
+    async def call(self, *args, **kwargs):
+        """Виконує корутину з автоматичним повтором при помилках"""
+        deadline_at = self._start()
+        current_delay = self.delay
+
+        while True:
+            self.attempt_count += 1
+
+            try:
+                result = await self.func(*args, **self._attempt_kwargs(kwargs, deadline_at))
+                logger.info(f"Success on attempt {self.attempt_count}/{self.max_attempts}")
+                return result
+
+            except self.exceptions as e:
+                sleep_time, current_delay = self._before_retry(e, current_delay, deadline_at)
+                await asyncio.sleep(sleep_time)
+
+
 class RetryExhausted(Exception):
     """Виключення, коли вичерпані всі спроби повтору"""
-    pass
\ No newline at end of file
+    pass
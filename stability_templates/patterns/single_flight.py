@@ -0,0 +1,83 @@
+import logging
+from concurrent.futures import Future
+from threading import Lock
+
+logger = logging.getLogger(__name__)
+
+
+def _freeze(value):
+    """Хешоване представлення вкладених dict / list / set (params=, headers=, ...)"""
+    if isinstance(value, dict):
+        return tuple(sorted(((key, _freeze(item)) for key, item in value.items()), key=repr))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
+def default_key(*args, **kwargs):
+    """Ключ за замовчуванням: усі аргументи виклику, вкладені dict і list заморожуються"""
+    return _freeze(args), _freeze(kwargs)
+
+
+class SingleFlight:
+    """
+    Single-flight - одночасні виклики з однаковим ключем ділять один виклик функції:
+    перший виконує його, решта чекають і отримують той самий результат або виключення
+    """
+    def __init__(self, func, key_func=default_key):
+        self.func = func
+        self.key_func = key_func
+        self._in_flight = {}
+        self._lock = Lock()
+        self.calls_count = 0 #real calls of func
+        self.collapsed_count = 0 #calls that waited for someone else's result
+
+    def call(self, *args, **kwargs):
+        """Виконує функцію або приєднується до вже запущеного ідентичного виклику"""
+        key = self.key_func(*args, **kwargs)
+        try:
+            hash(key)
+        except TypeError:
+            # нехешовані аргументи не об'єднуються - виклик виконується напряму
+            logger.debug(f"Unhashable key {key!r}, calling without coalescing")
+            return self.func(*args, **kwargs)
+
+        with self._lock:
+            flight = self._in_flight.get(key)
+            if flight is None:
+                flight = Future()
+                self._in_flight[key] = flight
+                self.calls_count += 1
+                leader = True
+            else:
+                self.collapsed_count += 1
+                leader = False
+
+        if not leader:
+            logger.debug(f"Joined in-flight call for {key!r}")
+            return flight.result()
+
+        try:
+            result = self.func(*args, **kwargs)
+        except BaseException as e:
+            self._finish(key)
+            flight.set_exception(e)
+            raise
+        self._finish(key)
+        flight.set_result(result)
+        return result
+
+    def _finish(self, key):
+        # наступні виклики після завершення вже запускають новий виклик функції
+        with self._lock:
+            self._in_flight.pop(key, None)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "calls": self.calls_count,
+                "collapsed": self.collapsed_count,
+                "in_flight": len(self._in_flight),
+            }
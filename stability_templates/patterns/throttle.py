@@ -1,62 +1,157 @@
+import asyncio
 import time
 import logging
+from collections import deque
+from threading import Lock, Condition
+
+from .rate_limiters import create_limiter
 
 logger = logging.getLogger(__name__)
 
 
 class ThrottledException(Exception):
     """Виключення при перевищенні ліміту викликів"""
-    pass
+    def __init__(self, message="", retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class Throttle:
     """
     Throttle pattern - обмежує кількість викликів функції за період часу
+    algorithm: 'sliding_log' (точний), 'token_bucket', 'gcra', 'sliding_window'
+    block: чекати на вільний слот (у порядку черги) замість ThrottledException,
+    max_wait: максимальний час очікування (None - без обмеження)
+    limiter: готовий лімітер замість algorithm (наприклад, SharedGCRALimiter для кількох процесів)
     """
-    def __init__(self, func, calls_per_period, period=1.0):
+    def __init__(self, func, calls_per_period, period=1.0, algorithm='sliding_log',
+                 block=False, max_wait=None, limiter=None):
         self.func = func
         self.calls_per_period = calls_per_period
         self.period = period
-        self.call_times = []
+        self.algorithm = algorithm if limiter is None else type(limiter).__name__
+        self.block = block
+        self.max_wait = max_wait
+        self.limiter = limiter or create_limiter(algorithm, calls_per_period, period)
+        self._lock = Lock()
+        # черга очікувачів (FIFO): кожен чекає на власній умові, будиться лише голова черги
+        self._waiters = deque()
 
     def call(self, *args, **kwargs):
         """Виконує функцію з обмеженням по частоті викликів"""
-        current_time = time.time()
+        self._acquire()
+        return self.func(*args, **kwargs)
 
-        # Видаляємо старі відмітки часу
-        self.call_times = [
-            t for t in self.call_times
-            if current_time - t < self.period
-        ]
+    def _acquire(self):
+        """Резервує слот у поточному періоді або кидає ThrottledException"""
+        if self.block:
+            self._wait_for_slot()
+            return
 
-        if len(self.call_times) >= self.calls_per_period:
-            wait_time = self.period - (current_time - self.call_times[0])
+        with self._lock:
+            wait_time = self.limiter.try_acquire(time.monotonic())
+
+        if wait_time > 0:
             logger.warning(
-                f"Throttled: {len(self.call_times)}/{self.calls_per_period} "
-                f"calls in {self.period}s. Wait {wait_time:.2f}s"
+                f"Throttled: {self.calls_per_period} calls in {self.period}s "
+                f"({self.algorithm}). Wait {wait_time:.2f}s"
             )
             raise ThrottledException(
                 f"Rate limit exceeded: {self.calls_per_period} calls per {self.period}s. "
-                f"Retry after {wait_time:.2f}s"
+                f"Retry after {wait_time:.2f}s",
+                retry_after=wait_time
             )
 
-        self.call_times.append(current_time)
-        logger.info(
-            f"Call allowed: {len(self.call_times)}/{self.calls_per_period} "
-            f"in current period"
-        )
-        return self.func(*args, **kwargs)
+        logger.debug("Call allowed")
+
+    def _wait_for_slot(self):
+        """Чекає на вільний слот; очікувачі обслуговуються у порядку надходження"""
+        deadline = None if self.max_wait is None else time.monotonic() + self.max_wait
+        waiter = Condition(self._lock)
+
+        with self._lock:
+            self._waiters.append(waiter)
+            try:
+                while True:
+                    now = time.monotonic()
+                    wait_time = None
+                    if self._waiters[0] is waiter:
+                        wait_time = self.limiter.try_acquire(now)
+                        if wait_time <= 0:
+                            return
+
+                    if deadline is not None:
+                        remaining = deadline - now
+                        # слот голови черги відомий наперед - не чекаємо, якщо він пізніше дедлайну
+                        if remaining <= 0 or (wait_time is not None and wait_time > remaining):
+                            logger.warning(f"Throttled: no slot within {self.max_wait}s")
+                            raise ThrottledException(
+                                f"Rate limit exceeded: no free slot within {self.max_wait}s",
+                                retry_after=wait_time
+                            )
+                        if wait_time is None:
+                            wait_time = remaining
+
+                    waiter.wait(wait_time)
+            finally:
+                was_head = self._waiters[0] is waiter
+                self._waiters.remove(waiter)
+                if was_head and self._waiters:
+                    self._waiters[0].notify()
 
     def reset(self):
         """Скидає історію викликів"""
-        self.call_times = []
+        with self._lock:
+            self.limiter.reset()
         logger.info("Throttle reset")
 
     def get_remaining_calls(self):
         """Повертає кількість доступних викликів"""
-        current_time = time.time()
-        self.call_times = [
-            t for t in self.call_times
-            if current_time - t < self.period
-        ]
-        return self.calls_per_period - len(self.call_times)
\ No newline at end of file
+        with self._lock:
+            return self.limiter.remaining(time.monotonic())
+
+
+class AsyncThrottle(Throttle):
+    """
+    Асинхронний Throttle - обмежує частоту викликів корутини
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # asyncio.Lock віддає блокування очікувачам у порядку черги (FIFO)
+        self._async_lock = asyncio.Lock()
+
+    async def call(self, *args, **kwargs):
+        """Виконує корутину з обмеженням по частоті викликів"""
+        if self.block:
+            await self._wait_for_slot_async()
+        else:
+            self._acquire()
+        return await self.func(*args, **kwargs)
+
+    async def _wait_for_slot_async(self):
+        """Чекає на вільний слот без блокування event loop"""
+        deadline = None if self.max_wait is None else time.monotonic() + self.max_wait
+
+        try:
+            async with asyncio.timeout(self.max_wait):
+                await self._async_lock.acquire()
+        except TimeoutError:
+            logger.warning(f"Throttled: no slot within {self.max_wait}s")
+            raise ThrottledException(f"Rate limit exceeded: no free slot within {self.max_wait}s")
+
+        try:
+            while True:
+                now = time.monotonic()
+                with self._lock:
+                    wait_time = self.limiter.try_acquire(now)
+                if wait_time <= 0:
+                    return
+                if deadline is not None and now + wait_time > deadline:
+                    logger.warning(f"Throttled: no slot within {self.max_wait}s")
+                    raise ThrottledException(
+                        f"Rate limit exceeded: no free slot within {self.max_wait}s",
+                        retry_after=wait_time
+                    )
+                await asyncio.sleep(wait_time)
+        finally:
+            self._async_lock.release()
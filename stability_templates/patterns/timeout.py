@@ -1,7 +1,9 @@
+import asyncio
+import functools
 import logging
-import signal
-from threading import Thread
-from queue import Queue, Empty
+from concurrent.futures import wait
+
+from .concurrency_templates.worker_pool import get_shared_pool
 
 logger = logging.getLogger(__name__)
 
@@ -14,43 +16,77 @@ class TimeoutException(Exception):
 class Timeout:
     """
     Timeout pattern - обмежує максимальний час виконання функції
+    Функція виконується у пулі потоків (за замовчуванням - спільному для процесу);
+    якщо пул вже тримає max_abandoned задач, що перевищили timeout, нові виклики відхиляються
     """
 
-    def __init__(self, func, timeout_seconds):
+    def __init__(self, func, timeout_seconds, pool=None):
         self.func = func
         self.timeout_seconds = timeout_seconds
+        self.pool = pool or get_shared_pool()
 
     def call(self, *args, **kwargs):
         """Виконує функцію з обмеженням часу"""
-        result_queue = Queue()
-        exception_queue = Queue()
-
-        def worker():
-            try:
-                result = self.func(*args, **kwargs)
-                result_queue.put(result)
-            except Exception as e:
-                exception_queue.put(e)
-
-        thread = Thread(target=worker, daemon=True)
-        thread.start()
-        thread.join(timeout=self.timeout_seconds)
-
-        # Перевіряємо чи потік завершився
-        if thread.is_alive():
+        if self.pool.abandoned_in_flight >= self.pool.max_abandoned:
+            logger.warning(f"Rejected: {self.pool.abandoned_in_flight} timed out calls are still running")
+            raise TimeoutException(
+                f"Too many timed out calls still running ({self.pool.abandoned_in_flight})"
+            )
+
+        future = self.pool.submit(self.func, *args, **kwargs)
+        done, _ = wait((future,), timeout=self.timeout_seconds)
+
+        # Перевіряємо чи задача завершилась
+        if not done:
+            self.pool.abandon(future)
             logger.warning(f"Timeout after {self.timeout_seconds}s")
             raise TimeoutException(f"Operation timed out after {self.timeout_seconds}s")
 
         # Перевіряємо виключення
-        if not exception_queue.empty():
-            e = exception_queue.get()
+        e = future.exception()
+        if e is not None:
             logger.error(f"Function raised exception: {e}")
             raise e
 
-        # Повертаємо результат
-        if not result_queue.empty():
-            result = result_queue.get()
-            logger.info(f"Completed within {self.timeout_seconds}s timeout")
-            return result
+        logger.info(f"Completed within {self.timeout_seconds}s timeout")
+        return future.result()
+
+
+def timeout_decorator(seconds, pool=None):
+    """Декоратор: обмежує час виконання функції через Timeout"""
+    def decorator(func):
+        timeout = Timeout(func, seconds, pool=pool)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return timeout.call(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class AsyncTimeout:
+    """
+    Асинхронний Timeout - обмежує час виконання корутини через asyncio.timeout
+    """
+
+    def __init__(self, func, timeout_seconds):
+        self.func = func
+        self.timeout_seconds = timeout_seconds
+
+    async def call(self, *args, **kwargs):
+        """Виконує корутину з обмеженням часу, після ліміту корутина скасовується"""
+        deadline = asyncio.timeout(self.timeout_seconds)
+        try:
+            async with deadline:
+                result = await self.func(*args, **kwargs)
+        except TimeoutError:
+            # TimeoutError, піднятий самою функцією, не перетворюємо
+            if not deadline.expired():
+                raise
+            logger.warning(f"Timeout after {self.timeout_seconds}s")
+            raise TimeoutException(f"Operation timed out after {self.timeout_seconds}s")
 
-        raise TimeoutException("No result returned")
+        logger.info(f"Completed within {self.timeout_seconds}s timeout")
+        return result
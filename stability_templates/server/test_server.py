@@ -1,8 +1,29 @@
 import random
 import time
 from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+
+from ..utils.json_codec import get_default_codec
+
+
+class CodecJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider on top of the pluggable codec (orjson when installed)"""
+
+    def __init__(self, app, codec=None):
+        super().__init__(app)
+        self.codec = codec or get_default_codec()
+
+    def loads(self, s, **kwargs):
+        return self.codec.loads(s)
+
+    def response(self, *args, **kwargs):
+        # the codec encodes straight to bytes, no intermediate str
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.codec.dumps(obj), mimetype=self.mimetype)
+
 
 app = Flask(__name__)
+app.json = CodecJSONProvider(app)
 
 
 @app.route('/success')
@@ -48,6 +69,27 @@ def counter_endpoint():
     return jsonify({"count": counter_endpoint.count, "timestamp": time.time()}), 200
 
 
+@app.route('/cached')
+def cached_endpoint():
+    """Cacheable response with ETag and Cache-Control for response cache testing"""
+    if not hasattr(cached_endpoint, 'count'):
+        cached_endpoint.count = 0
+    cached_endpoint.count += 1
+    version = int(request.args.get('version', 1))
+    response = jsonify({"msg": "Cached", "version": version, "count": cached_endpoint.count})
+    response.set_etag(f"v{version}")
+    response.headers['Cache-Control'] = f"max-age={request.args.get('max_age', 1)}"
+    return response.make_conditional(request)
+
+
+@app.route('/cookies')
+def cookies_endpoint():
+    """Echoes the cookies sent by the client and sets a session cookie"""
+    response = jsonify({"cookies": dict(request.cookies)})
+    response.set_cookie('session', 'upstream-session')
+    return response
+
+
 @app.route('/health')
 def health_endpoint():
     return jsonify({"status": "healthy"}), 200
@@ -66,6 +108,8 @@ if __name__ == '__main__':
     print(f"  /slow     - Delayed response (use ?delay=N)")
     print(f"  /unstable - 70% failure rate")
     print(f"  /counter  - Incremental counter")
+    print(f"  /cached   - ETag + Cache-Control (use ?version=N&max_age=N)")
+    print(f"  /cookies  - Echoes cookies and sets a session cookie")
     print(f"  /health   - Health check")
     print("=" * 60)
     app.run(debug=True, host='0.0.0.0', port=PORT)
\ No newline at end of file
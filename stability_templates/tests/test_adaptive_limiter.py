@@ -0,0 +1,145 @@
+import asyncio
+import time
+import pytest
+from threading import Thread, Event, Lock
+from unittest import mock
+from stability_templates.patterns.adaptive_limiter import (
+    AdaptiveLimiter,
+    AsyncAdaptiveLimiter,
+    AIMDLimit,
+    GradientLimit,
+    LimitExceededException,
+    create_limit
+)
+
+
+def test_aimd_increases_on_success_and_backs_off_on_drop():
+    """Тест: AIMD додає 1 при успіху і множить на backoff_ratio при помилці"""
+    limit = AIMDLimit(initial_limit=10, backoff_ratio=0.5)
+
+    assert limit.update(0.01, in_flight=10, dropped=False) == 11
+    assert limit.update(0.01, in_flight=10, dropped=True) == 5.5
+
+
+def test_aimd_does_not_grow_when_limit_is_unused():
+    """Тест: ліміт не росте, якщо викликів у польоті значно менше за нього"""
+    limit = AIMDLimit(initial_limit=10)
+
+    assert limit.update(0.01, in_flight=1, dropped=False) == 10
+
+
+def test_aimd_latency_threshold():
+    """Тест: повільна відповідь зменшує ліміт так само, як помилка"""
+    limit = AIMDLimit(initial_limit=10, backoff_ratio=0.5, latency_threshold=0.1)
+
+    assert limit.update(0.5, in_flight=10, dropped=False) == 5
+
+
+def test_gradient_reduces_limit_when_latency_grows():
+    """Тест: gradient зменшує ліміт, коли затримка росте відносно довгострокової"""
+    limit = GradientLimit(initial_limit=50, smoothing=1.0)
+    for _ in range(100):
+        limit.update(0.01, in_flight=50, dropped=False)
+    grown = limit.limit
+
+    for _ in range(20):
+        limit.update(0.1, in_flight=int(limit.limit), dropped=False)
+
+    assert grown > 50
+    assert limit.limit < grown / 2
+
+
+def test_create_limit_unknown_algorithm():
+    """Тест: невідомий алгоритм"""
+    with pytest.raises(ValueError):
+        create_limit("vegas-nonexistent")
+
+
+def test_adaptive_limiter_rejects_over_limit():
+    """Тест: виклики понад поточний ліміт відхиляються одразу"""
+    release = Event()
+    limiter = AdaptiveLimiter(lambda: release.wait(), algorithm='aimd', initial_limit=2)
+    threads = [Thread(target=limiter.call) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+
+    with pytest.raises(LimitExceededException) as exc_info:
+        limiter.call()
+
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert exc_info.value.limit == 2
+    assert limiter.stats()["rejected"] == 1
+    assert limiter.stats()["in_flight"] == 0
+
+
+def test_adaptive_limiter_counts_drops():
+    """Тест: помилки зменшують ліміт і рахуються"""
+    limiter = AdaptiveLimiter(mock.Mock(side_effect=ValueError("overloaded")), algorithm='aimd',
+                              initial_limit=10, backoff_ratio=0.5)
+
+    with pytest.raises(ValueError):
+        limiter.call()
+
+    assert limiter.limit == 5
+    assert limiter.stats()["dropped"] == 1
+
+
+def test_async_adaptive_limiter():
+    """Тест: асинхронний лімітер пропускає корутини в межах ліміту"""
+    limiter = AsyncAdaptiveLimiter(lambda: asyncio.sleep(0.05, result="ok"), algorithm='aimd', initial_limit=3)
+
+    async def run():
+        return await asyncio.gather(*(limiter.call() for _ in range(5)), return_exceptions=True)
+
+    results = asyncio.run(run())
+
+    assert results.count("ok") == 3
+    assert sum(isinstance(r, LimitExceededException) for r in results) == 2
+
+
+@pytest.mark.parametrize("algorithm", ["aimd", "gradient"])
+def test_adaptive_limit_tracks_upstream_capacity(algorithm):
+    """
+    Тест-симуляція: upstream обробляє 8 запитів одночасно, решта чекають у черзі
+    (затримка росте). Ліміт має зійтися близько до реальної ємності
+    """
+    capacity = 8
+    base_latency = 0.01
+    state = {"in_flight": 0}
+    state_lock = Lock()
+
+    def upstream():
+        with state_lock:
+            state["in_flight"] += 1
+            queued = max(0, state["in_flight"] - capacity)
+        time.sleep(base_latency * (1 + queued / capacity))
+        with state_lock:
+            state["in_flight"] -= 1
+
+    limiter = AdaptiveLimiter(upstream, algorithm=algorithm, initial_limit=50, max_limit=100,
+                              **({"latency_threshold": base_latency * 1.5} if algorithm == "aimd" else {}))
+    stop_at = time.monotonic() + 2.0
+    limits = []
+
+    def client():
+        while time.monotonic() < stop_at:
+            try:
+                limiter.call()
+            except LimitExceededException:
+                time.sleep(base_latency / 2)
+            limits.append(limiter.limit)
+
+    threads = [Thread(target=client) for _ in range(40)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    settled = limits[len(limits) // 2:]
+    average = sum(settled) / len(settled)
+    print(f"\n{algorithm}: settled limit {average:.1f} (capacity {capacity}), stats {limiter.stats()}")
+    assert capacity / 2 <= average <= capacity * 3
@@ -0,0 +1,159 @@
+import asyncio
+import time
+import pytest
+from threading import Thread, Event
+from unittest import mock
+from stability_templates.patterns.bulkhead import Bulkhead, AsyncBulkhead, BulkheadFullException
+
+
+def start_blocked_calls(bulkhead, count, release):
+    """Запускає count викликів, що тримають слот до release.set()"""
+    threads = [Thread(target=bulkhead.call, args=(release,)) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    return threads
+
+
+def test_bulkhead_allows_calls_under_limit():
+    """Тест: виклики в межах ліміту виконуються"""
+    mock_fn = mock.Mock(return_value="result")
+    bulkhead = Bulkhead(mock_fn, max_concurrent=2)
+
+    assert bulkhead.call(1) == "result"
+    assert bulkhead.stats()["active"] == 0
+    assert bulkhead.stats()["accepted"] == 1
+
+
+def test_bulkhead_rejects_fast_when_full():
+    """Тест: коли слоти зайняті і черги немає - відмова одразу"""
+    release = Event()
+    bulkhead = Bulkhead(lambda event: event.wait(), max_concurrent=2)
+    threads = start_blocked_calls(bulkhead, 2, release)
+
+    start = time.monotonic()
+    with pytest.raises(BulkheadFullException):
+        bulkhead.call(release)
+    elapsed = time.monotonic() - start
+
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert elapsed < 0.05
+    assert bulkhead.stats()["rejected"] == 1
+    assert bulkhead.stats()["active"] == 0
+
+
+def test_bulkhead_queue_timeout():
+    """Тест: виклик у черзі відхиляється після queue_timeout"""
+    release = Event()
+    bulkhead = Bulkhead(lambda event: event.wait(), max_concurrent=1, max_queued=1, queue_timeout=0.2)
+    threads = start_blocked_calls(bulkhead, 1, release)
+
+    start = time.monotonic()
+    with pytest.raises(BulkheadFullException):
+        bulkhead.call(release)
+    elapsed = time.monotonic() - start
+
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert 0.15 < elapsed < 0.5
+    assert bulkhead.stats()["timed_out"] == 1
+
+
+def test_bulkhead_queued_call_runs_when_slot_frees():
+    """Тест: виклик у черзі виконується, щойно звільняється слот"""
+    release = Event()
+    bulkhead = Bulkhead(lambda event: event.wait() and "done", max_concurrent=1, max_queued=1, queue_timeout=2)
+    threads = start_blocked_calls(bulkhead, 1, release)
+
+    Thread(target=lambda: (time.sleep(0.1), release.set())).start()
+    assert bulkhead.call(release) == "done"
+
+    for thread in threads:
+        thread.join()
+    assert bulkhead.stats()["accepted"] == 2
+
+
+def test_bulkhead_context_manager():
+    """Тест: bulkhead як контекстний менеджер звільняє слот і при помилці"""
+    bulkhead = Bulkhead(max_concurrent=1)
+
+    with pytest.raises(ValueError):
+        with bulkhead:
+            assert bulkhead.stats()["active"] == 1
+            raise ValueError("fail")
+    assert bulkhead.stats()["active"] == 0
+
+
+def test_bulkhead_isolates_slow_dependency():
+    """
+    Тест-порівняння: повільна залежність за bulkhead не забирає потоки у швидкої
+    """
+    slow = Bulkhead(lambda: time.sleep(1), max_concurrent=2, name="slow")
+    fast = Bulkhead(lambda: "ok", max_concurrent=2, name="fast")
+    rejected = []
+
+    def call_slow():
+        try:
+            slow.call()
+        except BulkheadFullException:
+            rejected.append(True)
+
+    threads = [Thread(target=call_slow) for _ in range(10)]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    rejected_in = time.monotonic() - start
+
+    assert fast.call() == "ok"
+    for thread in threads:
+        thread.join()
+
+    print(f"\nSlow bulkhead: {slow.stats()}, rejections within {rejected_in * 1000:.1f} ms")
+    assert len(rejected) == 8
+    assert slow.stats()["accepted"] == 2
+
+
+def test_async_bulkhead_limits_concurrency():
+    """Тест: асинхронний bulkhead обмежує кількість одночасних корутин"""
+    active = 0
+    peak = 0
+
+    async def task():
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.05)
+        active -= 1
+        return "ok"
+
+    bulkhead = AsyncBulkhead(task, max_concurrent=3, max_queued=10)
+
+    async def run():
+        return await asyncio.gather(*(bulkhead.call() for _ in range(10)), return_exceptions=True)
+
+    results = asyncio.run(run())
+
+    assert results == ["ok"] * 10
+    assert peak == 3
+
+
+def test_async_bulkhead_rejects_and_times_out():
+    """Тест: асинхронний bulkhead відхиляє виклики понад чергу і після queue_timeout"""
+    bulkhead = AsyncBulkhead(lambda: asyncio.sleep(0.5), max_concurrent=1, max_queued=1, queue_timeout=0.1)
+
+    async def run():
+        return await asyncio.gather(*(bulkhead.call() for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(run())
+    errors = [r for r in results if isinstance(r, BulkheadFullException)]
+
+    stats = bulkhead.stats()
+    assert len(errors) == 2
+    assert stats["rejected"] == 1
+    assert stats["timed_out"] == 1
+    assert stats["active"] == 0 and stats["queued"] == 0
@@ -0,0 +1,54 @@
+import pytest
+from stability_templates.patterns.concurrency_templates.chunking import (
+    CountChunker,
+    ByteSizeChunker,
+    AdaptiveChunker,
+    create_chunker
+)
+
+
+def test_count_chunker_by_size_and_by_chunks():
+    """Тест: розбиття за кількістю елементів або кількістю частин"""
+    data = list(range(10))
+
+    assert list(CountChunker(chunk_size=4).ranges(data)) == [(0, 4), (4, 8), (8, 10)]
+    assert list(CountChunker(chunks=3).ranges(data)) == [(0, 4), (4, 8), (8, 10)]
+    assert list(CountChunker(chunks=3).ranges([])) == []
+    with pytest.raises(ValueError):
+        CountChunker()
+
+
+def test_byte_size_chunker_for_records():
+    """Тест: частини записів не перевищують max_bytes (крім одного завеликого запису)"""
+    records = ["a" * 40, "b" * 40, "c" * 40, "d" * 200, "e" * 10]
+
+    assert list(ByteSizeChunker(max_bytes=100).ranges(records)) == [(0, 2), (2, 3), (3, 4), (4, 5)]
+
+
+def test_byte_size_chunker_for_buffers():
+    """Тест: для буферів рахуються байти елементів"""
+    from array import array
+
+    assert list(ByteSizeChunker(max_bytes=4).ranges(b"0123456789")) == [(0, 4), (4, 8), (8, 10)]
+    # 8 байт на елемент double
+    assert list(ByteSizeChunker(max_bytes=16).ranges(array("d", range(5)))) == [(0, 2), (2, 4), (4, 5)]
+
+
+def test_adaptive_chunker_targets_processing_time():
+    """Тест: розмір частини підлаштовується під виміряну швидкість обробки"""
+    chunker = AdaptiveChunker(target_seconds=0.1, initial_size=10, alpha=1.0)
+    data = list(range(1000))
+    ranges = chunker.ranges(data)
+
+    assert next(ranges) == (0, 10)
+    chunker.record(10, 0.01) # 1 ms per item -> 100 items per 0.1s
+    assert next(ranges) == (10, 110)
+    chunker.record(100, 1.0) # 10 ms per item -> 10 items
+    assert next(ranges) == (110, 120)
+
+
+def test_create_chunker():
+    """Тест: створення стратегії за назвою"""
+    assert isinstance(create_chunker("count", chunks=2), CountChunker)
+    with pytest.raises(ValueError):
+        create_chunker("random")
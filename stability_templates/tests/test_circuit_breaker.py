@@ -170,3 +170,269 @@ def test_with_mock():
     print(f"Call 4: Succeeded, result: {result}")
     assert cb.state == StateChoices.CLOSED
     assert result == "success"
+
+
+def test_half_open_state_call():
+    """Test that a call in HALF_OPEN state is dispatched and closes the circuit"""
+    mock_fn = mock.Mock(return_value="success")
+    cb = CircuitBreaker(func=mock_fn, exceptions=(Exception,), threshold=3, delay=1)
+
+    cb.set_state(StateChoices.HALF_OPEN)
+
+    assert cb.make_remote_call() == "success"
+    assert cb.state == StateChoices.CLOSED
+
+
+def test_failure_rate_window():
+    """Test that the circuit opens on failure rate over the sliding window"""
+    outcomes = [Exception("Failed"), "success"] * 10
+    mock_fn = mock.Mock(side_effect=outcomes)
+
+    cb = CircuitBreaker(
+        func=mock_fn,
+        exceptions=(Exception,),
+        threshold=6,
+        delay=5,
+        window_size=10,
+        failure_rate_threshold=0.5
+    )
+
+    # 1 failure of 1 call: not enough calls in the window yet
+    with pytest.raises(RemoteCallFailedException):
+        cb.make_remote_call()
+    assert cb.state == StateChoices.CLOSED
+
+    for i in range(4):
+        try:
+            cb.make_remote_call()
+        except RemoteCallFailedException:
+            pass
+
+    # 3 failures of 5 calls, still below threshold number of calls
+    assert cb.state == StateChoices.CLOSED
+
+    cb.make_remote_call()  # success: 3 of 6 calls failed -> 50%
+    assert cb.state == StateChoices.CLOSED
+
+    with pytest.raises(RemoteCallFailedException):
+        cb.make_remote_call()  # 4 of 7 failed
+    print(f"Failure rate: {cb.get_failure_rate():.2f}")
+    assert cb.state == StateChoices.OPEN
+
+
+def test_successes_reset_failure_rate():
+    """Test that old failures leave the window"""
+    mock_fn = mock.Mock(side_effect=[Exception("Failed")] * 2 + ["success"] * 5)
+    cb = CircuitBreaker(func=mock_fn, exceptions=(Exception,), threshold=3, delay=5)
+
+    for i in range(2):
+        with pytest.raises(RemoteCallFailedException):
+            cb.make_remote_call()
+
+    for i in range(5):
+        cb.make_remote_call()
+
+    assert cb.get_failure_rate() == 0.0
+    assert cb.state == StateChoices.CLOSED
+
+
+def test_concurrent_failures_open_once():
+    """Test that concurrent failing calls open the circuit exactly once"""
+    from threading import Thread, Barrier
+
+    threads_count = 64
+    barrier = Barrier(threads_count)
+
+    def failing():
+        raise Exception("Failed")
+
+    cb = CircuitBreaker(func=failing, exceptions=(Exception,), threshold=10, delay=5)
+    transitions = []
+    original_set_state = cb.set_state
+
+    def counting_set_state(state):
+        transitions.append(state)
+        original_set_state(state)
+
+    cb.set_state = counting_set_state
+
+    def worker():
+        barrier.wait()
+        for _ in range(20):
+            try:
+                cb.make_remote_call()
+            except RemoteCallFailedException:
+                pass
+
+    threads = [Thread(target=worker) for _ in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print(f"State transitions: {transitions}")
+    assert transitions == [StateChoices.OPEN]
+    assert cb.state == StateChoices.OPEN
+
+
+def test_late_failure_does_not_extend_open_delay():
+    """Test a slow call that fails after the circuit opened does not push the OPEN delay forward"""
+    from threading import Thread, Event
+
+    started = Event()
+    release = Event()
+
+    def func(slow):
+        if slow:
+            started.set()
+            release.wait()
+        raise Exception("Failed")
+
+    cb = CircuitBreaker(func=func, exceptions=(Exception,), threshold=1, delay=5)
+    slow_call = Thread(target=lambda: pytest.raises(RemoteCallFailedException, cb.make_remote_call, True))
+    slow_call.start()
+    started.wait()
+
+    with pytest.raises(RemoteCallFailedException):
+        cb.make_remote_call(False)
+    assert cb.state == StateChoices.OPEN
+    opened_at = cb.last_attempt_timestamp
+
+    time.sleep(0.05)
+    release.set()
+    slow_call.join()
+
+    assert cb.state == StateChoices.OPEN
+    assert cb.last_attempt_timestamp == opened_at
+
+
+def test_half_open_allows_single_trial_call():
+    """Test that only one trial call is let through in HALF_OPEN state"""
+    from threading import Thread, Barrier
+
+    threads_count = 32
+    barrier = Barrier(threads_count)
+    calls = []
+
+    def slow_success():
+        calls.append(1)
+        time.sleep(0.2)
+        return "success"
+
+    cb = CircuitBreaker(func=slow_success, exceptions=(Exception,), threshold=3, delay=0.1)
+    cb.set_state(StateChoices.OPEN)
+    cb.update_last_attempt_timestamp()
+    time.sleep(0.2)
+
+    rejected = []
+
+    def worker():
+        barrier.wait()
+        try:
+            cb.make_remote_call()
+        except RemoteCallFailedException:
+            rejected.append(1)
+
+    threads = [Thread(target=worker) for _ in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(rejected) == threads_count - 1
+    assert cb.state == StateChoices.CLOSED
+
+
+def test_async_circuit_breaker():
+    """Test AsyncCircuitBreaker CLOSED → OPEN → HALF_OPEN → CLOSED"""
+    import asyncio
+    from stability_templates.patterns.circuit_breaker import AsyncCircuitBreaker
+
+    mock_fn = mock.AsyncMock(side_effect=[Exception("Failed")] * 3 + ["success"])
+    cb = AsyncCircuitBreaker(func=mock_fn, exceptions=(Exception,), threshold=3, delay=0.2)
+
+    async def scenario():
+        for i in range(3):
+            with pytest.raises(RemoteCallFailedException):
+                await cb.make_remote_call()
+        assert cb.state == StateChoices.OPEN
+
+        with pytest.raises(RemoteCallFailedException):
+            await cb.make_remote_call()
+        assert mock_fn.call_count == 3
+
+        await asyncio.sleep(0.3)
+        return await cb.make_remote_call()
+
+    assert asyncio.run(scenario()) == "success"
+    assert cb.state == StateChoices.CLOSED
+
+
+def test_open_circuit_serves_last_good_result():
+    """Test OPEN circuit answers with the last good result for the same arguments"""
+    mock_fn = mock.Mock(side_effect=lambda url: {"url": url})
+    cb = CircuitBreaker(func=mock_fn, exceptions=(Exception,), threshold=2, delay=5, cache_size=10)
+
+    assert cb.make_remote_call("/a") == {"url": "/a"}
+    mock_fn.side_effect = Exception("Failed")
+    for _ in range(2):
+        with pytest.raises(RemoteCallFailedException):
+            cb.make_remote_call("/a")
+    assert cb.state == StateChoices.OPEN
+
+    start = time.monotonic()
+    assert cb.make_remote_call("/a") == {"url": "/a"}
+    assert time.monotonic() - start < 0.01
+    assert mock_fn.call_count == 3
+    assert cb.stale_served_count == 1
+
+    # no cached result and no fallback for other arguments
+    with pytest.raises(RemoteCallFailedException):
+        cb.make_remote_call("/b")
+
+
+def test_open_circuit_uses_fallback():
+    """Test OPEN circuit answers with fallback when there is no cached result"""
+    mock_fn = mock.Mock(side_effect=Exception("Failed"))
+    fallback = mock.Mock(return_value={"degraded": True})
+    cb = CircuitBreaker(func=mock_fn, exceptions=(Exception,), threshold=1, delay=5, fallback=fallback)
+
+    with pytest.raises(RemoteCallFailedException):
+        cb.make_remote_call("/a")
+
+    assert cb.make_remote_call("/a", timeout=1) == {"degraded": True}
+    fallback.assert_called_once_with("/a", timeout=1)
+    assert cb.fallback_count == 1
+
+
+def test_last_good_cache_is_bounded():
+    """Test last-known-good cache keeps only `cache_size` most recent results"""
+    cb = CircuitBreaker(func=lambda key: key, exceptions=(Exception,), threshold=1, delay=5, cache_size=2)
+
+    for key in ("a", "b", "c"):
+        cb.make_remote_call(key)
+    # unhashable arguments are simply not cached (nested lists and dicts are frozen by default_key)
+    cb.make_remote_call(bytearray(b"unhashable"))
+
+    assert len(cb._last_good) == 2
+    assert list(cb._last_good) == [(("b",), ()), (("c",), ())]
+
+
+def test_async_circuit_breaker_fallback():
+    """Test AsyncCircuitBreaker serves last good result and awaits async fallback"""
+    import asyncio
+    from stability_templates.patterns.circuit_breaker import AsyncCircuitBreaker
+
+    mock_fn = mock.AsyncMock(side_effect=["good", Exception("Failed")])
+    fallback = mock.AsyncMock(return_value="fallback")
+    cb = AsyncCircuitBreaker(func=mock_fn, exceptions=(Exception,), threshold=1, delay=5,
+                             cache_size=10, fallback=fallback)
+
+    async def scenario():
+        assert await cb.make_remote_call("a") == "good"
+        with pytest.raises(RemoteCallFailedException):
+            await cb.make_remote_call("b")
+        return await cb.make_remote_call("a"), await cb.make_remote_call("b")
+
+    assert asyncio.run(scenario()) == ("good", "fallback")
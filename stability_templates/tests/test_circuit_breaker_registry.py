@@ -0,0 +1,127 @@
+import time
+import pytest
+from unittest import mock
+from stability_templates.patterns.circuit_breaker import RemoteCallFailedException, StateChoices
+from stability_templates.patterns.circuit_breaker_registry import CircuitBreakerRegistry, host_key
+
+
+def test_host_key():
+    """Test that the default key ignores the URL path and query"""
+    assert host_key("http://localhost:8000/failure?x=1") == "http://localhost:8000"
+    assert host_key("https://api.example.com/v1/users") == "https://api.example.com"
+
+
+def test_breaker_per_host():
+    """Test that a failing host opens only its own breaker"""
+    def fake_request(url):
+        if "bad-host" in url:
+            raise Exception("Failed")
+        return "success"
+
+    registry = CircuitBreakerRegistry(
+        func=fake_request,
+        exceptions=(Exception,),
+        threshold=3,
+        delay=5
+    )
+
+    for i in range(3):
+        with pytest.raises(RemoteCallFailedException):
+            registry.make_remote_call(f"http://bad-host/item/{i}")
+
+    # different paths on the same host share the open breaker
+    with pytest.raises(RemoteCallFailedException, match="Retry after"):
+        registry.make_remote_call("http://bad-host/other")
+
+    assert registry.make_remote_call("http://good-host/item") == "success"
+    print(f"\nStates: {registry.states()}")
+    assert registry.states() == {
+        "http://bad-host": StateChoices.OPEN,
+        "http://good-host": StateChoices.CLOSED,
+    }
+
+
+def test_custom_key_func():
+    """Test registry with a user key function"""
+    mock_fn = mock.Mock(side_effect=Exception("Failed"))
+    registry = CircuitBreakerRegistry(
+        func=mock_fn,
+        exceptions=(Exception,),
+        threshold=1,
+        delay=5,
+        key_func=lambda url, tenant: tenant
+    )
+
+    with pytest.raises(RemoteCallFailedException):
+        registry.make_remote_call("http://host/a", tenant="t1")
+
+    assert registry.get("t1").state == StateChoices.OPEN
+    assert registry.get("t2").state == StateChoices.CLOSED
+
+
+def test_idle_breakers_evicted():
+    """Test that idle CLOSED breakers are removed and OPEN ones are kept"""
+    def fake_request(url):
+        if "bad-host" in url:
+            raise Exception("Failed")
+        return "success"
+
+    registry = CircuitBreakerRegistry(
+        func=fake_request,
+        exceptions=(Exception,),
+        threshold=1,
+        delay=5,
+        idle_timeout=0.1
+    )
+
+    registry.make_remote_call("http://host-1/")
+    registry.make_remote_call("http://host-2/")
+    with pytest.raises(RemoteCallFailedException):
+        registry.make_remote_call("http://bad-host/")
+
+    time.sleep(0.15)
+    registry.make_remote_call("http://host-3/")
+
+    assert set(registry.states()) == {"http://bad-host", "http://host-3"}
+
+
+def test_max_breakers():
+    """Test that the number of breakers is bounded"""
+    registry = CircuitBreakerRegistry(
+        func=lambda url: "success",
+        exceptions=(Exception,),
+        threshold=3,
+        delay=5,
+        max_breakers=100
+    )
+
+    for i in range(1000):
+        registry.make_remote_call(f"http://host-{i}/")
+
+    assert len(registry) <= 100
+
+
+def test_concurrent_lookup_creates_one_breaker():
+    """Test that concurrent first calls for a key share one breaker"""
+    from threading import Thread, Barrier
+
+    registry = CircuitBreakerRegistry(
+        func=lambda url: "success",
+        exceptions=(Exception,),
+        threshold=3,
+        delay=5
+    )
+    barrier = Barrier(32)
+    breakers = []
+
+    def worker():
+        barrier.wait()
+        breakers.append(registry.get("http://shared-host"))
+
+    threads = [Thread(target=worker) for _ in range(32)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(b) for b in breakers}) == 1
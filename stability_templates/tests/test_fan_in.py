@@ -115,4 +115,355 @@ def test_fan_in_performance_comparison():
 
     assert len(results_seq) == tasks_count
     assert len(results_par) == tasks_count
-    assert duration_par < duration_seq
\ No newline at end of file
+    assert duration_par < duration_seq
+
+def test_async_fan_in_many_sources():
+    """Тест: AsyncFanIn обслуговує тисячу джерел в одному потоці"""
+    import asyncio
+    import threading
+    from stability_templates.patterns.concurrency_templates.fan_in import AsyncFanIn
+
+    print("\n=== Async Fan-In 1000 Sources Test ===")
+
+    async def make_source(i):
+        async def source():
+            await asyncio.sleep(0.2)
+            return i
+        return source
+
+    async def scenario():
+        sources = [await make_source(i) for i in range(1000)]
+        threads_before = threading.active_count()
+        results = await AsyncFanIn(sources).collect()
+        return results, threading.active_count() - threads_before
+
+    start = time.perf_counter()
+    results, new_threads = asyncio.run(scenario())
+    duration = time.perf_counter() - start
+
+    print(f"✓ Collected {len(results)} results in {duration:.4f}s, new threads: {new_threads}")
+    assert sorted(r[1] for r in results) == list(range(1000))
+    assert new_threads == 0
+    assert duration < 1.0
+
+
+def test_async_fan_in_bounded_concurrency():
+    """Тест: max_concurrency обмежує кількість одночасних викликів"""
+    import asyncio
+    from stability_templates.patterns.concurrency_templates.fan_in import AsyncFanIn
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def source():
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return "ok"
+
+    async def failing():
+        raise ValueError("Source failed")
+
+    results = asyncio.run(AsyncFanIn([source] * 50 + [failing], max_concurrency=5).collect())
+
+    errors = [r for r in results if r[2] is not None]
+    assert len(results) == 51
+    assert len(errors) == 1 and errors[0][0] == 50
+    assert max_in_flight == 5
+
+
+def test_async_fan_in_with_server(server_url, mock_service):
+    """Тест з реальними асинхронними HTTP запитами"""
+    pytest.importorskip("aiohttp")
+    import asyncio
+    from stability_templates.patterns.concurrency_templates.fan_in import AsyncFanIn
+    from stability_templates.utils.http_client import AsyncHTTPClient, make_request_async
+
+    async def scenario():
+        client = AsyncHTTPClient(limit_per_host=10)
+        sources = [lambda: make_request_async(f"{server_url}/success", client=client)] * 20
+        try:
+            return await AsyncFanIn(sources, max_concurrency=10).collect()
+        finally:
+            await client.close()
+
+    results = asyncio.run(scenario())
+
+    print(f'\n✓ Async Fan-In HTTP Results: {len(results)}')
+    assert len(results) == 20
+    assert all(error is None and result["msg"] == "Success" for _, result, error in results)
+
+
+def test_fan_in_stream_yields_as_completed():
+    """Тест: stream віддає результат найшвидшого джерела, не чекаючи повільних"""
+    def make_source(delay, value):
+        def source():
+            time.sleep(delay)
+            return value
+        return source
+
+    fan_in = FanIn([make_source(0.5, "slow"), make_source(0.05, "fast")])
+
+    start = time.perf_counter()
+    stream = fan_in.stream()
+    first = next(stream)
+    first_after = time.perf_counter() - start
+    rest = list(stream)
+
+    print(f"\n✓ First result {first} after {first_after:.4f}s")
+    assert first == (1, "fast", None)
+    assert first_after < 0.3
+    assert rest == [(0, "slow", None)]
+
+
+def test_fan_in_stream_deadline():
+    """Тест: джерела, що не встигли до deadline, повертаються з TimeoutException"""
+    from stability_templates.patterns.timeout import TimeoutException
+
+    def fast():
+        return "fast"
+
+    def slow():
+        time.sleep(1)
+        return "slow"
+
+    start = time.perf_counter()
+    results = FanIn([slow, fast, slow]).collect(deadline=0.2)
+    duration = time.perf_counter() - start
+
+    assert duration < 0.5
+    assert results[0] == (1, "fast", None)
+    assert [r[0] for r in results[1:]] == [0, 2]
+    assert all(isinstance(r[2], TimeoutException) for r in results[1:])
+
+
+def test_fan_in_concurrent_collects_do_not_mix():
+    """Тест: паралельні collect на одному FanIn отримують лише свої результати"""
+    from threading import Thread
+
+    fan_in = FanIn([lambda x: x, lambda x: x * 10])
+    outputs = {}
+
+    def run(x):
+        outputs[x] = sorted(r[1] for r in fan_in.collect(x))
+
+    threads = [Thread(target=run, args=(x,)) for x in range(1, 21)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert outputs == {x: [x, x * 10] for x in range(1, 21)}
+
+
+def test_async_fan_in_stream_deadline():
+    """Тест: асинхронний stream віддає результати по мірі готовності і скасовує джерела після deadline"""
+    import asyncio
+    from stability_templates.patterns.concurrency_templates.fan_in import AsyncFanIn
+    from stability_templates.patterns.timeout import TimeoutException
+
+    cancelled = []
+
+    async def fast():
+        await asyncio.sleep(0.01)
+        return "fast"
+
+    async def slow():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return "slow"
+
+    async def scenario():
+        results = [item async for item in AsyncFanIn([slow, fast]).stream(deadline=0.1)]
+        await asyncio.sleep(0)
+        return results
+
+    results = asyncio.run(scenario())
+
+    assert results[0] == (1, "fast", None)
+    assert results[1][0] == 0 and isinstance(results[1][2], TimeoutException)
+    assert cancelled == [True]
+
+
+def make_replica(delay, value, error=None):
+    """Репліка з фіксованою затримкою, що повертає value або кидає error"""
+    def replica():
+        time.sleep(delay)
+        if error is not None:
+            raise error
+        return value
+    return replica
+
+
+def test_fan_in_first_success():
+    """Тест: first_success повертає першу успішну відповідь, пропускаючи помилки"""
+    fan_in = FanIn([
+        make_replica(0.5, "slow"),
+        make_replica(0.01, None, ValueError("replica down")),
+        make_replica(0.05, "fast"),
+    ])
+
+    start = time.perf_counter()
+    result = fan_in.first_success()
+    duration = time.perf_counter() - start
+
+    assert result == "fast"
+    assert duration < 0.3
+
+
+def test_fan_in_first_k():
+    """Тест: first_k повертає k найшвидших успішних відповідей"""
+    fan_in = FanIn([make_replica(0.5, "a"), make_replica(0.01, "b"), make_replica(0.05, "c")])
+
+    results = fan_in.first_k(2)
+
+    assert [(source_id, result) for source_id, result, _ in results] == [(1, "b"), (2, "c")]
+    with pytest.raises(ValueError):
+        fan_in.first_k(4)
+
+
+def test_fan_in_quorum_not_reached():
+    """Тест: QuorumNotReached, щойно кворум стає недосяжним"""
+    from stability_templates.patterns.concurrency_templates.fan_in import QuorumNotReached
+
+    fan_in = FanIn([
+        make_replica(0.01, None, ValueError("down")),
+        make_replica(0.02, None, ValueError("down")),
+        make_replica(1.0, "late"),
+    ])
+
+    start = time.perf_counter()
+    with pytest.raises(QuorumNotReached) as exc_info:
+        fan_in.first_k(2)
+    duration = time.perf_counter() - start
+
+    assert duration < 0.5
+    assert len(exc_info.value.results) == 2
+
+
+def test_fan_in_majority():
+    """Тест: majority повертає значення, з яким погодилась більшість"""
+    from stability_templates.patterns.concurrency_templates.fan_in import QuorumNotReached
+
+    fan_in = FanIn([
+        make_replica(0.01, {"version": 2, "value": "new"}),
+        make_replica(0.02, {"version": 1, "value": "old"}),
+        make_replica(0.03, {"version": 2, "value": "new"}),
+        make_replica(0.04, {"version": 2, "value": "new"}),
+        make_replica(1.0, {"version": 1, "value": "old"}),
+    ])
+
+    start = time.perf_counter()
+    result = fan_in.majority(key=lambda record: record["version"])
+    duration = time.perf_counter() - start
+
+    assert result == {"version": 2, "value": "new"}
+    assert duration < 0.5
+
+    split = FanIn([make_replica(0.01, "a"), make_replica(0.01, "b"), make_replica(0.01, "c")])
+    with pytest.raises(QuorumNotReached):
+        split.majority()
+
+    with pytest.raises(QuorumNotReached):
+        FanIn([make_replica(1.0, "a")] * 3).majority(deadline=0.1)
+
+
+def test_fan_in_quorum_latency_comparison():
+    """
+    Тест-порівняння: затримка replicated read - усі репліки vs більшість vs перша відповідь
+    """
+    import random
+
+    rng = random.Random(7)
+    replicas = 5
+    trials = 20
+
+    def replica():
+        # зрідка репліка "відстає"
+        time.sleep(0.2 if rng.random() < 0.1 else rng.uniform(0.005, 0.02))
+        return "value"
+
+    fan_in = FanIn([replica] * replicas)
+    timings = {"collect": [], "majority": [], "first_success": []}
+    for _ in range(trials):
+        for mode, run in (("collect", fan_in.collect), ("majority", fan_in.majority),
+                          ("first_success", fan_in.first_success)):
+            start = time.perf_counter()
+            run()
+            timings[mode].append(time.perf_counter() - start)
+
+    print(f"\n=== Replicated read, {replicas} replicas, {trials} trials ===")
+    for mode, values in timings.items():
+        values.sort()
+        print(f"{mode:14s}: median {values[len(values) // 2] * 1000:.1f} ms, max {values[-1] * 1000:.1f} ms")
+
+    assert sum(timings["first_success"]) < sum(timings["collect"])
+    assert sum(timings["majority"]) < sum(timings["collect"])
+
+
+def test_fan_in_backpressure_on_bounded_pool():
+    """Тест: повна черга пулу - джерело повертається з PoolFullException або submit чекає на місце"""
+    from stability_templates.patterns.concurrency_templates.worker_pool import WorkerPool, PoolFullException
+
+    def source():
+        time.sleep(0.05)
+        return "ok"
+
+    rejecting = WorkerPool(max_workers=1, max_queue=1)
+    results = FanIn([source] * 4, executor=rejecting).collect()
+    errors = [r for r in results if isinstance(r[2], PoolFullException)]
+    assert len(results) == 4
+    assert 1 <= len(errors) <= 3
+    rejecting.shutdown()
+
+    blocking = WorkerPool(max_workers=1, max_queue=1, submit_timeout=None)
+    results = FanIn([source] * 4, executor=blocking).collect()
+    assert [r[1] for r in results] == ["ok"] * 4
+    blocking.shutdown()
+
+
+def test_fan_in_of_timeouts_does_not_starve_pool():
+    """Тест: FanIn з джерелами Timeout не займає потоки, на які чекають самі Timeout"""
+    from threading import Event, Timer
+    from stability_templates.patterns.timeout import Timeout
+
+    def fast():
+        time.sleep(0.01)
+        return "ok"
+
+    timeout = Timeout(fast, 1.0)
+    gate = Event()
+
+    def source():
+        # усі джерела спершу займають потоки свого пулу, і лише потім подають задачі Timeout
+        gate.wait()
+        return timeout.call()
+
+    Timer(0.2, gate.set).start()
+    start = time.monotonic()
+    results = FanIn([source] * 80).collect()
+    elapsed = time.monotonic() - start
+
+    print(f"\n80 Timeout sources: {elapsed:.2f}s")
+    assert [r[2] for r in results] == [None] * 80
+    assert elapsed < 1.2
+
+
+def test_nested_fan_in_on_small_pool():
+    """Тест: вкладений FanIn у тому ж пулі не блокується, коли всі потоки чекають на нього"""
+    from stability_templates.patterns.concurrency_templates.worker_pool import WorkerPool
+
+    pool = WorkerPool(max_workers=2)
+    inner = FanIn([lambda: 1, lambda: 2], executor=pool)
+    outer = FanIn([lambda: sum(r[1] for r in inner.collect())] * 4, executor=pool)
+
+    results = outer.collect(deadline=2.0)
+
+    assert [r[1] for r in results] == [3] * 4
+    assert pool.stats()["caller_runs"] > 0
+    pool.shutdown()
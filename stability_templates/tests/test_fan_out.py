@@ -1,6 +1,11 @@
 import pytest
 from unittest import mock
 from stability_templates.patterns.concurrency_templates.fan_out import FanOut
+from stability_templates.patterns.concurrency_templates.chunking import (
+    CountChunker,
+    ByteSizeChunker,
+    AdaptiveChunker
+)
 
 
 def test_fan_out_distribution():
@@ -102,4 +107,339 @@ def test_fan_out_performance_comparison():
     assert len(results_seq) == 3
     assert len(results_par) == 3
 
-    assert duration_par < duration_seq
\ No newline at end of file
+    assert duration_par < duration_seq
+
+def test_fan_out_on_bounded_executor():
+    """Тест: обробники виконуються у переданому пулі, нові потоки не створюються на кожен виклик"""
+    import threading
+    from stability_templates.patterns.concurrency_templates.worker_pool import WorkerPool
+
+    pool = WorkerPool(max_workers=4, name="fan-out-pool")
+    fan_out = FanOut([lambda data: data + 1, lambda data: data * 2, lambda data: data - 1], executor=pool)
+
+    fan_out.distribute(0)
+    threads_before = threading.active_count()
+    for i in range(200):
+        results = fan_out.distribute(i)
+        assert sorted(r[1] for r in results) == sorted([i + 1, i * 2, i - 1])
+    new_threads = threading.active_count() - threads_before
+
+    stats = pool.stats()
+    print(f"\n✓ Pool stats after 200 distributions: {stats}, new threads: {new_threads}")
+    assert stats["workers"] <= 4
+    assert new_threads <= 4 - 1
+    pool.shutdown()
+
+
+def test_fan_out_with_concurrent_futures_executor():
+    """Тест: підтримується будь-який concurrent.futures.Executor"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    def failing(data):
+        raise ValueError("Handler failed")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = FanOut([lambda data: data.upper(), failing], executor=executor).distribute("event")
+
+    results.sort(key=lambda r: r[0])
+    assert results[0] == (0, "EVENT", None)
+    assert isinstance(results[1][2], ValueError)
+
+
+def test_fan_out_executor_vs_thread_per_handler():
+    """
+    Тест-порівняння: накладні витрати Thread на кожен обробник vs спільний пул
+    """
+    import time
+    from threading import Thread
+    from stability_templates.patterns.concurrency_templates.worker_pool import WorkerPool
+
+    handlers = [lambda data: data] * 8
+    calls = 300
+
+    start = time.perf_counter()
+    for i in range(calls):
+        threads = [Thread(target=handler, args=(i,)) for handler in handlers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    thread_duration = time.perf_counter() - start
+
+    pool = WorkerPool(max_workers=8)
+    fan_out = FanOut(handlers, executor=pool)
+    start = time.perf_counter()
+    for i in range(calls):
+        fan_out.distribute(i)
+    pool_duration = time.perf_counter() - start
+    pool.shutdown()
+
+    print(f"\n--- {calls} fan-outs to {len(handlers)} handlers ---")
+    print(f"Thread per handler: {thread_duration * 1000 / calls:.3f} ms per call")
+    print(f"Worker pool:        {pool_duration * 1000 / calls:.3f} ms per call")
+    print(f"Speedup:            {thread_duration / pool_duration:.2f}x")
+
+
+# обробники для пулу процесів мають бути функціями рівня модуля (pickle)
+def count_high_bytes(view):
+    """CPU-bound обробник: рахує байти > 127 у payload"""
+    return sum(1 for byte in view[::8] if byte > 127)
+
+
+def payload_type(data):
+    return type(data).__name__, len(data)
+
+
+def keep_view(view):
+    global _kept_view
+    _kept_view = view[:10]
+    return len(view)
+
+
+def failing_handler(data):
+    raise ValueError("Handler failed")
+
+
+def test_process_fan_out_shares_payload():
+    """Тест: з ProcessPoolExecutor обробники отримують memoryview на shared memory"""
+    from concurrent.futures import ProcessPoolExecutor
+
+    payload = bytes(range(256)) * 4
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        fan_out = FanOut([payload_type, count_high_bytes, failing_handler, keep_view], executor=executor)
+        results = sorted(fan_out.distribute(payload), key=lambda r: r[0])
+
+        # не-буферні дані пакуються один раз і розпаковуються в обробнику
+        objects = FanOut([payload_type], executor=executor).distribute({"key": "value"})
+
+    assert results[0][1] == ("memoryview", 1024)
+    assert results[1][1] == count_high_bytes(payload)
+    assert isinstance(results[2][2], ValueError)
+    assert results[3][1] == 1024
+    assert objects == [(0, ("dict", 1), None)]
+
+
+def view_layout(view):
+    return view.format, view.shape, view.tolist()
+
+
+def test_process_fan_out_keeps_typed_payload():
+    """Тест: типізований масив у процесі пулу - той самий format і shape, що й у потоках"""
+    from array import array
+    from concurrent.futures import ProcessPoolExecutor
+
+    payload = array('d', [1.5] * 8)
+    matrix = memoryview(array('i', range(6))).cast("B").cast("i", (2, 3))
+    thread_results = FanOut([sum]).distribute(payload)
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        process_results = FanOut([sum], executor=executor).distribute(payload)
+        layouts = FanOut([view_layout], executor=executor).distribute(matrix)
+
+    assert thread_results == process_results == [(0, 12.0, None)]
+    assert layouts == [(0, ("i", (2, 3), [[0, 1, 2], [3, 4, 5]]), None)]
+
+
+def test_process_fan_out_scaling_benchmark():
+    """
+    Тест-порівняння: CPU-bound обробники на потоках (GIL) vs процеси з shared memory,
+    а також передача великого payload у процеси: pickle на кожен обробник vs shared memory
+    """
+    import os
+    import time
+    from concurrent.futures import ProcessPoolExecutor
+
+    cores = os.cpu_count() or 1
+    handlers_count = max(2, min(cores, 4))
+    payload = os.urandom(8 * 1024 * 1024)
+
+    start = time.perf_counter()
+    thread_results = FanOut([count_high_bytes] * handlers_count).distribute(payload)
+    thread_duration = time.perf_counter() - start
+
+    with ProcessPoolExecutor(max_workers=handlers_count) as executor:
+        # прогрів: процеси пулу створюються при першому submit
+        list(executor.map(len, [b""] * handlers_count))
+
+        start = time.perf_counter()
+        process_results = FanOut([count_high_bytes] * handlers_count, executor=executor).distribute(payload)
+        process_duration = time.perf_counter() - start
+
+        large = os.urandom(64 * 1024 * 1024)
+        start = time.perf_counter()
+        list(executor.map(len, [large] * handlers_count))
+        pickled_transfer = time.perf_counter() - start
+
+        start = time.perf_counter()
+        FanOut([len] * handlers_count, executor=executor).distribute(large)
+        shared_transfer = time.perf_counter() - start
+
+    print(f"\n--- {handlers_count} CPU-bound handlers, {cores} cores ---")
+    print(f"Threads (GIL):            {thread_duration:.4f}s")
+    print(f"Processes + shared memory: {process_duration:.4f}s ({thread_duration / process_duration:.2f}x)")
+    print(f"--- 64 MB payload to {handlers_count} processes ---")
+    print(f"Pickle per handler: {pickled_transfer:.4f}s")
+    print(f"Shared memory once: {shared_transfer:.4f}s ({pickled_transfer / shared_transfer:.2f}x)")
+
+    assert sorted(r[1] for r in process_results) == sorted(r[1] for r in thread_results)
+    assert shared_transfer < pickled_transfer
+    if cores >= 2:
+        assert process_duration < thread_duration
+
+
+def sum_chunk(chunk):
+    return sum(chunk)
+
+
+def test_fan_out_scatter_merges_in_order():
+    """Тест: scatter віддає результати частин строго по порядку, навіть якщо вони завершились інакше"""
+    import time
+
+    def slow_first(chunk):
+        if chunk[0] == 0:
+            time.sleep(0.2)
+        return sum(chunk)
+
+    fan_out = FanOut([slow_first] * 4)
+    results = fan_out.gather(list(range(100)), chunker=CountChunker(chunk_size=10))
+
+    assert [r[0] for r in results] == list(range(10))
+    assert [r[1] for r in results] == [sum(range(i, i + 10)) for i in range(0, 100, 10)]
+
+
+def test_fan_out_scatter_streams_first_chunk_early():
+    """Тест: перша частина віддається, не чекаючи повільніших наступних"""
+    import time
+
+    def slow_tail(chunk):
+        if chunk[0] != 0:
+            time.sleep(0.5)
+        return len(chunk)
+
+    start = time.perf_counter()
+    first = next(FanOut([slow_tail] * 3).scatter(list(range(30)), chunker=CountChunker(chunks=3)))
+    assert first == (0, 10, None)
+    assert time.perf_counter() - start < 0.3
+
+
+def test_fan_out_scatter_reports_chunk_errors():
+    """Тест: помилка частини повертається на її місці"""
+    def failing_on_second(chunk):
+        if chunk[0] == 5:
+            raise ValueError("bad chunk")
+        return len(chunk)
+
+    results = FanOut([failing_on_second]).gather(list(range(15)), chunker=CountChunker(chunk_size=5))
+
+    assert results[0] == (0, 5, None)
+    assert isinstance(results[1][2], ValueError)
+    assert results[2] == (2, 5, None)
+
+
+def test_process_fan_out_scatter_shares_buffer_once():
+    """Тест: у пулі процесів частини буфера передаються як view на спільну пам'ять"""
+    from concurrent.futures import ProcessPoolExecutor
+
+    payload = bytes(range(256)) * 64
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        fan_out = FanOut([sum_chunk, payload_type], executor=executor)
+        results = fan_out.gather(payload, chunker=ByteSizeChunker(max_bytes=4096))
+        records = FanOut([sum_chunk], executor=executor).gather(list(range(100)), chunker=CountChunker(chunk_size=30))
+
+    assert len(results) == 4
+    assert results[0][1] == sum(payload[:4096])
+    assert results[1][1] == ("memoryview", 4096)
+    assert [r[1] for r in records] == [sum(range(0, 30)), sum(range(30, 60)), sum(range(60, 90)), sum(range(90, 100))]
+
+
+def test_process_fan_out_scatter_keeps_typed_chunks():
+    """Тест: частини типізованого масиву однакові в потоках і в процесах"""
+    from array import array
+    from concurrent.futures import ProcessPoolExecutor
+
+    payload = array('d', [1.5] * 16)
+    matrix = memoryview(array('i', range(12))).cast("B").cast("i", (4, 3))
+    chunker = CountChunker(chunk_size=4)
+    thread_results = FanOut([sum_chunk]).gather(payload, chunker=chunker)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        process_results = FanOut([sum_chunk], executor=executor).gather(payload, chunker=chunker)
+        rows = FanOut([view_layout], executor=executor).gather(matrix, chunker=CountChunker(chunk_size=3))
+
+    assert thread_results == process_results == [(i, 6.0, None) for i in range(4)]
+    assert rows == [
+        (0, ("i", (3, 3), [[0, 1, 2], [3, 4, 5], [6, 7, 8]]), None),
+        (1, ("i", (1, 3), [[9, 10, 11]]), None),
+    ]
+
+
+def test_process_fan_out_scatter_unsupported_buffer_format():
+    """Тест: буфер, формат якого не відновити через memoryview.cast, іде в процеси як data[start:end]"""
+    from array import array
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = FanOut([payload_type, payload_type], executor=executor).gather(
+            array('u', 'hello world'), chunker=CountChunker(chunk_size=4)
+        )
+
+    assert results == [(0, ("array", 4), None), (1, ("array", 4), None), (2, ("array", 3), None)]
+
+
+def test_fan_out_scatter_buffer_chunks_are_memoryviews():
+    """Тест: частини bytes у потоках - memoryview без копіювання, як і в процесах"""
+    results = FanOut([payload_type]).gather(b"hello world", chunker=CountChunker(chunk_size=6))
+    words = FanOut([lambda chunk: bytes(chunk).decode().strip()]).gather(b"hello world", chunker=CountChunker(chunk_size=6))
+
+    assert results == [(0, ("memoryview", 6), None), (1, ("memoryview", 5), None)]
+    assert [r[1] for r in words] == ["hello", "world"]
+
+
+def test_fan_out_scatter_adaptive_chunking():
+    """Тест: адаптивне розбиття збільшує частини для швидкого обробника"""
+    import time
+
+    def handler(chunk):
+        time.sleep(0.0001 * len(chunk))
+        return len(chunk)
+
+    chunker = AdaptiveChunker(target_seconds=0.02, initial_size=10)
+    results = FanOut([handler] * 2).gather(list(range(5000)), chunker=chunker)
+
+    sizes = [r[1] for r in results]
+    print(f"\n✓ Adaptive chunk sizes: {sizes[:3]} ... {sizes[-3:]} ({len(sizes)} chunks)")
+    assert sum(sizes) == 5000
+    assert max(sizes) > 10 * 5
+
+
+def test_fan_out_scatter_vs_broadcast_scaling():
+    """
+    Тест-порівняння: broadcast (кожен обробник отримує весь набір) vs scatter
+    на 1, 2, 4, 8 воркерах; обробка одного елемента - 0.1 мс I/O
+    """
+    import time
+    from stability_templates.patterns.concurrency_templates.worker_pool import WorkerPool
+
+    items = list(range(4000))
+
+    def handler(chunk):
+        time.sleep(0.0001 * len(chunk))
+        return len(chunk)
+
+    print(f"\n--- {len(items)} items ---")
+    durations = {}
+    for workers in (1, 2, 4, 8):
+        pool = WorkerPool(max_workers=workers)
+        fan_out = FanOut([handler] * workers, executor=pool)
+
+        start = time.perf_counter()
+        fan_out.distribute(items)
+        broadcast = time.perf_counter() - start
+
+        start = time.perf_counter()
+        processed = sum(r[1] for r in fan_out.scatter(items, chunker=CountChunker(chunks=workers * 4)))
+        durations[workers] = time.perf_counter() - start
+        pool.shutdown()
+
+        print(f"{workers} workers: broadcast {broadcast:.3f}s ({workers}x work), scatter {durations[workers]:.3f}s")
+        assert processed == len(items)
+
+    assert durations[8] < durations[1] / 2
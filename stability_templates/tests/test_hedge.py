@@ -0,0 +1,207 @@
+import asyncio
+import random
+import time
+import pytest
+from itertools import count
+from unittest import mock
+from stability_templates.patterns.hedge import Hedge, AsyncHedge, LatencyTracker
+from stability_templates.patterns.retry import Retry, RetryBudget
+from stability_templates.patterns.circuit_breaker import CircuitBreaker, RemoteCallFailedException
+from stability_templates.utils.http_client import make_request
+
+
+def straggler_on_first_call(delay):
+    """Функція, перший виклик якої 'зависає' на delay секунд, а решта відповідають одразу"""
+    counter = count()
+
+    def func():
+        attempt = next(counter)
+        if attempt == 0:
+            time.sleep(delay)
+            return "slow"
+        return "fast"
+
+    return func
+
+
+def test_hedge_fast_call_is_not_hedged():
+    """Тест: швидка відповідь не породжує резервного запиту"""
+    mock_fn = mock.Mock(return_value="result")
+    hedge = Hedge(mock_fn, hedge_after=0.5)
+
+    assert hedge.call() == "result"
+    assert mock_fn.call_count == 1
+    assert hedge.stats()["hedged"] == 0
+
+
+def test_hedge_backup_request_wins():
+    """Тест: резервний запит відповідає швидше за повільний основний"""
+    hedge = Hedge(straggler_on_first_call(1.0), hedge_after=0.1)
+
+    start = time.monotonic()
+    result = hedge.call()
+    elapsed = time.monotonic() - start
+
+    stats = hedge.stats()
+    assert result == "fast"
+    assert elapsed < 0.5
+    assert stats["hedged"] == 1
+    assert stats["hedge_wins"] == 1
+
+
+def test_hedge_all_attempts_fail():
+    """Тест: якщо всі запити впали - піднімається виключення"""
+    hedge = Hedge(mock.Mock(side_effect=ValueError("boom")), hedge_after=0.1)
+
+    with pytest.raises(ValueError):
+        hedge.call()
+
+
+def test_hedge_waits_for_backup_after_primary_failure():
+    """Тест: помилка основного запиту не скасовує вже надісланий резервний"""
+    counter = count()
+
+    def func():
+        if next(counter) == 0:
+            time.sleep(0.2)
+            raise ValueError("primary failed")
+        time.sleep(0.3)
+        return "backup"
+
+    hedge = Hedge(func, hedge_after=0.05)
+    assert hedge.call() == "backup"
+
+
+def test_hedge_rate_is_capped_by_budget():
+    """Тест: частка резервних запитів обмежена бюджетом"""
+    budget = RetryBudget(ratio=0.1, min_retries_per_second=0, max_tokens=2)
+    budget.tokens = 0
+    hedge = Hedge(lambda: time.sleep(0.02), hedge_after=0.001, budget=budget)
+
+    for _ in range(50):
+        hedge.call()
+
+    stats = hedge.stats()
+    print(f"\nHedge stats: {stats}")
+    assert stats["hedged"] <= 5
+    assert stats["hedges_refused"] > 0
+    assert stats["hedge_rate"] <= 0.1
+
+
+def test_latency_tracker_percentile():
+    """Тест: перцентиль з'являється після min_samples вимірів"""
+    tracker = LatencyTracker(window_size=100, min_samples=10, recompute_every=1)
+
+    for i in range(9):
+        tracker.record(i / 100)
+    assert tracker.percentile(0.95) is None
+
+    for i in range(9, 100):
+        tracker.record(i / 100)
+    assert tracker.percentile(0.95) == pytest.approx(0.95)
+    assert tracker.percentile(0.5) == pytest.approx(0.5)
+
+
+def test_hedge_uses_tracked_percentile():
+    """Тест: без hedge_after поріг береться з p95 затримок"""
+    tracker = LatencyTracker(min_samples=5, recompute_every=1)
+    hedge = Hedge(lambda: time.sleep(0.01), tracker=tracker)
+
+    assert hedge.hedge_delay() is None
+    for _ in range(10):
+        hedge.call()
+    assert 0.005 < hedge.hedge_delay() < 0.1
+
+
+def test_hedge_with_circuit_breaker_and_retry():
+    """Тест: Hedge поєднується з CircuitBreaker і Retry"""
+    hedge = Hedge(straggler_on_first_call(1.0), hedge_after=0.1)
+    breaker = CircuitBreaker(hedge.call, exceptions=(ValueError,), threshold=3, delay=1)
+    retry = Retry(breaker.make_remote_call, max_attempts=2, delay=0.01,
+                  exceptions=(RemoteCallFailedException,))
+
+    assert retry.call() == "fast"
+
+    failing = Hedge(mock.Mock(side_effect=ValueError("down")), hedge_after=0.05)
+    breaker = CircuitBreaker(failing.call, exceptions=(ValueError,), threshold=2, delay=10)
+    for _ in range(2):
+        with pytest.raises(RemoteCallFailedException):
+            breaker.make_remote_call()
+    assert breaker.state == "open"
+
+
+def test_async_hedge_backup_request_wins():
+    """Тест: асинхронний Hedge скасовує запит, що програв"""
+    cancelled = []
+    counter = count()
+
+    async def func():
+        if next(counter) == 0:
+            try:
+                await asyncio.sleep(1.0)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return "slow"
+        return "fast"
+
+    hedge = AsyncHedge(func, hedge_after=0.05)
+
+    async def run():
+        result = await hedge.call()
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(run()) == "fast"
+    assert cancelled == [True]
+    assert hedge.stats()["hedge_wins"] == 1
+
+
+def test_hedge_against_slow_endpoint(server_url, mock_service):
+    """Тест: запит до /slow підміняється резервним запитом до швидкого ендпоінта"""
+    urls = iter([f"{server_url}/slow?delay=2", f"{server_url}/success"])
+    hedge = Hedge(lambda: make_request(next(urls), timeout=3), hedge_after=0.3)
+
+    start = time.monotonic()
+    result = hedge.call()
+    elapsed = time.monotonic() - start
+
+    assert result["msg"] == "Success"
+    assert elapsed < 1.5
+
+
+def test_hedge_tail_latency_comparison():
+    """
+    Тест-порівняння: p99 затримки без хеджування і з резервним запитом після p95
+    (5% викликів - "відстаючі" на 0.5с)
+    """
+    rng = random.Random(42)
+
+    def upstream():
+        time.sleep(0.5 if rng.random() < 0.05 else 0.005)
+        return "ok"
+
+    def measure(call, calls=150):
+        latencies = []
+        for _ in range(calls):
+            start = time.monotonic()
+            call()
+            latencies.append(time.monotonic() - start)
+        latencies.sort()
+        return latencies[int(0.99 * len(latencies))], sum(latencies) / len(latencies)
+
+    plain_p99, plain_mean = measure(upstream)
+
+    hedge = Hedge(upstream, percentile=0.9, max_hedge_ratio=0.2, tracker=LatencyTracker(min_samples=20, recompute_every=10))
+    hedge.budget.tokens = 10
+    for _ in range(30):
+        hedge.call()
+    hedged_p99, hedged_mean = measure(hedge.call)
+
+    print("\n=== Tail latency: plain vs hedged ===")
+    print(f"plain : p99 {plain_p99 * 1000:.1f} ms, mean {plain_mean * 1000:.1f} ms")
+    print(f"hedged: p99 {hedged_p99 * 1000:.1f} ms, mean {hedged_mean * 1000:.1f} ms")
+    print(f"Hedge stats: {hedge.stats()}")
+
+    assert hedged_p99 < plain_p99
+    assert hedge.stats()["hedge_rate"] <= 0.25
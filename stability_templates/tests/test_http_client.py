@@ -0,0 +1,123 @@
+import pytest
+from unittest import mock
+from stability_templates.utils.http_client import (
+    PooledHTTPClient,
+    make_request,
+    get_default_client
+)
+
+
+def test_make_request_uses_given_client():
+    """Тест: make_request відправляє запит через переданий клієнт"""
+    response = mock.Mock(status_code=200, content=b'{"msg": "Success"}')
+    client = mock.Mock()
+    client.get.return_value = response
+
+    result = make_request("http://localhost:8000/success", timeout=2.0, client=client)
+
+    assert result == {"msg": "Success"}
+    client.get.assert_called_once_with("http://localhost:8000/success", timeout=2.0)
+
+
+def test_default_client_is_shared():
+    """Тест: клієнт за замовчуванням один на процес"""
+    assert get_default_client() is get_default_client()
+
+
+def test_pooled_client_does_not_persist_cookies(server_url, mock_service):
+    """Тест: Set-Cookie від upstream не повертається в наступних запитах спільного клієнта"""
+    client = PooledHTTPClient()
+    client.get(f"{server_url}/cookies")
+
+    assert make_request(f"{server_url}/cookies", client=client) == {"cookies": {}}
+    # явно передані cookies працюють як і раніше
+    assert make_request(f"{server_url}/cookies", client=client, cookies={"a": "1"}) == {"cookies": {"a": "1"}}
+
+    persistent = PooledHTTPClient(persist_cookies=True)
+    persistent.get(f"{server_url}/cookies")
+    assert make_request(f"{server_url}/cookies", client=persistent) == {"cookies": {"session": "upstream-session"}}
+    client.close()
+    persistent.close()
+
+
+def test_pooled_client_reuses_connections(server_url, mock_service):
+    """Тест: послідовні запити до одного хоста перевикористовують з'єднання"""
+    client = PooledHTTPClient()
+
+    for _ in range(10):
+        make_request(f"{server_url}/success", client=client)
+
+    stats = client.stats()
+    print(f"\nPool stats: {stats}")
+    assert stats["requests"] == 10
+    assert stats["connections_opened"] == 1
+    assert stats["reused"] == 9
+    client.close()
+
+
+def test_pooled_client_concurrent(server_url, mock_service):
+    """Тест: пул з'єднань обмежений pool_maxsize при паралельних запитах"""
+    from stability_templates.patterns.concurrency_templates.fan_in import FanIn
+
+    client = PooledHTTPClient(pool_maxsize=4, pool_block=True)
+    sources = [lambda: make_request(f"{server_url}/success", client=client)] * 20
+
+    for _ in range(3):
+        results = FanIn(sources).collect()
+        assert all(error is None for _, _, error in results)
+
+    stats = client.stats()
+    print(f"\nPool stats: {stats}")
+    assert stats["requests"] == 60
+    assert stats["connections_opened"] <= 4
+    client.close()
+
+
+def test_pooled_client_performance_comparison(server_url, mock_service):
+    """
+    Тест-порівняння: нове з'єднання на кожен запит vs пул keep-alive з'єднань
+    """
+    import time
+    import requests
+
+    count = 50
+
+    start = time.perf_counter()
+    for _ in range(count):
+        requests.get(f"{server_url}/success", timeout=1.0)
+    duration_plain = time.perf_counter() - start
+
+    client = PooledHTTPClient()
+    start = time.perf_counter()
+    for _ in range(count):
+        client.get(f"{server_url}/success")
+    duration_pooled = time.perf_counter() - start
+
+    print(f"\nrequests.get: {duration_plain:.4f}s, pooled: {duration_pooled:.4f}s, "
+          f"stats: {client.stats()}")
+    assert client.stats()["connections_opened"] == 1
+    client.close()
+
+
+def test_make_request_async_errors(server_url, mock_service):
+    """Тест: make_request_async кидає виключення на 5xx, як і make_request"""
+    pytest.importorskip("aiohttp")
+    import asyncio
+    from stability_templates.utils.http_client import AsyncHTTPClient, make_request_async
+
+    async def scenario():
+        client = AsyncHTTPClient()
+        try:
+            ok = await make_request_async(f"{server_url}/health", client=client)
+            with pytest.raises(Exception, match="Server error: 500"):
+                await make_request_async(f"{server_url}/failure", timeout=5.0, client=client)
+            with pytest.raises(asyncio.TimeoutError):
+                await make_request_async(f"{server_url}/slow?delay=1", timeout=0.2, client=client)
+            # cookies від upstream не зберігаються в спільній сесії
+            await make_request_async(f"{server_url}/cookies", client=client)
+            assert await make_request_async(f"{server_url}/cookies", client=client) == {"cookies": {}}
+            return ok
+        finally:
+            await client.close()
+
+    assert asyncio.run(scenario()) == {"status": "healthy"}
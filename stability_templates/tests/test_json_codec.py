@@ -0,0 +1,120 @@
+import json
+import pytest
+from unittest import mock
+from stability_templates.utils.json_codec import (
+    StdlibJSONCodec,
+    CODECS,
+    get_codec,
+    get_default_codec,
+    set_default_codec
+)
+
+
+def make_payload(records):
+    """Реалістичний payload: список записів API"""
+    return {
+        "items": [
+            {
+                "id": i,
+                "name": f"user_{i}",
+                "email": f"user_{i}@example.com",
+                "active": i % 3 != 0,
+                "score": i * 1.5,
+                "tags": ["alpha", "beta", "gamma"][: i % 4],
+                "address": {"city": "Lviv", "zip": f"{79000 + i % 100}"},
+            }
+            for i in range(records)
+        ],
+        "total": records,
+    }
+
+
+@pytest.mark.parametrize("name", list(CODECS))
+def test_codec_roundtrip_bytes(name):
+    """Тест: кодек декодує байти без проміжного str і кодує у байти"""
+    codec = get_codec(name)
+    payload = make_payload(10)
+
+    encoded = codec.dumps(payload)
+
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == payload
+    assert codec.loads('{"a": "ї"}'.encode()) == {"a": "ї"}
+
+
+def test_stdlib_fallback_always_available():
+    """Тест: stdlib-кодек доступний завжди"""
+    assert "json" in CODECS
+    assert isinstance(get_codec("json"), StdlibJSONCodec)
+
+
+def test_unknown_codec():
+    """Тест: недоступний кодек"""
+    with pytest.raises(ValueError):
+        get_codec("simdjson-nonexistent")
+
+
+def test_set_default_codec():
+    """Тест: заміна кодека за замовчуванням"""
+    previous = get_default_codec()
+    try:
+        set_default_codec("json")
+        assert get_default_codec().name == "json"
+    finally:
+        set_default_codec(previous)
+
+
+def test_make_request_with_codec():
+    """Тест: make_request декодує тіло відповіді переданим кодеком"""
+    from stability_templates.utils.http_client import make_request
+
+    response = mock.Mock(status_code=200, content=b'{"msg": "Success"}')
+    client = mock.Mock()
+    client.get.return_value = response
+    codec = mock.Mock()
+    codec.loads.return_value = {"decoded": True}
+
+    assert make_request("http://host/", client=client, codec=codec) == {"decoded": True}
+    codec.loads.assert_called_once_with(b'{"msg": "Success"}')
+
+
+def test_server_uses_codec(server_url, mock_service):
+    """Тест: відповіді сервера коректно декодуються"""
+    from stability_templates.utils.http_client import make_request
+
+    assert make_request(f"{server_url}/health") == {"status": "healthy"}
+
+
+@pytest.mark.parametrize("records", [10, 1_000, 20_000])
+def test_codecs_performance_comparison(records):
+    """
+    Тест-порівняння: швидкість декодування/кодування payload різного розміру
+    """
+    import time
+
+    payload = make_payload(records)
+    raw = json.dumps(payload).encode()
+    repeats = max(1, 200_000 // records)
+
+    print(f"\n=== JSON codecs, payload {len(raw) / 1024:.1f} KB, {repeats} repeats ===")
+    durations = {}
+    for name in CODECS:
+        codec = get_codec(name)
+
+        start = time.perf_counter()
+        for _ in range(repeats):
+            codec.loads(raw)
+        decode = (time.perf_counter() - start) / repeats
+
+        start = time.perf_counter()
+        for _ in range(repeats):
+            codec.dumps(payload)
+        encode = (time.perf_counter() - start) / repeats
+
+        durations[name] = decode
+        print(f"{name:7s}: decode {decode * 1e3:.3f} ms ({len(raw) / decode / 1e6:.1f} MB/s), "
+              f"encode {encode * 1e3:.3f} ms")
+
+    if len(durations) > 1:
+        fastest = min(durations, key=durations.get)
+        print(f"Fastest decoder: {fastest} ({durations['json'] / durations[fastest]:.2f}x vs stdlib)")
@@ -0,0 +1,98 @@
+import time
+import pytest
+from unittest import mock
+from stability_templates.patterns.keyed_throttle import KeyedThrottle
+from stability_templates.patterns.throttle import ThrottledException
+
+
+def test_keyed_throttle_separate_limits():
+    """Тест: кожен ключ має власний ліміт"""
+    mock_fn = mock.Mock(return_value="success")
+    throttle = KeyedThrottle(mock_fn, calls_per_period=2, period=1.0)
+
+    throttle.call("tenant_a")
+    throttle.call("tenant_a")
+    with pytest.raises(ThrottledException) as exc_info:
+        throttle.call("tenant_a")
+
+    throttle.call("tenant_b")
+
+    assert 0 < exc_info.value.retry_after <= 0.5
+    assert throttle.get_remaining_calls("tenant_a") == 0
+    assert throttle.get_remaining_calls("tenant_b") == 1
+    assert mock_fn.call_count == 3
+
+
+def test_keyed_throttle_key_func():
+    """Тест: ключ обчислюється з аргументів виклику"""
+    mock_fn = mock.Mock(return_value="success")
+    throttle = KeyedThrottle(
+        mock_fn,
+        calls_per_period=1,
+        period=1.0,
+        key_func=lambda url, tenant: tenant
+    )
+
+    throttle.call("/a", tenant="t1")
+    throttle.call("/a", tenant="t2")
+    with pytest.raises(ThrottledException):
+        throttle.call("/b", tenant="t1")
+
+
+def test_keyed_throttle_recovers_after_period():
+    """Тест: ліміт ключа відновлюється"""
+    mock_fn = mock.Mock(return_value="success")
+    throttle = KeyedThrottle(mock_fn, calls_per_period=2, period=0.2)
+
+    throttle.call("key")
+    throttle.call("key")
+    with pytest.raises(ThrottledException):
+        throttle.call("key")
+
+    time.sleep(0.25)
+    throttle.call("key")
+    assert mock_fn.call_count == 3
+
+
+def test_keyed_throttle_memory_cap():
+    """Тест: кількість ключів обмежена max_keys (LRU)"""
+    throttle = KeyedThrottle(lambda key: key, calls_per_period=100, period=60.0,
+                             max_keys=1000, shards=4)
+
+    for i in range(10_000):
+        throttle.call(f"tenant_{i}")
+
+    print(f"\nKeys stored: {len(throttle)}, evicted: {throttle.evicted_count}")
+    assert len(throttle) <= 1000
+    assert throttle.evicted_count >= 9000
+
+
+def test_keyed_throttle_expired_keys_evicted():
+    """Тест: ключі, ліміт яких повністю відновився, прибираються"""
+    throttle = KeyedThrottle(lambda key: key, calls_per_period=10, period=0.1, shards=1)
+
+    for i in range(5):
+        throttle.call(f"idle_{i}")
+    time.sleep(0.15)
+
+    for i in range(5):
+        throttle.call("hot")
+
+    assert len(throttle) == 1
+
+
+def test_keyed_throttle_performance():
+    """
+    Тест-продуктивність: 200k викликів по 100k ключах
+    """
+    throttle = KeyedThrottle(lambda key: key, calls_per_period=10, period=1.0, max_keys=50_000)
+    keys = [f"tenant_{i % 100_000}" for i in range(200_000)]
+
+    start = time.perf_counter()
+    for key in keys:
+        throttle.call(key)
+    duration = time.perf_counter() - start
+
+    print(f"\n200k keyed calls: {duration:.4f}s ({duration / len(keys) * 1e6:.3f} us/call), "
+          f"keys stored: {len(throttle)}")
+    assert len(throttle) <= 50_000
@@ -0,0 +1,172 @@
+import time
+import pytest
+from threading import Thread, Event
+from unittest import mock
+from stability_templates.patterns.load_shedder import (
+    LoadShedder,
+    LoadShedException,
+    OVERLOAD,
+    EVICTED,
+    DEADLINE,
+    EXPIRED
+)
+
+
+def run_in_thread(shedder, *args, **kwargs):
+    """Запускає shedder.call у потоці; результат або виключення потрапляє в outcome"""
+    outcome = {}
+
+    def worker():
+        try:
+            outcome["result"] = shedder.call(*args, **kwargs)
+        except Exception as e:
+            outcome["error"] = e
+
+    thread = Thread(target=worker)
+    thread.start()
+    time.sleep(0.05)
+    return thread, outcome
+
+
+def test_load_shedder_runs_call_when_idle():
+    """Тест: без навантаження виклик виконується одразу"""
+    mock_fn = mock.Mock(return_value="result")
+    shedder = LoadShedder(mock_fn, max_concurrent=2)
+
+    assert shedder.call(1, priority='batch') == "result"
+    mock_fn.assert_called_once_with(1)
+    assert shedder.stats()["admitted"]["batch"] == 1
+
+
+def test_load_shedder_unknown_priority():
+    """Тест: невідомий пріоритет"""
+    shedder = LoadShedder(mock.Mock(), max_concurrent=1)
+
+    with pytest.raises(ValueError):
+        shedder.call(priority='urgent')
+
+
+def test_load_shedder_serves_higher_priority_first():
+    """Тест: звільнений слот отримує виклик з вищим пріоритетом, навіть якщо він прийшов пізніше"""
+    release = Event()
+    order = []
+
+    def func(name):
+        if name == "blocker":
+            release.wait()
+        order.append(name)
+
+    shedder = LoadShedder(func, max_concurrent=1, max_queued=10)
+    blocker, _ = run_in_thread(shedder, "blocker")
+    batch, _ = run_in_thread(shedder, "batch", priority='batch')
+    critical, _ = run_in_thread(shedder, "critical", priority='critical')
+
+    release.set()
+    for thread in (blocker, batch, critical):
+        thread.join()
+
+    assert order == ["blocker", "critical", "batch"]
+
+
+def test_load_shedder_evicts_lower_priority_when_queue_is_full():
+    """Тест: при повній черзі критичний виклик витісняє batch"""
+    release = Event()
+    shedder = LoadShedder(lambda: release.wait(), max_concurrent=1, max_queued=1)
+    blocker, _ = run_in_thread(shedder)
+    batch, batch_outcome = run_in_thread(shedder, priority='batch')
+    critical, critical_outcome = run_in_thread(shedder, priority='critical')
+
+    release.set()
+    for thread in (blocker, batch, critical):
+        thread.join()
+
+    assert batch_outcome["error"].reason == EVICTED
+    assert critical_outcome["result"] is True
+    assert shedder.stats()["shed"] == {"critical": 0, "default": 0, "batch": 1}
+
+
+def test_load_shedder_rejects_lowest_priority_when_queue_is_full():
+    """Тест: при повній черзі з важливішими викликами новий batch відкидається одразу"""
+    release = Event()
+    shedder = LoadShedder(lambda: release.wait(), max_concurrent=1, max_queued=1)
+    blocker, _ = run_in_thread(shedder)
+    queued, _ = run_in_thread(shedder, priority='critical')
+
+    with pytest.raises(LoadShedException) as exc_info:
+        shedder.call(priority='batch')
+
+    release.set()
+    for thread in (blocker, queued):
+        thread.join()
+
+    assert exc_info.value.reason == OVERLOAD
+    assert exc_info.value.priority == 'batch'
+
+
+def test_load_shedder_expires_waiting_call():
+    """Тест: виклик, чий deadline минув у черзі, відкидається"""
+    release = Event()
+    shedder = LoadShedder(lambda: release.wait(), max_concurrent=1, max_queued=10)
+    blocker, _ = run_in_thread(shedder)
+
+    start = time.monotonic()
+    with pytest.raises(LoadShedException) as exc_info:
+        shedder.call(deadline=0.2)
+    elapsed = time.monotonic() - start
+
+    release.set()
+    blocker.join()
+
+    assert exc_info.value.reason == EXPIRED
+    assert 0.15 < elapsed < 0.5
+    assert shedder.stats()["queued"] == 0
+
+
+def test_load_shedder_rejects_call_that_cannot_finish_in_time():
+    """Тест: виклик не ставиться в чергу, якщо за оцінкою часу виконання не встигне"""
+    release = Event()
+    shedder = LoadShedder(lambda: release.wait(), max_concurrent=1, max_queued=10)
+    shedder.service_time = 0.5
+    blocker, _ = run_in_thread(shedder)
+
+    start = time.monotonic()
+    with pytest.raises(LoadShedException) as exc_info:
+        shedder.call(deadline=0.3)
+    elapsed = time.monotonic() - start
+
+    release.set()
+    blocker.join()
+
+    assert exc_info.value.reason == DEADLINE
+    assert elapsed < 0.05
+
+
+def test_load_shedder_overload_by_priority():
+    """
+    Тест-симуляція: навантаження вдвічі перевищує пропускну здатність;
+    критичні виклики виконуються, batch відкидаються першими
+    """
+    shedder = LoadShedder(lambda: time.sleep(0.02), max_concurrent=4, max_queued=8)
+    priorities = ['critical', 'default', 'batch', 'batch']
+    outcomes = {priority: {"ok": 0, "shed": 0} for priority in shedder.PRIORITIES}
+
+    def client(priority):
+        for _ in range(25):
+            try:
+                shedder.call(priority=priority, deadline=0.2)
+                outcomes[priority]["ok"] += 1
+            except LoadShedException:
+                outcomes[priority]["shed"] += 1
+                time.sleep(0.01)
+
+    threads = [Thread(target=client, args=(priorities[i % len(priorities)],)) for i in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = shedder.stats()
+    print(f"\nOutcomes: {outcomes}\nShedder stats: {stats}")
+    assert outcomes["critical"]["ok"] / 100 > 0.9
+    assert stats["shed"]["batch"] > stats["shed"]["critical"]
+    assert stats["active"] == 0 and stats["queued"] == 0
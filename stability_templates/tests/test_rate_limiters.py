@@ -0,0 +1,297 @@
+import pytest
+from stability_templates.patterns.rate_limiters import (
+    SlidingLogLimiter,
+    TokenBucketLimiter,
+    GCRALimiter,
+    SlidingWindowCounterLimiter,
+    create_limiter,
+    LIMITERS,
+)
+
+
+@pytest.mark.parametrize("algorithm", list(LIMITERS))
+def test_limiter_allows_limited_calls(algorithm):
+    """Тест: кожен алгоритм пропускає calls_per_period викликів за раз"""
+    limiter = create_limiter(algorithm, calls_per_period=5, period=1.0)
+
+    for i in range(5):
+        assert limiter.try_acquire(100.0) == 0.0
+
+    wait_time = limiter.try_acquire(100.0)
+    print(f"\n{algorithm}: retry after {wait_time:.4f}s")
+    assert wait_time > 0
+
+
+@pytest.mark.parametrize("algorithm", list(LIMITERS))
+def test_limiter_retry_after_is_accurate(algorithm):
+    """Тест: після очікування retry_after виклик дозволено, а трохи раніше - ні"""
+    limiter = create_limiter(algorithm, calls_per_period=4, period=1.0)
+    now = 10.0
+
+    for i in range(4):
+        limiter.try_acquire(now)
+
+    wait_time = limiter.try_acquire(now)
+    assert wait_time > 0
+    assert limiter.try_acquire(now + wait_time * 0.9) > 0
+    assert limiter.try_acquire(now + wait_time) == 0.0
+
+
+@pytest.mark.parametrize("algorithm", list(LIMITERS))
+def test_limiter_remaining_and_reset(algorithm):
+    """Тест: підрахунок доступних викликів і скидання"""
+    limiter = create_limiter(algorithm, calls_per_period=5, period=1.0)
+
+    assert limiter.remaining(0.0) == 5
+    limiter.try_acquire(0.0)
+    assert limiter.remaining(0.0) == 4
+
+    limiter.reset()
+    assert limiter.remaining(0.0) == 5
+
+
+def test_token_bucket_refills_gradually():
+    """Тест: token bucket поповнюється пропорційно часу"""
+    limiter = TokenBucketLimiter(calls_per_period=10, period=1.0)
+    for i in range(10):
+        limiter.try_acquire(0.0)
+
+    assert limiter.remaining(0.0) == 0
+    assert limiter.remaining(0.5) == 5
+
+
+def test_gcra_paces_calls():
+    """Тест: GCRA після сплеску пропускає по одному виклику на інтервал"""
+    limiter = GCRALimiter(calls_per_period=10, period=1.0)
+    for i in range(10):
+        assert limiter.try_acquire(0.0) == 0.0
+
+    assert limiter.try_acquire(0.0) == pytest.approx(0.1)
+    assert limiter.try_acquire(0.1) == 0.0
+    assert limiter.try_acquire(0.1) == pytest.approx(0.1)
+
+
+def test_sliding_window_counter_weights_previous_window():
+    """Тест: попереднє вікно враховується пропорційно перекриттю"""
+    limiter = SlidingWindowCounterLimiter(calls_per_period=10, period=1.0)
+    for i in range(10):
+        limiter.try_acquire(0.0)
+
+    # 0.5s у новому вікні: 10 * 0.5 = 5 викликів ще "у вікні"
+    assert limiter.remaining(1.5) == 5
+
+
+def test_sliding_log_is_exact():
+    """Тест: ковзний журнал звільняє слот рівно через period після виклику"""
+    limiter = SlidingLogLimiter(calls_per_period=2, period=1.0)
+    limiter.try_acquire(0.0)
+    limiter.try_acquire(0.5)
+
+    assert limiter.try_acquire(0.9) == pytest.approx(0.1)
+    assert limiter.try_acquire(1.0) == 0.0
+
+
+def test_unknown_algorithm():
+    """Тест: невідомий алгоритм"""
+    with pytest.raises(ValueError):
+        create_limiter("leaky", calls_per_period=5, period=1.0)
+
+
+def test_limiters_performance_comparison():
+    """
+    Тест-порівняння: час на виклик при 50k викликів за період
+    """
+    import time
+
+    print("\n=== Rate Limiters Performance Comparison ===")
+    calls = 50_000
+    durations = {}
+
+    for algorithm in LIMITERS:
+        limiter = create_limiter(algorithm, calls_per_period=calls, period=1000.0)
+        start = time.perf_counter()
+        for i in range(calls):
+            limiter.try_acquire(i * 0.001)
+        durations[algorithm] = time.perf_counter() - start
+        print(f"{algorithm:15s}: {durations[algorithm] / calls * 1e6:.3f} us/call")
+
+    assert all(d < 5.0 for d in durations.values())
+
+
+def _shared_worker(name, directory, attempts, allowed):
+    from stability_templates.patterns.rate_limiters import SharedGCRALimiter
+    import time
+
+    limiter = SharedGCRALimiter(name, calls_per_period=50, period=100.0, directory=directory)
+    count = 0
+    for i in range(attempts):
+        if limiter.try_acquire(time.monotonic()) == 0.0:
+            count += 1
+    limiter.close()
+    allowed.put(count)
+
+
+def _shared_benchmark_worker(name, directory, calls, durations):
+    from stability_templates.patterns.rate_limiters import SharedGCRALimiter
+    import time
+
+    limiter = SharedGCRALimiter(name, calls_per_period=10 ** 9, period=1.0, directory=directory)
+    start = time.perf_counter()
+    for i in range(calls):
+        limiter.try_acquire(time.monotonic())
+    durations.put(time.perf_counter() - start)
+    limiter.close()
+
+
+def test_shared_limiter_across_processes(tmp_path):
+    """Тест: кілька процесів ділять один ліміт"""
+    import multiprocessing
+
+    allowed = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=_shared_worker, args=("shared_test", str(tmp_path), 100, allowed))
+        for _ in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    counts = [allowed.get() for _ in processes]
+    print(f"\nAllowed per process: {counts}")
+    assert sum(counts) == 50
+
+
+def test_shared_limiter_ignores_tat_from_older_clock(tmp_path):
+    """Тест: TAT далеко в майбутньому (файл пережив перезавантаження) не блокує довше за period"""
+    from stability_templates.patterns.rate_limiters import SharedGCRALimiter
+
+    limiter = SharedGCRALimiter("stale_tat", calls_per_period=2, period=10.0, directory=str(tmp_path))
+    limiter.tat = 10 ** 6 # monotonic() до перезавантаження
+
+    assert limiter.remaining(0.0) == 0
+    assert limiter.try_acquire(0.0) <= 10.0
+    assert limiter.try_acquire(5.0) == 0.0
+    assert limiter.try_acquire(10.0) == 0.0
+    limiter.close()
+    limiter.unlink()
+
+
+def test_shared_limiter_with_throttle(tmp_path):
+    """Тест: Throttle з SharedGCRALimiter - два екземпляри ділять ліміт"""
+    from unittest import mock
+    from stability_templates.patterns.rate_limiters import SharedGCRALimiter
+    from stability_templates.patterns.throttle import Throttle, ThrottledException
+
+    mock_fn = mock.Mock(return_value="success")
+    throttles = [
+        Throttle(mock_fn, calls_per_period=3, period=10.0,
+                 limiter=SharedGCRALimiter("throttle_test", 3, 10.0, directory=str(tmp_path)))
+        for _ in range(2)
+    ]
+
+    throttles[0].call()
+    throttles[1].call()
+    throttles[0].call()
+
+    with pytest.raises(ThrottledException):
+        throttles[1].call()
+
+    assert throttles[0].get_remaining_calls() == 0
+    for throttle in throttles:
+        throttle.limiter.close()
+    throttles[0].limiter.unlink()
+
+
+def test_shared_limiter_contention_benchmark(tmp_path):
+    """
+    Бенчмарк: вартість виклику спільного лімітера при 1 і 4 процесах
+    порівняно з GCRA у пам'яті процесу
+    """
+    import multiprocessing
+    import time
+
+    print("\n=== Shared Limiter Contention Benchmark ===")
+    calls = 20_000
+
+    local = GCRALimiter(calls_per_period=10 ** 9, period=1.0)
+    start = time.perf_counter()
+    for i in range(calls):
+        local.try_acquire(time.monotonic())
+    local_duration = time.perf_counter() - start
+    print(f"In-process GCRA:       {local_duration / calls * 1e6:.3f} us/call")
+
+    for processes_count in (1, 4):
+        durations = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(
+                target=_shared_benchmark_worker,
+                args=(f"bench_{processes_count}", str(tmp_path), calls, durations)
+            )
+            for _ in range(processes_count)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        per_call = max(durations.get() for _ in processes) / calls
+        print(f"Shared, {processes_count} process(es): {per_call * 1e6:.3f} us/call "
+              f"({per_call * calls / local_duration:.1f}x in-process)")
+        assert per_call < 1e-3
+
+
+def _inherited_worker(limiter, attempts, allowed):
+    import time
+
+    count = 0
+    for i in range(attempts):
+        if limiter.try_acquire(time.monotonic()) == 0.0:
+            count += 1
+    allowed.put(count)
+
+
+def test_shared_limiter_created_before_fork(tmp_path):
+    """Тест: лімітер, створений до fork (pre-fork воркери), не перевищує спільний ліміт"""
+    import multiprocessing
+    from stability_templates.patterns.rate_limiters import SharedGCRALimiter
+
+    context = multiprocessing.get_context("fork")
+    limiter = SharedGCRALimiter("prefork_test", calls_per_period=50_000, period=10 ** 6, directory=str(tmp_path))
+    allowed = context.Queue()
+    processes = [context.Process(target=_inherited_worker, args=(limiter, 50_000, allowed)) for _ in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    counts = [allowed.get() for _ in processes]
+    print(f"\nAllowed per forked process: {counts}")
+    assert sum(counts) == 50_000
+    limiter.close()
+    limiter.unlink()
+
+
+def test_shared_limiter_shared_between_threads(tmp_path):
+    """Тест: один екземпляр у кількох потоках не перевищує ліміт"""
+    import queue
+    import sys
+    import threading
+    from stability_templates.patterns.rate_limiters import SharedGCRALimiter
+
+    limiter = SharedGCRALimiter("threads_test", calls_per_period=50_000, period=10 ** 6, directory=str(tmp_path))
+    allowed = queue.Queue()
+    threads = [threading.Thread(target=_inherited_worker, args=(limiter, 25_000, allowed)) for _ in range(8)]
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6) # частіші перемикання потоків всередині read-modify-write
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert sum(allowed.get() for _ in threads) == 50_000
+    limiter.close()
+    limiter.unlink()
@@ -0,0 +1,171 @@
+import time
+import pytest
+from stability_templates.utils.response_cache import (
+    ResponseCache,
+    parse_cache_control,
+    FRESH,
+    STALE,
+    EXPIRED
+)
+
+
+def test_parse_cache_control():
+    """Тест: розбір заголовка Cache-Control"""
+    directives = parse_cache_control('public, max-age=60, stale-while-revalidate="30"')
+    assert directives == {"public": None, "max-age": "60", "stale-while-revalidate": "30"}
+
+
+def test_cache_freshness_by_ttl():
+    """Тест: запис свіжий протягом ttl, далі - stale, потім - expired"""
+    cache = ResponseCache(ttl=10, stale_while_revalidate=5)
+    key = cache.make_key("http://host/data", {"page": 1})
+    cache.store(key, {"value": 1}, now=0.0)
+
+    assert cache.lookup(key, now=5.0)[1] == FRESH
+    assert cache.lookup(key, now=12.0)[1] == STALE
+    assert cache.lookup(key, now=16.0)[1] == EXPIRED
+    assert cache.lookup(cache.make_key("http://host/data", {"page": 2}), now=1.0) == (None, None)
+
+
+def test_cache_key_with_multi_valued_params():
+    """Тест: params зі списками значень дають хешований ключ, make_request кешує відповідь"""
+    from unittest import mock
+    from stability_templates.utils.http_client import make_request
+
+    cache = ResponseCache()
+    assert cache.make_key("http://host/data", {"ids": [1, 2]}) == cache.make_key("http://host/data", [("ids", (1, 2))])
+    assert cache.make_key("http://host/data", "ids=1&ids=2") == ("http://host/data", "ids=1&ids=2")
+
+    client = mock.Mock()
+    client.get.return_value = mock.Mock(status_code=200, content=b'{"ids": [1, 2]}', headers={})
+    for _ in range(2):
+        assert make_request("http://host/data", client=client, cache=cache, params={"ids": [1, 2]}) == {"ids": [1, 2]}
+    assert client.get.call_count == 1
+
+
+def test_cache_control_overrides_ttl():
+    """Тест: max-age, no-cache і no-store з відповіді"""
+    cache = ResponseCache(ttl=60)
+
+    cache.store("a", 1, headers={"Cache-Control": "max-age=2, stale-while-revalidate=3"}, now=0.0)
+    assert cache.lookup("a", now=1.0)[1] == FRESH
+    assert cache.lookup("a", now=4.0)[1] == STALE
+
+    cache.store("b", 2, headers={"Cache-Control": "no-cache"}, now=0.0)
+    assert cache.lookup("b", now=0.0)[1] == EXPIRED
+
+    cache.store("c", 3, headers={"Cache-Control": "no-store"}, now=0.0)
+    assert cache.lookup("c", now=0.0) == (None, None)
+
+
+def test_no_cache_is_never_served_stale():
+    """Тест: no-cache відповідь не віддається через stale-while-revalidate без ревалідації"""
+    cache = ResponseCache(ttl=60, stale_while_revalidate=30)
+
+    cache.store("a", 1, headers={"Cache-Control": "no-cache"}, now=0.0)
+    assert cache.lookup("a", now=0.0)[1] == EXPIRED
+
+    cache.store("b", 2, headers={"Cache-Control": "no-cache, stale-while-revalidate=30"}, now=0.0)
+    assert cache.lookup("b", now=0.0)[1] == EXPIRED
+
+    # ETag зберігається - наступний запит буде умовним (304)
+    cache.store("c", 3, headers={"Cache-Control": "no-cache", "ETag": '"v1"'}, now=0.0)
+    entry, freshness = cache.lookup("c", now=0.0)
+    assert freshness == EXPIRED and entry.etag == '"v1"'
+
+
+def test_malformed_cache_control_falls_back_to_defaults():
+    """Тест: нечислові max-age / stale-while-revalidate не ламають збереження відповіді"""
+    cache = ResponseCache(ttl=10, stale_while_revalidate=5)
+
+    cache.store("a", 1, headers={"Cache-Control": "max-age=abc, stale-while-revalidate=soon"}, now=0.0)
+
+    assert cache.lookup("a", now=9.0)[1] == FRESH
+    assert cache.lookup("a", now=14.0)[1] == STALE
+    assert cache.lookup("a", now=16.0)[1] == EXPIRED
+
+
+def test_cache_lru_eviction():
+    """Тест: розмір кешу обмежений, витісняється найдавніше використаний запис"""
+    cache = ResponseCache(max_entries=2)
+    cache.store("a", 1)
+    cache.store("b", 2)
+    cache.lookup("a")
+    cache.store("c", 3)
+
+    assert len(cache) == 2
+    assert cache.lookup("b") == (None, None)
+    assert cache.lookup("a")[0].value == 1
+
+
+def test_cache_refresh_after_not_modified():
+    """Тест: 304 робить запис знову свіжим"""
+    cache = ResponseCache(ttl=1)
+    cache.store("a", {"value": 1}, headers={"ETag": '"v1"'}, now=0.0)
+
+    entry, freshness = cache.lookup("a", now=2.0)
+    assert freshness == EXPIRED
+    assert entry.etag == '"v1"'
+
+    assert cache.refresh("a", now=2.0) == {"value": 1}
+    assert cache.lookup("a", now=2.5)[1] == FRESH
+    assert cache.stats()["revalidated"] == 1
+
+
+def test_get_stale():
+    """Тест: останнє значення доступне незалежно від віку"""
+    cache = ResponseCache(ttl=0)
+    cache.store(cache.make_key("http://host/data"), "old")
+
+    assert cache.get_stale("http://host/data") == "old"
+    assert cache.get_stale("http://host/other") is None
+
+
+def test_make_request_with_cache(server_url, mock_service):
+    """Тест: повторні запити обслуговуються з кешу"""
+    from stability_templates.utils.http_client import make_request
+
+    cache = ResponseCache()
+    url = f"{server_url}/cached?max_age=60"
+
+    first = make_request(url, cache=cache)
+    for _ in range(5):
+        assert make_request(url, cache=cache) == first
+
+    stats = cache.stats()
+    print(f"\nCache stats: {stats}")
+    assert stats["hits"] == 5
+    assert stats["misses"] == 1
+
+
+def test_make_request_conditional_revalidation(server_url, mock_service):
+    """Тест: прострочений запис перевіряється через If-None-Match (304)"""
+    from stability_templates.utils.http_client import make_request
+
+    cache = ResponseCache()
+    url = f"{server_url}/cached?max_age=0"
+
+    first = make_request(url, cache=cache)
+    second = make_request(url, cache=cache)
+
+    assert second == first
+    assert cache.stats()["revalidated"] == 1
+
+
+def test_make_request_stale_while_revalidate(server_url, mock_service):
+    """Тест: stale значення повертається одразу, оновлення - у фоні"""
+    from stability_templates.utils.http_client import make_request
+
+    cache = ResponseCache(stale_while_revalidate=30)
+    url = f"{server_url}/cached?max_age=0"
+
+    make_request(url, cache=cache)
+    start = time.perf_counter()
+    make_request(url, cache=cache)
+    assert time.perf_counter() - start < 0.01
+
+    time.sleep(0.3)
+    stats = cache.stats()
+    print(f"\nCache stats: {stats}")
+    assert stats["stale_hits"] == 1
+    assert stats["revalidated"] == 1
@@ -66,4 +66,198 @@ def test_retry_with_server(server_url, mock_service):
         result = retry.call()
         assert result is not None
     except RetryExhausted:
-        pytest.skip("Server too unstable for this test run")
\ No newline at end of file
+        pytest.skip("Server too unstable for this test run")
+
+def test_async_retry_success_after_failures():
+    """Тест: AsyncRetry повторює корутину до успіху"""
+    import asyncio
+    from stability_templates.patterns.retry import AsyncRetry
+
+    mock_fn = mock.AsyncMock(side_effect=[Exception(), Exception(), "success"])
+    retry = AsyncRetry(mock_fn, max_attempts=3, delay=0.1)
+
+    assert asyncio.run(retry.call()) == "success"
+    assert mock_fn.call_count == 3
+
+
+def test_async_retry_does_not_block_loop():
+    """Тест: паузи AsyncRetry не блокують інші корутини"""
+    import asyncio
+    import time
+    from stability_templates.patterns.retry import AsyncRetry
+
+    async def scenario():
+        retries = [
+            AsyncRetry(mock.AsyncMock(side_effect=Exception()), max_attempts=3, delay=0.2, backoff=1)
+            for _ in range(50)
+        ]
+        results = await asyncio.gather(*(r.call() for r in retries), return_exceptions=True)
+        return results
+
+    start = time.perf_counter()
+    results = asyncio.run(scenario())
+    duration = time.perf_counter() - start
+
+    print(f"\n50 concurrent AsyncRetry calls finished in {duration:.4f}s")
+    assert all(isinstance(r, RetryExhausted) for r in results)
+    assert duration < 1.0
+
+
+@pytest.mark.parametrize("jitter", ["full", "equal"])
+def test_retry_jitter_bounds(jitter):
+    """Тест: jitter тримає паузу в межах експоненційної затримки"""
+    retry = Retry(mock.Mock(), delay=1, backoff=2, jitter=jitter)
+
+    current_delay = 1
+    for attempt in range(5):
+        sleep_time, next_delay = retry.next_delay(current_delay)
+        lower = 0 if jitter == "full" else current_delay / 2
+        assert lower <= sleep_time <= current_delay
+        assert next_delay == current_delay * 2
+        current_delay = next_delay
+
+
+def test_retry_decorrelated_jitter():
+    """Тест: decorrelated jitter залежить від попередньої паузи і обмежений max_delay"""
+    retry = Retry(mock.Mock(), delay=0.1, jitter="decorrelated", max_delay=2)
+
+    current_delay = 0.1
+    for attempt in range(20):
+        sleep_time, next_delay = retry.next_delay(current_delay)
+        assert 0.1 <= sleep_time <= min(2, current_delay * 3)
+        current_delay = next_delay
+
+
+def test_retry_jitter_spreads_clients():
+    """Тест: з jitter клієнти не повторюють у lockstep"""
+    import random
+    random.seed(42)
+
+    retries = [Retry(mock.Mock(), delay=1, jitter="full") for _ in range(100)]
+    first_sleeps = {round(r.next_delay(1)[0], 3) for r in retries}
+
+    assert len(first_sleeps) > 90
+
+
+def test_retry_unknown_jitter():
+    """Тест: невідома стратегія jitter"""
+    with pytest.raises(ValueError):
+        Retry(mock.Mock(), jitter="random")
+
+
+def test_retry_budget_shared():
+    """Тест: спільний бюджет зупиняє повтори, коли їх забагато"""
+    from stability_templates.patterns.retry import RetryBudget
+
+    budget = RetryBudget(ratio=0.1, min_retries_per_second=0, max_tokens=2)
+    failing = mock.Mock(side_effect=Exception("down"))
+    retries = [Retry(failing, max_attempts=5, delay=0.01, budget=budget) for _ in range(3)]
+
+    for retry in retries:
+        with pytest.raises(RetryExhausted):
+            retry.call()
+
+    print(f"\nCalls: {failing.call_count}, allowed: {budget.retries_allowed}, "
+          f"refused: {budget.retries_refused}")
+    # 3 перші спроби + 2 повтори з бюджету (+0.3 токена від перших викликів недостатньо)
+    assert failing.call_count == 5
+    assert budget.retries_allowed == 2
+    assert budget.retries_refused == 3
+
+
+def test_retry_budget_refills_from_calls():
+    """Тест: успішні перші виклики поповнюють бюджет"""
+    from stability_templates.patterns.retry import RetryBudget
+
+    budget = RetryBudget(ratio=0.5, min_retries_per_second=0, max_tokens=10)
+    budget.tokens = 0
+
+    ok = Retry(mock.Mock(return_value="ok"), budget=budget)
+    for _ in range(4):
+        ok.call()
+
+    assert budget.try_withdraw()
+    assert budget.try_withdraw()
+    assert not budget.try_withdraw()
+
+
+def test_retry_deadline_bounds_total_time():
+    """Тест: дедлайн обмежує загальний час незалежно від кількості спроб"""
+    import time
+
+    mock_fn = mock.Mock(side_effect=Exception("down"))
+    retry = Retry(mock_fn, max_attempts=5, delay=0.2, backoff=2, deadline=0.5)
+
+    start = time.perf_counter()
+    with pytest.raises(RetryExhausted, match="deadline"):
+        retry.call()
+    duration = time.perf_counter() - start
+
+    print(f"\nAttempts: {mock_fn.call_count}, duration: {duration:.4f}s")
+    # 0.2s пауза, потім пауза 0.4s вже перевищила б дедлайн
+    assert mock_fn.call_count == 2
+    assert duration < 0.5
+
+
+def test_retry_deadline_passes_remaining_timeout():
+    """Тест: функція отримує залишок часу через timeout_kwarg"""
+    timeouts = []
+
+    def fake_request(url, timeout=1.0):
+        timeouts.append(timeout)
+        raise Exception("down")
+
+    retry = Retry(fake_request, max_attempts=3, delay=0.1, backoff=1, deadline=2.0, timeout_kwarg="timeout")
+
+    with pytest.raises(RetryExhausted):
+        retry.call("http://localhost/unstable", timeout=1.5)
+
+    print(f"\nTimeouts passed: {timeouts}")
+    assert timeouts[0] == 1.5
+    assert all(t <= 2.0 for t in timeouts)
+
+
+
+def test_retry_deadline_keeps_default_timeout():
+    """Тест: без timeout у виклику спроба отримує таймаут функції за замовчуванням, а не весь дедлайн"""
+    timeouts = []
+
+    def fake_request(url, timeout=1.0):
+        timeouts.append(timeout)
+        raise Exception("down")
+
+    retry = Retry(fake_request, max_attempts=3, delay=0.1, backoff=1, deadline=10.0, timeout_kwarg="timeout")
+    with pytest.raises(RetryExhausted):
+        retry.call("http://localhost/unstable")
+    assert timeouts == [1.0, 1.0, 1.0]
+
+    # залишок часу, менший за таймаут спроби, обрізає його
+    timeouts.clear()
+    retry = Retry(fake_request, max_attempts=3, delay=0.1, backoff=1, deadline=0.5, timeout_kwarg="timeout")
+    with pytest.raises(RetryExhausted):
+        retry.call("http://localhost/unstable")
+    assert timeouts[0] <= 0.5
+    assert timeouts[0] > timeouts[1] > timeouts[2]
+
+
+def test_retry_explicit_attempt_timeout():
+    """Тест: attempt_timeout задає таймаут спроби для функцій без значення за замовчуванням"""
+    mock_fn = mock.Mock(side_effect=Exception("down"))
+    retry = Retry(mock_fn, max_attempts=2, delay=0.01, deadline=10.0, timeout_kwarg="timeout", attempt_timeout=0.3)
+
+    with pytest.raises(RetryExhausted):
+        retry.call()
+    assert [c.kwargs["timeout"] for c in mock_fn.call_args_list] == [0.3, 0.3]
+
+
+def test_async_retry_deadline():
+    """Тест: дедлайн у AsyncRetry"""
+    import asyncio
+    from stability_templates.patterns.retry import AsyncRetry
+
+    mock_fn = mock.AsyncMock(side_effect=Exception("down"))
+    retry = AsyncRetry(mock_fn, max_attempts=10, delay=0.1, backoff=2, deadline=0.35)
+
+    with pytest.raises(RetryExhausted, match="deadline"):
+        asyncio.run(retry.call())
+    assert mock_fn.call_count == 3
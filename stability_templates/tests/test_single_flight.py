@@ -0,0 +1,147 @@
+import time
+import pytest
+from threading import Thread, Barrier
+from unittest import mock
+from stability_templates.patterns.single_flight import SingleFlight
+
+
+def run_concurrently(func, count, *args):
+    """Запускає func у count потоках одночасно і повертає (результати, помилки)"""
+    barrier = Barrier(count)
+    results = []
+    errors = []
+
+    def worker():
+        barrier.wait()
+        try:
+            results.append(func(*args))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [Thread(target=worker) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def test_single_flight_collapses_identical_calls():
+    """Тест: одночасні однакові виклики виконують функцію один раз"""
+    calls = []
+
+    def slow_fetch(url):
+        calls.append(url)
+        time.sleep(0.2)
+        return {"url": url}
+
+    flight = SingleFlight(slow_fetch)
+    results, errors = run_concurrently(flight.call, 20, "http://host/popular")
+
+    stats = flight.stats()
+    print(f"\nSingle-flight stats: {stats}")
+    assert len(calls) == 1
+    assert results == [{"url": "http://host/popular"}] * 20
+    assert stats["collapsed"] == 19
+    assert stats["in_flight"] == 0
+
+
+def test_single_flight_shares_exception():
+    """Тест: виключення отримують усі очікувачі"""
+    def failing(url):
+        time.sleep(0.1)
+        raise ValueError("upstream down")
+
+    flight = SingleFlight(failing)
+    results, errors = run_concurrently(flight.call, 10, "http://host/")
+
+    assert results == []
+    assert len(errors) == 10
+    assert all(isinstance(e, ValueError) for e in errors)
+    assert flight.stats()["calls"] == 1
+
+
+def test_single_flight_different_keys():
+    """Тест: різні ключі виконуються окремо"""
+    mock_fn = mock.Mock(side_effect=lambda url, tenant=None: url)
+    flight = SingleFlight(mock_fn, key_func=lambda url, tenant=None: tenant)
+
+    flight.call("/a", tenant="t1")
+    flight.call("/a", tenant="t2")
+
+    assert mock_fn.call_count == 2
+
+
+def test_single_flight_with_dict_kwargs():
+    """Тест: params= / headers= з dict об'єднуються за вмістом, а не падають з TypeError"""
+    def slow_request(url, params=None, headers=None):
+        time.sleep(0.1)
+        return params["q"]
+
+    mock_fn = mock.Mock(side_effect=slow_request)
+    flight = SingleFlight(mock_fn)
+
+    results, errors = run_concurrently(
+        lambda: flight.call("/search", params={"q": "x", "tags": ["a", "b"]}, headers={"X-Id": "1"}), 5
+    )
+
+    assert errors == []
+    assert results == ["x"] * 5
+    assert mock_fn.call_count == 1
+
+
+def test_single_flight_unhashable_key_is_not_coalesced():
+    """Тест: якщо ключ не хешується, виклик виконується напряму"""
+    mock_fn = mock.Mock(return_value="ok")
+    flight = SingleFlight(mock_fn, key_func=lambda payload: payload)
+
+    assert flight.call(bytearray(b"body")) == "ok"
+    assert mock_fn.call_count == 1
+    assert flight.stats() == {"calls": 0, "collapsed": 0, "in_flight": 0}
+
+
+def test_single_flight_sequential_calls_not_collapsed():
+    """Тест: після завершення виклику наступний виконується заново"""
+    mock_fn = mock.Mock(return_value="result")
+    flight = SingleFlight(mock_fn)
+
+    flight.call("key")
+    flight.call("key")
+
+    assert mock_fn.call_count == 2
+    assert flight.stats()["collapsed"] == 0
+
+
+def test_single_flight_in_front_of_circuit_breaker():
+    """Тест: single-flight перед CircuitBreaker рахує один збій замість двадцяти"""
+    from stability_templates.patterns.circuit_breaker import (
+        CircuitBreaker,
+        RemoteCallFailedException,
+        StateChoices
+    )
+
+    def failing(url):
+        time.sleep(0.1)
+        raise Exception("Failed")
+
+    cb = CircuitBreaker(func=failing, exceptions=(Exception,), threshold=3, delay=5)
+    flight = SingleFlight(cb.make_remote_call)
+
+    results, errors = run_concurrently(flight.call, 20, "http://host/")
+
+    assert len(errors) == 20
+    assert all(isinstance(e, RemoteCallFailedException) for e in errors)
+    assert cb._failed_attempt_count == 1
+    assert cb.state == StateChoices.CLOSED
+
+
+def test_single_flight_with_server(server_url, mock_service):
+    """Тест: single-flight перед make_request"""
+    from stability_templates.utils.http_client import make_request
+
+    flight = SingleFlight(make_request)
+    results, errors = run_concurrently(flight.call, 10, f"{server_url}/slow?delay=0.3")
+
+    assert errors == []
+    assert len(results) == 10
+    assert flight.stats()["calls"] == 1
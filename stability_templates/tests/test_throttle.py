@@ -63,3 +63,113 @@ def test_throttle_with_server(server_url, mock_service):
             pass
 
     assert success_count == 3
+
+
+def test_async_throttle():
+    """Тест: AsyncThrottle обмежує виклики корутини"""
+    import asyncio
+    from stability_templates.patterns.throttle import AsyncThrottle
+
+    mock_fn = mock.AsyncMock(return_value="success")
+    throttle = AsyncThrottle(mock_fn, calls_per_period=2, period=1.0)
+
+    async def scenario():
+        await throttle.call()
+        await throttle.call()
+        with pytest.raises(ThrottledException):
+            await throttle.call()
+
+    asyncio.run(scenario())
+    assert mock_fn.call_count == 2
+
+
+@pytest.mark.parametrize("algorithm", ["sliding_log", "token_bucket", "gcra", "sliding_window"])
+def test_throttle_algorithms(algorithm):
+    """Тест: Throttle з різними алгоритмами і підказкою retry_after"""
+    mock_fn = mock.Mock(return_value="success")
+    throttle = Throttle(mock_fn, calls_per_period=3, period=1.0, algorithm=algorithm)
+
+    for i in range(3):
+        throttle.call()
+
+    with pytest.raises(ThrottledException) as exc_info:
+        throttle.call()
+
+    assert 0 < exc_info.value.retry_after < 2.0
+    assert throttle.get_remaining_calls() == 0
+    assert mock_fn.call_count == 3
+
+
+def test_throttle_blocking_paces_calls():
+    """Тест: блокуючий режим чекає на слот замість виключення"""
+    mock_fn = mock.Mock(return_value="success")
+    throttle = Throttle(mock_fn, calls_per_period=5, period=0.5, algorithm="gcra", block=True)
+
+    start = time.perf_counter()
+    for i in range(10):
+        throttle.call()
+    duration = time.perf_counter() - start
+
+    print(f"\n10 calls at 5 per 0.5s took {duration:.4f}s (Expected: ~0.5s)")
+    assert mock_fn.call_count == 10
+    assert 0.45 <= duration < 1.0
+
+
+def test_throttle_blocking_fifo_order():
+    """Тест: очікувачі обслуговуються у порядку надходження"""
+    from threading import Thread
+
+    order = []
+    throttle = Throttle(order.append, calls_per_period=1, period=0.05, block=True)
+    throttle.call("warmup")
+
+    threads = []
+    for i in range(8):
+        thread = Thread(target=throttle.call, args=(i,))
+        thread.start()
+        threads.append(thread)
+        time.sleep(0.005)
+
+    for thread in threads:
+        thread.join()
+
+    assert order == ["warmup"] + list(range(8))
+
+
+def test_throttle_blocking_max_wait():
+    """Тест: якщо слот не з'явиться до max_wait - виключення одразу"""
+    mock_fn = mock.Mock(return_value="success")
+    throttle = Throttle(mock_fn, calls_per_period=1, period=2.0, block=True, max_wait=0.2)
+
+    throttle.call()
+
+    start = time.perf_counter()
+    with pytest.raises(ThrottledException) as exc_info:
+        throttle.call()
+
+    assert time.perf_counter() - start < 0.1
+    assert exc_info.value.retry_after > 0.2
+    assert mock_fn.call_count == 1
+
+
+def test_async_throttle_blocking():
+    """Тест: AsyncThrottle у блокуючому режимі рівномірно пропускає корутини"""
+    import asyncio
+    from stability_templates.patterns.throttle import AsyncThrottle
+
+    order = []
+
+    async def record(i):
+        order.append(i)
+
+    throttle = AsyncThrottle(record, calls_per_period=5, period=0.25, algorithm="gcra", block=True)
+
+    async def scenario():
+        await asyncio.gather(*(throttle.call(i) for i in range(10)))
+
+    start = time.perf_counter()
+    asyncio.run(scenario())
+    duration = time.perf_counter() - start
+
+    assert order == list(range(10))
+    assert 0.2 <= duration < 0.6
@@ -66,3 +66,72 @@ def test_timeout_with_server(server_url, mock_service):
 
     with pytest.raises(TimeoutException):
         timeout_slow.call()
+
+
+def test_async_timeout():
+    """Тест: AsyncTimeout скасовує повільну корутину"""
+    import asyncio
+    from stability_templates.patterns.timeout import AsyncTimeout
+
+    async def fast_fn():
+        return "quick"
+
+    async def slow_fn():
+        await asyncio.sleep(3)
+        return "too late"
+
+    assert asyncio.run(AsyncTimeout(fast_fn, timeout_seconds=1).call()) == "quick"
+
+    start = time.perf_counter()
+    with pytest.raises(TimeoutException):
+        asyncio.run(AsyncTimeout(slow_fn, timeout_seconds=0.5).call())
+    assert time.perf_counter() - start < 1.5
+
+
+def test_timeout_uses_pool_threads():
+    """Тест: Timeout не створює новий потік на кожен виклик"""
+    import threading
+    from stability_templates.patterns.concurrency_templates.worker_pool import WorkerPool
+
+    pool = WorkerPool(max_workers=4)
+    timeout = Timeout(lambda x: x, timeout_seconds=1, pool=pool)
+
+    threads_before = threading.active_count()
+    results = [timeout.call(i) for i in range(200)]
+
+    assert results == list(range(200))
+    assert pool.stats()["workers"] <= 4
+    assert threading.active_count() - threads_before <= 4
+    pool.shutdown()
+
+
+def test_timeout_abandoned_cap():
+    """Тест: після max_abandoned зависших викликів нові відхиляються одразу"""
+    from stability_templates.patterns.concurrency_templates.worker_pool import WorkerPool
+
+    pool = WorkerPool(max_workers=4, max_abandoned=2)
+    timeout = Timeout(lambda: time.sleep(1), timeout_seconds=0.1, pool=pool)
+
+    for i in range(2):
+        with pytest.raises(TimeoutException):
+            timeout.call()
+
+    assert pool.stats()["abandoned_in_flight"] == 2
+
+    start = time.perf_counter()
+    with pytest.raises(TimeoutException, match="Too many"):
+        timeout.call()
+    assert time.perf_counter() - start < 0.05
+
+    time.sleep(1.0)
+    assert pool.stats()["leaked_completed"] == 2
+
+
+def test_timeout_on_single_worker_pool():
+    """Тест: пул з одним потоком за замовчуванням дозволяє одну зависшу задачу, а не нуль"""
+    from stability_templates.patterns.concurrency_templates.worker_pool import WorkerPool
+
+    pool = WorkerPool(max_workers=1)
+    assert pool.max_abandoned == 1
+    assert Timeout(lambda: 42, 1, pool=pool).call() == 42
+    pool.shutdown()
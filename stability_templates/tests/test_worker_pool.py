@@ -0,0 +1,149 @@
+import time
+import pytest
+from stability_templates.patterns.concurrency_templates.worker_pool import (
+    WorkerPool,
+    PoolFullException,
+    get_shared_pool
+)
+
+
+def test_worker_pool_reuses_threads():
+    """Тест: потоки пулу перевикористовуються між задачами"""
+    pool = WorkerPool(max_workers=4)
+
+    futures = [pool.submit(lambda x: x * 2, i) for i in range(100)]
+    results = [f.result(timeout=1) for f in futures]
+
+    stats = pool.stats()
+    print(f"\nPool stats: {stats}")
+    assert results == [i * 2 for i in range(100)]
+    assert stats["workers"] <= 4
+    assert stats["completed"] == 100
+    pool.shutdown()
+
+
+def test_worker_pool_exception():
+    """Тест: виключення задачі повертається через Future"""
+    pool = WorkerPool(max_workers=1)
+
+    def failing():
+        raise ValueError("Task failed")
+
+    with pytest.raises(ValueError):
+        pool.submit(failing).result(timeout=1)
+    pool.shutdown()
+
+
+def test_worker_pool_abandoned_metrics():
+    """Тест: покинуті задачі рахуються до свого завершення"""
+    pool = WorkerPool(max_workers=2)
+
+    running = pool.submit(time.sleep, 0.3)
+    time.sleep(0.05)
+    pool.abandon(running)
+
+    assert pool.stats()["abandoned_in_flight"] == 1
+
+    running.result(timeout=1)
+    stats = pool.stats()
+    assert stats["abandoned"] == 1
+    assert stats["abandoned_in_flight"] == 0
+    assert stats["leaked_completed"] == 1
+    pool.shutdown()
+
+
+def test_worker_pool_abandon_queued_task():
+    """Тест: задача, що ще в черзі, скасовується і не виконується"""
+    pool = WorkerPool(max_workers=1)
+    executed = []
+
+    pool.submit(time.sleep, 0.2)
+    queued = pool.submit(executed.append, "queued")
+    pool.abandon(queued)
+
+    time.sleep(0.3)
+    assert queued.cancelled()
+    assert executed == []
+    assert pool.stats()["abandoned"] == 0
+    pool.shutdown()
+
+
+def test_worker_pool_queue_limit():
+    """Тест: переповнена черга відхиляє задачі одразу"""
+    pool = WorkerPool(max_workers=1, max_queue=1)
+
+    pool.submit(time.sleep, 0.2)
+    time.sleep(0.05)
+    pool.submit(time.sleep, 0.01)
+
+    with pytest.raises(PoolFullException):
+        pool.submit(time.sleep, 0.01)
+    pool.shutdown()
+
+
+def test_shared_pool_is_singleton():
+    """Тест: спільний пул один на процес"""
+    assert get_shared_pool() is get_shared_pool()
+
+
+def test_fan_pool_is_separate_from_shared_pool():
+    """Тест: FanIn / FanOut за замовчуванням не ділять пул з Timeout / Hedge"""
+    from stability_templates.patterns.concurrency_templates import FanIn, FanOut, get_fan_pool
+
+    assert get_fan_pool() is not get_shared_pool()
+    assert FanIn([]).executor is get_fan_pool()
+    assert FanOut([]).executor is get_fan_pool()
+
+
+def test_worker_pool_nested_submit_runs_in_caller():
+    """Тест: задача з потоку пулу без вільних потоків виконується одразу в цьому потоці"""
+    import threading
+
+    pool = WorkerPool(max_workers=1)
+
+    def outer():
+        inner = pool.submit(threading.current_thread)
+        return threading.current_thread(), inner.result(timeout=1)
+
+    caller, inner_thread = pool.submit(outer).result(timeout=2)
+
+    assert inner_thread is caller
+    assert pool.stats()["caller_runs"] == 1
+    pool.shutdown()
+
+
+def test_worker_pool_spawns_enough_workers_for_burst():
+    """Тест: потік, що вже взяв задачу, не вважається вільним - пакет задач виконується паралельно"""
+    from stability_templates.patterns.concurrency_templates import FanIn
+
+    pool = WorkerPool(max_workers=64)
+    # прогрів: частина потоків вже створена і чекає на задачі
+    FanIn([lambda: time.sleep(0.05)] * 8, executor=pool).collect()
+
+    start = time.monotonic()
+    FanIn([lambda: time.sleep(0.3)] * 16, executor=pool).collect()
+    elapsed = time.monotonic() - start
+
+    print(f"\n16 x 0.3s on a warm pool: {elapsed:.2f}s, {pool.stats()['workers']} workers")
+    assert elapsed < 0.5
+    assert pool.stats()["workers"] >= 16
+    pool.shutdown()
+
+
+def test_worker_pool_submit_timeout():
+    """Тест: submit чекає на місце в черзі не довше submit_timeout"""
+    from threading import Event
+
+    release = Event()
+    pool = WorkerPool(max_workers=1, max_queue=1, submit_timeout=0.1)
+    pool.submit(release.wait)
+    time.sleep(0.05)
+    pool.submit(release.wait)
+
+    start = time.monotonic()
+    with pytest.raises(PoolFullException):
+        pool.submit(release.wait)
+    assert time.monotonic() - start >= 0.09
+
+    release.set()
+    pool.shutdown()
@@ -1,27 +1,243 @@
+import asyncio
 import requests
 import logging
+import weakref
+from http.cookiejar import DefaultCookiePolicy
+from threading import Lock, Thread
+from requests.adapters import HTTPAdapter
+
+from .json_codec import get_default_codec
+from .response_cache import FRESH, STALE
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
 logger = logging.getLogger(__name__)
 
 
-def make_request(url, timeout=1.0, **kwargs):
+class PooledHTTPClient:
+    """
+    HTTP client with a keep-alive connection pool per host.
+    One requests.Session is shared by all threads (urllib3 pools are thread-safe).
+    Cookies from responses are not stored unless persist_cookies=True: the session is shared
+    by unrelated callers, and one upstream's Set-Cookie must not leak into their requests
+    """
+    def __init__(self, pool_connections=10, pool_maxsize=10, pool_block=False, keep_alive=True,
+                 persist_cookies=False):
+        self.session = requests.Session()
+        if not persist_cookies:
+            self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        # pool_connections - number of hosts with cached pools, pool_maxsize - connections per host
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+    def get(self, url, timeout=1.0, **kwargs):
+        return self.session.get(url, timeout=timeout, **kwargs)
+
+    def stats(self):
+        """Pool statistics: requests sent, connections opened (misses) and reused (hits)"""
+        pools = self.adapter.poolmanager.pools
+        requests_count = 0
+        connections_count = 0
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            requests_count += pool.num_requests
+            connections_count += pool.num_connections
+
+        reused = max(0, requests_count - connections_count)
+        return {
+            "hosts": len(pools),
+            "requests": requests_count,
+            "connections_opened": connections_count,
+            "reused": reused,
+            "hit_ratio": reused / requests_count if requests_count else 0.0,
+        }
+
+    def close(self):
+        self.session.close()
+
+
+_default_client = None
+_default_client_lock = Lock()
+
+
+def get_default_client():
+    """Shared pooled client used by make_request by default"""
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = PooledHTTPClient(pool_maxsize=64)
+    return _default_client
+
+
+def make_request(url, timeout=1.0, client=None, cache=None, codec=None, **kwargs):
     """Unified HTTP client for testing patterns"""
+    client = client or get_default_client()
+    codec = codec or get_default_codec()
     try:
-        response = requests.get(url, timeout=timeout, **kwargs)
+        if cache is not None:
+            return _make_cached_request(url, timeout, client, cache, codec, kwargs)
+
+        response = client.get(url, timeout=timeout, **kwargs)
+        return _parse_response(url, response, codec)
 
-        if response.status_code == 200:
-            logger.info(f"Success: {url} -> {response.status_code}")
-            return response.json()
+    except requests.Timeout:
+        logger.error(f"Timeout: {url}")
+        raise
+    except Exception as e:
+        logger.error(f"Request failed: {url} - {e}")
+        raise
 
-        if 500 <= response.status_code < 600:
-            logger.warning(f"Server error: {url} -> {response.status_code}")
-            raise Exception(f"Server error: {response.status_code}")
 
-        return response.json()
+def _parse_response(url, response, codec):
+    # decode straight from the raw body bytes, without building an intermediate str
+    if response.status_code == 200:
+        logger.info(f"Success: {url} -> {response.status_code}")
+        return codec.loads(response.content)
 
-    except requests.Timeout:
+    if 500 <= response.status_code < 600:
+        logger.warning(f"Server error: {url} -> {response.status_code}")
+        raise Exception(f"Server error: {response.status_code}")
+
+    return codec.loads(response.content)
+
+
+def _make_cached_request(url, timeout, client, cache, codec, kwargs):
+    key = cache.make_key(url, kwargs.get("params"))
+    entry, freshness = cache.lookup(key)
+
+    if freshness == FRESH:
+        logger.info(f"Cache hit: {url}")
+        return entry.value
+
+    if freshness == STALE:
+        # serve the stale value immediately and refresh it in the background
+        if cache.begin_revalidation(entry):
+            Thread(
+                target=_revalidate_in_background,
+                args=(url, timeout, client, cache, codec, key, entry, kwargs),
+                daemon=True
+            ).start()
+        logger.info(f"Cache stale hit: {url}")
+        return entry.value
+
+    return _fetch_and_store(url, timeout, client, cache, codec, key, entry, kwargs)
+
+
+def _fetch_and_store(url, timeout, client, cache, codec, key, entry, kwargs):
+    kwargs = dict(kwargs)
+    if entry is not None and entry.etag:
+        # conditional request: the server answers 304 if the cached value is still valid
+        kwargs["headers"] = {**(kwargs.get("headers") or {}), "If-None-Match": entry.etag}
+
+    response = client.get(url, timeout=timeout, **kwargs)
+    if response.status_code == 304 and entry is not None:
+        logger.info(f"Not modified: {url}")
+        cache.refresh(key, response.headers)
+        return entry.value
+
+    value = _parse_response(url, response, codec)
+    if response.status_code == 200:
+        cache.store(key, value, response.headers)
+    return value
+
+
+def _revalidate_in_background(url, timeout, client, cache, codec, key, entry, kwargs):
+    try:
+        _fetch_and_store(url, timeout, client, cache, codec, key, entry, kwargs)
+    except Exception as e:
+        logger.warning(f"Background revalidation failed: {url} - {e}")
+    finally:
+        cache.end_revalidation(entry)
+
+
+class AsyncHTTPClient:
+    """
+    Async HTTP client on aiohttp with a keep-alive connection pool.
+    aiohttp sessions are bound to an event loop, so one session is kept per running loop.
+    As in PooledHTTPClient, response cookies are not stored unless persist_cookies=True
+    """
+    def __init__(self, limit=100, limit_per_host=0, keepalive_timeout=15.0, persist_cookies=False):
+        if aiohttp is None:
+            raise RuntimeError("AsyncHTTPClient requires aiohttp: pip install aiohttp")
+        self.limit = limit #total connections, 0 - unlimited
+        self.limit_per_host = limit_per_host #connections per host, 0 - unlimited
+        self.keepalive_timeout = keepalive_timeout
+        self.persist_cookies = persist_cookies
+        self._sessions = weakref.WeakKeyDictionary()
+
+    def _get_session(self):
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            cookie_jar = None if self.persist_cookies else aiohttp.DummyCookieJar()
+            session = aiohttp.ClientSession(connector=connector, cookie_jar=cookie_jar)
+            self._sessions[loop] = session
+        return session
+
+    async def get(self, url, timeout=1.0, **kwargs):
+        """Returns (status code, raw body)"""
+        session = self._get_session()
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout), **kwargs) as response:
+            return response.status, await response.read()
+
+    async def close(self):
+        """Closes the session of the current event loop"""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+
+
+_default_async_client = None
+
+
+def get_default_async_client():
+    """Shared async client used by make_request_async by default"""
+    global _default_async_client
+    if _default_async_client is None:
+        with _default_client_lock:
+            if _default_async_client is None:
+                _default_async_client = AsyncHTTPClient()
+    return _default_async_client
+
+
+async def make_request_async(url, timeout=1.0, client=None, codec=None, **kwargs):
+    """Async counterpart of make_request"""
+    client = client or get_default_async_client()
+    codec = codec or get_default_codec()
+    try:
+        status_code, body = await client.get(url, timeout=timeout, **kwargs)
+
+        if status_code == 200:
+            logger.info(f"Success: {url} -> {status_code}")
+            return codec.loads(body)
+
+        if 500 <= status_code < 600:
+            logger.warning(f"Server error: {url} -> {status_code}")
+            raise Exception(f"Server error: {status_code}")
+
+        return codec.loads(body)
+
+    except asyncio.TimeoutError:
         logger.error(f"Timeout: {url}")
         raise
     except Exception as e:
         logger.error(f"Request failed: {url} - {e}")
-        raise
\ No newline at end of file
+        raise
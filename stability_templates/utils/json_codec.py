@@ -0,0 +1,83 @@
+import json
+import logging
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+logger = logging.getLogger(__name__)
+
+
+class StdlibJSONCodec:
+    """Pure-stdlib codec; json.loads accepts bytes and detects the encoding itself"""
+    name = "json"
+
+    def loads(self, data):
+        return json.loads(data)
+
+    def dumps(self, obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+class OrjsonCodec:
+    """orjson: decodes bytes directly and encodes straight to bytes"""
+    name = "orjson"
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+    def dumps(self, obj):
+        return orjson.dumps(obj)
+
+
+class UjsonCodec:
+    name = "ujson"
+
+    def loads(self, data):
+        return ujson.loads(data)
+
+    def dumps(self, obj):
+        return ujson.dumps(obj).encode()
+
+
+# fastest first; only codecs whose library is installed are available
+CODECS = {}
+if orjson is not None:
+    CODECS["orjson"] = OrjsonCodec
+if ujson is not None:
+    CODECS["ujson"] = UjsonCodec
+CODECS["json"] = StdlibJSONCodec
+
+
+def get_codec(name=None):
+    """Codec by name, or the fastest available one if name is None"""
+    if name is None:
+        name = next(iter(CODECS))
+    try:
+        return CODECS[name]()
+    except KeyError:
+        raise ValueError(f"JSON codec {name!r} is not available. Available: {', '.join(CODECS)}") from None
+
+
+_default_codec = None
+
+
+def get_default_codec():
+    """Codec used by make_request and the test server by default"""
+    global _default_codec
+    if _default_codec is None:
+        _default_codec = get_codec()
+        logger.info(f"Using {_default_codec.name} JSON codec")
+    return _default_codec
+
+
+def set_default_codec(codec):
+    """Sets the default codec: a name from CODECS or an object with loads/dumps"""
+    global _default_codec
+    _default_codec = get_codec(codec) if isinstance(codec, str) or codec is None else codec
@@ -0,0 +1,164 @@
+import time
+import logging
+from collections import OrderedDict
+from threading import Lock
+
+logger = logging.getLogger(__name__)
+
+FRESH = "fresh"
+STALE = "stale" # expired, but inside the stale-while-revalidate window
+EXPIRED = "expired"
+
+
+class CacheEntry:
+    __slots__ = ("value", "etag", "stored_at", "max_age", "stale_while_revalidate", "revalidating")
+
+    def __init__(self, value, etag, stored_at, max_age, stale_while_revalidate):
+        self.value = value
+        self.etag = etag
+        self.stored_at = stored_at
+        self.max_age = max_age
+        self.stale_while_revalidate = stale_while_revalidate
+        self.revalidating = False
+
+
+def parse_cache_control(header):
+    """Parses a Cache-Control header into a dict: {'max-age': '60', 'no-store': None, ...}"""
+    directives = {}
+    for part in (header or "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+def _seconds(value, default):
+    """Number of seconds from a Cache-Control directive; a missing or malformed value gives default"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+class ResponseCache:
+    """
+    In-process response cache for make_request: TTL, size-bounded LRU,
+    Cache-Control / ETag support and stale-while-revalidate
+    """
+    def __init__(self, max_entries=1024, ttl=60.0, stale_while_revalidate=0.0):
+        self.max_entries = max_entries
+        self.ttl = ttl #default freshness if the response has no max-age
+        self.stale_while_revalidate = stale_while_revalidate
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.revalidated = 0 #304 Not Modified responses
+
+    @staticmethod
+    def make_key(url, params=None):
+        if not params:
+            return url, ()
+        if isinstance(params, (str, bytes)):
+            return url, params
+        items = params.items() if hasattr(params, "items") else params
+        # multi-valued params ({"ids": [1, 2]}) become tuples so the key stays hashable
+        return url, tuple(sorted(
+            (name, tuple(value) if isinstance(value, (list, tuple)) else value) for name, value in items
+        ))
+
+    def lookup(self, key, now=None):
+        """Returns (entry, freshness) or (None, None) on a miss"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, None
+            self._entries.move_to_end(key)
+
+            age = now - entry.stored_at
+            if age < entry.max_age:
+                self.hits += 1
+                return entry, FRESH
+            if age < entry.max_age + entry.stale_while_revalidate:
+                self.stale_hits += 1
+                return entry, STALE
+            self.misses += 1
+            return entry, EXPIRED
+
+    def _freshness(self, headers):
+        directives = parse_cache_control((headers or {}).get("Cache-Control"))
+        if "no-store" in directives:
+            return None
+        if "no-cache" in directives:
+            # every use must be revalidated first, so it is never served stale either
+            return 0.0, 0.0
+        max_age = _seconds(directives.get("max-age"), self.ttl)
+        swr = _seconds(directives.get("stale-while-revalidate"), self.stale_while_revalidate)
+        return max_age, swr
+
+    def store(self, key, value, headers=None, now=None):
+        """Stores a response value unless Cache-Control forbids it"""
+        freshness = self._freshness(headers)
+        if freshness is None:
+            return
+        max_age, swr = freshness
+        etag = (headers or {}).get("ETag")
+        now = time.monotonic() if now is None else now
+
+        with self._lock:
+            self._entries[key] = CacheEntry(value, etag, now, max_age, swr)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def refresh(self, key, headers=None, now=None):
+        """Marks a cached entry as fresh again after a 304 Not Modified response"""
+        freshness = self._freshness(headers)
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self.revalidated += 1
+            entry.stored_at = now
+            if freshness is not None:
+                entry.max_age, entry.stale_while_revalidate = freshness
+            return entry.value
+
+    def begin_revalidation(self, entry):
+        """Only one background revalidation per entry at a time"""
+        with self._lock:
+            if entry.revalidating:
+                return False
+            entry.revalidating = True
+            return True
+
+    def end_revalidation(self, entry):
+        with self._lock:
+            entry.revalidating = False
+
+    def get_stale(self, url, params=None):
+        """Last cached value regardless of age (e.g. as a fallback while the upstream is down)"""
+        with self._lock:
+            entry = self._entries.get(self.make_key(url, params))
+        return None if entry is None else entry.value
+
+    def invalidate(self, url, params=None):
+        with self._lock:
+            self._entries.pop(self.make_key(url, params), None)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "revalidated": self.revalidated,
+            }
+
+    def __len__(self):
+        return len(self._entries)